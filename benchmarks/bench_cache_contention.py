@@ -0,0 +1,79 @@
+"""
+Benchmark cache lookup throughput under thread contention: one
+InMemoryCache behind a global lock versus ShardedCache.
+
+On a standard (GIL) CPython build pure-Python lookups cannot run in
+parallel, so throughput stays roughly flat as threads are added; what
+sharding removes is lock convoying between threads. On a free-threaded
+build (3.13t+) lookups on different shards proceed in parallel.
+
+Run from the repository root:
+
+    python benchmarks/bench_cache_contention.py
+"""
+
+import random
+import sys
+import threading
+import time
+
+from parsec.cache import InMemoryCache, ShardedCache
+
+
+class LockedCache:
+    """InMemoryCache guarded by one lock - the naive thread-safe baseline."""
+
+    def __init__(self, **kwargs):
+        self.cache = InMemoryCache(**kwargs)
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            return self.cache.get(key)
+
+    def set(self, key, value):
+        with self.lock:
+            self.cache.set(key, value)
+
+
+def run(cache, n_threads: int, ops_per_thread: int, keys) -> float:
+    """Return total lookups per second across all threads."""
+    barrier = threading.Barrier(n_threads + 1)
+
+    def worker(seed):
+        rng = random.Random(seed)
+        sample = rng.choices(keys, k=ops_per_thread)
+        barrier.wait()
+        for key in sample:
+            cache.get(key)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return n_threads * ops_per_thread / (time.perf_counter() - start)
+
+
+def main():
+    keys = [f"key-{i}" for i in range(10_000)]
+    caches = {
+        "locked": LockedCache(max_size=20_000),
+        "sharded(16)": ShardedCache(shards=16, max_size=20_000),
+    }
+    for cache in caches.values():
+        for key in keys:
+            cache.set(key, key)
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    print(f"{'threads':>7} " + " ".join(f"{name:>16}" for name in caches))
+    for n_threads in (1, 2, 4, 8):
+        rates = [run(cache, n_threads, 50_000, keys) for cache in caches.values()]
+        print(f"{n_threads:>7} " + " ".join(f"{rate / 1e6:>13.2f} M/s" for rate in rates))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark InMemoryCache hit rates for the LRU and W-TinyLFU eviction
+policies on a skewed (Zipf) interactive workload interleaved with one-off
+batch scans, as produced by backfill jobs.
+
+Run from the repository root:
+
+    python benchmarks/bench_cache_policy.py
+"""
+
+import random
+import time
+
+from parsec.cache import InMemoryCache
+
+
+def zipf_keys(n_keys: int, s: float, rng: random.Random):
+    """Endless stream of keys with Zipf(s)-distributed popularity."""
+    weights = [1 / (rank ** s) for rank in range(1, n_keys + 1)]
+    population = [f"hot-{rank}" for rank in range(n_keys)]
+    while True:
+        yield from rng.choices(population, weights, k=1000)
+
+
+def workload(n_requests: int, scan_every: int, scan_length: int, seed: int = 7):
+    """Interactive Zipf traffic with a scan of unique keys every `scan_every` requests."""
+    rng = random.Random(seed)
+    hot = zipf_keys(n_keys=20_000, s=0.9, rng=rng)
+    scan_id = 0
+    for i in range(n_requests):
+        if i and i % scan_every == 0:
+            for j in range(scan_length):
+                yield f"scan-{scan_id}-{j}", False
+            scan_id += 1
+        yield next(hot), True
+
+
+def replay(cache: InMemoryCache, requests) -> dict:
+    hits = lookups = hot_hits = hot_lookups = 0
+    start = time.perf_counter()
+    for key, is_hot in requests:
+        lookups += 1
+        hot_lookups += is_hot
+        if cache.get(key) is not None:
+            hits += 1
+            hot_hits += is_hot
+        else:
+            cache.set(key, key)
+    elapsed = time.perf_counter() - start
+    return {
+        "hit_rate": hits / lookups,
+        "hot_hit_rate": hot_hits / hot_lookups,
+        "us_per_op": elapsed / lookups * 1e6,
+    }
+
+
+def main():
+    requests = list(workload(n_requests=200_000, scan_every=20_000, scan_length=5_000))
+    print(f"{len(requests):,} requests, cache size 2,000")
+    print(f"{'policy':<10} {'hit rate':>10} {'hot hit rate':>14} {'us/op':>8}")
+    for policy in ("lru", "tinylfu"):
+        stats = replay(InMemoryCache(max_size=2000, policy=policy), requests)
+        print(
+            f"{policy:<10} {stats['hit_rate']:>10.2%} {stats['hot_hit_rate']:>14.2%} "
+            f"{stats['us_per_op']:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
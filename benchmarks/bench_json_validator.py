@@ -0,0 +1,105 @@
+"""
+Benchmark JSONValidator per-call validation cost: no caching, the
+compiled-schema cache, and the generated-code fast path on top of it.
+
+Run from the repository root:
+
+    python benchmarks/bench_json_validator.py
+"""
+
+import json
+import timeit
+
+from parsec.validators import JSONValidator
+
+
+SCHEMAS = {
+    "flat": (
+        {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "age": {"type": "integer", "minimum": 0},
+                "email": {"type": "string", "pattern": "^[^@]+@[^@]+$"},
+                "active": {"type": "boolean"}
+            },
+            "required": ["name", "age"]
+        },
+        {"name": "Ada", "age": 36, "email": "ada@example.com", "active": True}
+    ),
+    "nested": (
+        {
+            "type": "object",
+            "properties": {
+                "user": {
+                    "type": "object",
+                    "properties": {
+                        "id": {"type": "string"},
+                        "tags": {"type": "array", "items": {"type": "string"}}
+                    },
+                    "required": ["id"]
+                },
+                "items": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "title": {"type": "string"},
+                            "score": {"type": "number", "minimum": 0, "maximum": 1}
+                        },
+                        "required": ["title", "score"]
+                    }
+                }
+            },
+            "required": ["user", "items"]
+        },
+        {
+            "user": {"id": "u1", "tags": ["a", "b", "c"]},
+            "items": [{"title": f"item {i}", "score": i / 10} for i in range(10)]
+        }
+    ),
+    "refs": (
+        {
+            "definitions": {
+                "point": {
+                    "type": "object",
+                    "properties": {"x": {"type": "number"}, "y": {"type": "number"}},
+                    "required": ["x", "y"]
+                }
+            },
+            "type": "object",
+            "properties": {
+                "path": {"type": "array", "items": {"$ref": "#/definitions/point"}}
+            }
+        },
+        {"path": [{"x": i, "y": -i} for i in range(5)]}
+    ),
+}
+
+
+def bench(validator: JSONValidator, schema, output: str, number: int) -> float:
+    """Return the mean cost of one validate() call in microseconds."""
+    validator.validate(output, schema)  # warm up
+    return timeit.timeit(lambda: validator.validate(output, schema), number=number) / number * 1e6
+
+
+def main(number: int = 5000) -> None:
+    print(
+        f"{'schema':<10} {'check_schema':<13} {'uncached (us)':>14} {'cached (us)':>12} "
+        f"{'fast path (us)':>15} {'speedup':>8}"
+    )
+    for name, (schema, instance) in SCHEMAS.items():
+        output = json.dumps(instance)
+        for check in (False, True):
+            n = number if not check else max(number // 20, 50)
+            before = bench(JSONValidator(cache_size=0, check_schema=check, fast_path=False), schema, output, n)
+            cached = bench(JSONValidator(check_schema=check, fast_path=False), schema, output, number)
+            fast = bench(JSONValidator(check_schema=check), schema, output, number)
+            print(
+                f"{name:<10} {str(check):<13} {before:>14.1f} {cached:>12.1f} "
+                f"{fast:>15.1f} {before / fast:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark partial-JSON parsing over a streamed response: re-parsing the
+accumulated text on every token (PartialJSONParser.parse) versus feeding
+each delta to IncrementalJSONParser.
+
+Run from the repository root:
+
+    python benchmarks/bench_partial_json.py
+"""
+
+import json
+import time
+
+from parsec.utils.partial_json import PartialJSONParser, IncrementalJSONParser
+
+
+def make_response(n_items: int) -> str:
+    return json.dumps({
+        "title": "Quarterly report",
+        "items": [
+            {"id": i, "title": f"Item number {i}", "summary": "lorem ipsum dolor sit amet " * 3, "score": i / 7}
+            for i in range(n_items)
+        ]
+    })
+
+
+def tokens(text: str, size: int = 4):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def bench_reparse(deltas) -> float:
+    start = time.perf_counter()
+    accumulated = ""
+    for delta in deltas:
+        accumulated += delta
+        PartialJSONParser.parse(accumulated)
+    return time.perf_counter() - start
+
+
+def bench_incremental(deltas) -> float:
+    start = time.perf_counter()
+    parser = IncrementalJSONParser()
+    for delta in deltas:
+        parser.feed(delta)
+        parser.value
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    print(f"{'response':>10} {'tokens':>7} {'reparse (ms)':>13} {'incremental (ms)':>17} {'us/token':>9}")
+    for n_items in (10, 50, 150):
+        text = make_response(n_items)
+        deltas = tokens(text)
+        before = bench_reparse(deltas)
+        after = bench_incremental(deltas)
+        print(
+            f"{len(text) / 1024:>8.1f}KB {len(deltas):>7} {before * 1000:>13.1f} "
+            f"{after * 1000:>17.1f} {after / len(deltas) * 1e6:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
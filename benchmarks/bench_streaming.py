@@ -0,0 +1,64 @@
+"""
+Benchmark StreamingEngine per-stream throughput (tokens/sec) for the
+pydantic `stream()` path versus `stream_light()` with and without
+accumulated-text tracking.
+
+Run from the repository root:
+
+    python benchmarks/bench_streaming.py
+"""
+
+import asyncio
+import time
+
+from parsec.core import BaseLLMAdapter, ModelProviders
+from parsec.enforcement.streaming_engine import StreamingEngine
+
+
+class TokenAdapter(BaseLLMAdapter):
+    """Adapter that streams a fixed number of 4-character tokens with no I/O."""
+
+    def __init__(self, n_tokens: int):
+        super().__init__(api_key="bench", model="bench-model")
+        self.n_tokens = n_tokens
+
+    @property
+    def provider(self) -> ModelProviders:
+        return ModelProviders.OPENAI
+
+    def supports_native_structure_output(self) -> bool:
+        return True
+
+    def supports_streaming(self) -> bool:
+        return True
+
+    async def generate(self, prompt, schema=None, temperature=0.7, max_tokens=None, **kwargs):
+        raise NotImplementedError
+
+    async def generate_stream(self, prompt, schema=None, temperature=0.7, max_tokens=None, **kwargs):
+        for _ in range(self.n_tokens):
+            yield "tok "
+
+
+async def consume(stream) -> float:
+    start = time.perf_counter()
+    async for _ in stream:
+        pass
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    print(f"{'tokens':>7} {'stream() tok/s':>15} {'stream_light tok/s':>19} {'delta_only tok/s':>17}")
+    for n_tokens in (1_000, 5_000, 20_000):
+        engine = StreamingEngine(TokenAdapter(n_tokens))
+        full = await consume(engine.stream("prompt"))
+        light = await consume(engine.stream_light("prompt"))
+        delta = await consume(engine.stream_light("prompt", delta_only=True))
+        print(
+            f"{n_tokens:>7} {n_tokens / full:>15,.0f} {n_tokens / light:>19,.0f} "
+            f"{n_tokens / delta:>17,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
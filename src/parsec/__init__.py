@@ -16,7 +16,7 @@ at package level to avoid requiring all optional dependencies. Import them direc
 
 from parsec.core import BaseLLMAdapter
 from parsec.validators.base_validator import BaseValidator
-from parsec.enforcement.engine import EnforcementEngine, EnforcedOutput
+from parsec.enforcement.engine import EnforcementEngine, EnforcedOutput, Freshness
 from parsec.validators import JSONValidator, PydanticValidator
 from parsec.cache import InMemoryCache
 from parsec.prompts import PromptTemplate, TemplateRegistry, TemplateManager
@@ -30,6 +30,7 @@ __all__ = [
     "BaseValidator",
     "EnforcementEngine",
     "EnforcedOutput",
+    "Freshness",
 
     # Validators
     "JSONValidator",
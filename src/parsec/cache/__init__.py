@@ -1,11 +1,21 @@
 """Caching implementations for LLM responses."""
 
-from .base import BaseCache
+from .base import AsyncBaseCache, BaseCache
+from .async_adapter import AsyncCacheAdapter
 from .memory import InMemoryCache
-from .keys import generate_cache_key
+from .sharded import ShardedCache
+from .sqlite import SQLiteCache
+from .tiered import TieredCache
+from .keys import generate_cache_key, schema_fingerprint
 
 __all__ = [
+    "AsyncBaseCache",
+    "AsyncCacheAdapter",
     "BaseCache",
     "InMemoryCache",
+    "ShardedCache",
+    "SQLiteCache",
+    "TieredCache",
     "generate_cache_key",
+    "schema_fingerprint",
 ]
@@ -0,0 +1,71 @@
+"""Awaitable wrapper around synchronous caches."""
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, TypeVar
+import asyncio
+import threading
+
+from .base import AsyncBaseCache, BaseCache
+
+T = TypeVar("T")
+
+
+class AsyncCacheAdapter(AsyncBaseCache):
+    """
+    Expose a synchronous `BaseCache` through the `AsyncBaseCache` interface.
+
+    For in-memory caches the calls are cheap and run inline (`offload=False`).
+    For caches that do blocking I/O, `offload=True` runs every call in a worker
+    thread so the event loop keeps serving other generations; calls are
+    serialised with a lock, so the wrapped cache needn't be thread-safe.
+
+    Example:
+        >>> cache = AsyncCacheAdapter(InMemoryCache())
+        >>> await cache.aset("key1", {"data": "value"})
+        >>> await cache.aget("key1")
+        {'data': 'value'}
+    """
+
+    def __init__(self, cache: BaseCache, offload: bool = False):
+        """
+        Initialize the adapter.
+
+        Args:
+            cache: Synchronous cache to wrap
+            offload: Run cache calls in a worker thread (default: False)
+        """
+        self.cache = cache
+        self.offload = offload
+        self._lock = threading.Lock()
+
+    async def _call(self, fn: Callable[..., T], *args: Any) -> T:
+        if not self.offload:
+            return fn(*args)
+
+        def locked() -> T:
+            with self._lock:
+                return fn(*args)
+
+        return await asyncio.get_running_loop().run_in_executor(None, locked)
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """Retrieve a cached response by key."""
+        return await self._call(self.cache.get, key)
+
+    async def aset(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store a response in the cache."""
+        await self._call(self.cache.set, key, value, ttl)
+
+    async def adelete(self, key: str) -> None:
+        """Delete a cached response by key."""
+        await self._call(self.cache.delete, key)
+
+    async def aget_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Retrieve several responses in a single (possibly offloaded) call."""
+        return await self._call(self.cache.get_many, list(keys))
+
+    async def aset_many(self, items: Mapping[str, Any], ttl: Optional[int] = None) -> None:
+        """Store several responses in a single (possibly offloaded) call."""
+        await self._call(self.cache.set_many, dict(items), ttl)
+
+    def get_stats(self) -> dict:
+        """Get statistics of the wrapped cache."""
+        return self.cache.get_stats()
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Any
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
 
 class BaseCache(ABC):
     """Abstract base class for caching LLM responses."""
@@ -32,4 +32,75 @@ class BaseCache(ABC):
     @abstractmethod
     def get_stats(self) -> dict:
         """Get cache statistics."""
-        pass
\ No newline at end of file
+        pass
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Retrieve several responses; missing keys are left out of the result."""
+        found = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    @property
+    def default_ttl(self) -> Optional[float]:
+        """TTL in seconds applied when `set` gets none (None: no expiry, or unknown)."""
+        return None
+
+    def get_many_with_ttl(self, keys: Iterable[str]) -> Dict[str, Tuple[Any, Optional[float]]]:
+        """
+        Retrieve several responses with their remaining time-to-live in seconds.
+
+        The TTL is None for entries that never expire, and always None in this
+        default implementation, which can't tell.
+        """
+        return {key: (value, None) for key, value in self.get_many(keys).items()}
+
+    def set_many(self, items: Mapping[str, Any], ttl: Optional[int] = None) -> None:
+        """Store several responses with the same TTL."""
+        for key, value in items.items():
+            self.set(key, value, ttl)
+
+
+class AsyncBaseCache(ABC):
+    """
+    Abstract base class for caches with awaitable operations.
+
+    `EnforcementEngine` awaits these methods instead of calling the blocking
+    `BaseCache` API, so network- or disk-backed caches don't stall the event loop.
+    """
+
+    @abstractmethod
+    async def aget(self, key: str) -> Optional[Any]:
+        """Retrieve a cached response by key."""
+        pass
+
+    @abstractmethod
+    async def aset(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store a response in the cache."""
+        pass
+
+    @abstractmethod
+    async def adelete(self, key: str) -> None:
+        """Delete a cached response by key."""
+        pass
+
+    @abstractmethod
+    def get_stats(self) -> dict:
+        """Get cache statistics."""
+        pass
+
+    async def aget_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Retrieve several responses; missing keys are left out of the result."""
+        found = {}
+        for key in keys:
+            value = await self.aget(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    async def aset_many(self, items: Mapping[str, Any], ttl: Optional[int] = None) -> None:
+        """Store several responses with the same TTL."""
+        for key, value in items.items():
+            await self.aset(key, value, ttl)
@@ -1,7 +1,78 @@
 """Cache key generation utilities."""
-from typing import Any, Optional
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
 import hashlib
 import json
+import threading
+import weakref
+
+from pydantic import BaseModel
+
+
+_HASHES: Dict[str, Callable[[bytes], str]] = {
+    "sha256": lambda data: hashlib.sha256(data).hexdigest(),
+    "blake2b": lambda data: hashlib.blake2b(data, digest_size=32).hexdigest(),
+}
+
+# Fingerprints of dict schemas by object identity. Entries hold a reference
+# to the schema so its id can't be reused while memoized.
+_DICT_FINGERPRINTS: "OrderedDict[int, Tuple[Dict[str, Any], str]]" = OrderedDict()
+_DICT_FINGERPRINTS_SIZE = 1024
+_MODEL_FINGERPRINTS: "weakref.WeakKeyDictionary[type, str]" = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def _content_hash(schema: Any) -> str:
+    canonical = json.dumps(schema, sort_keys=True, default=repr)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def schema_fingerprint(schema: Any) -> str:
+    """
+    Get a stable content hash of a schema, computed once per schema object.
+
+    Dict schemas are hashed from their canonical JSON; pydantic model classes
+    from their qualified name and `model_json_schema()`. Results are memoized
+    by object identity, so schemas must not be mutated after first use.
+
+    Args:
+        schema: JSON schema dict, pydantic model class, or any JSON-serializable value
+
+    Returns:
+        str: 64-character hexadecimal SHA256 hash, or "" for an empty/missing schema
+
+    Example:
+        >>> schema_fingerprint({"type": "object"}) == schema_fingerprint({"type": "object"})
+        True
+    """
+    if not schema:
+        return ""
+
+    if isinstance(schema, type) and issubclass(schema, BaseModel):
+        fingerprint = _MODEL_FINGERPRINTS.get(schema)
+        if fingerprint is None:
+            fingerprint = _content_hash({
+                "model": f"{schema.__module__}.{schema.__qualname__}",
+                "schema": schema.model_json_schema()
+            })
+            _MODEL_FINGERPRINTS[schema] = fingerprint
+        return fingerprint
+
+    if not isinstance(schema, dict):
+        return _content_hash(schema)
+
+    with _lock:
+        entry = _DICT_FINGERPRINTS.get(id(schema))
+        if entry is not None and entry[0] is schema:
+            _DICT_FINGERPRINTS.move_to_end(id(schema))
+            return entry[1]
+
+    fingerprint = _content_hash(schema)
+    with _lock:
+        _DICT_FINGERPRINTS[id(schema)] = (schema, fingerprint)
+        if len(_DICT_FINGERPRINTS) > _DICT_FINGERPRINTS_SIZE:
+            _DICT_FINGERPRINTS.popitem(last=False)
+    return fingerprint
 
 
 def generate_cache_key(
@@ -9,10 +80,11 @@ def generate_cache_key(
     model: str,
     schema: Optional[Any] = None,
     temperature: float = 0.7,
+    algorithm: str = "sha256",
     **kwargs
 ) -> str:
     """
-    Generate a deterministic SHA256 cache key from generation parameters.
+    Generate a deterministic cache key from generation parameters.
 
     This function creates a unique cache key by hashing all parameters that affect
     LLM output. The key is deterministic - identical inputs always produce the same key.
@@ -20,12 +92,16 @@ def generate_cache_key(
     Args:
         prompt: The input prompt text (will be normalized by stripping whitespace)
         model: Model identifier (e.g., "gpt-4", "claude-3-opus")
-        schema: Optional JSON schema or dict defining expected output structure
+        schema: Optional JSON schema dict or pydantic model class defining expected output structure
         temperature: Model temperature parameter (default: 0.7)
+        algorithm: "sha256" (default) or "blake2b"
         **kwargs: Additional model parameters (e.g., max_tokens, top_p) that affect output
 
     Returns:
-        str: 64-character hexadecimal SHA256 hash string
+        str: 64-character hexadecimal hash string
+
+    Raises:
+        ValueError: If algorithm is not supported
 
     Example:
         >>> key = generate_cache_key(
@@ -40,16 +116,21 @@ def generate_cache_key(
 
     Note:
         - The prompt is normalized (stripped) before hashing
-        - Schema is JSON-serialized with sorted keys for consistency
-        - All components are sorted to ensure deterministic ordering
+        - The schema contributes its memoized `schema_fingerprint`, so large
+          schemas are only serialized the first time they are seen
+        - Extra parameters are serialized with sorted keys for consistency
     """
-    normalized_prompt = prompt.strip()
-    key_components = {
-        "prompt": normalized_prompt,
-        "model": model,
-        "schema": json.dumps(schema, sort_keys=True) if schema else "",
-        "temperature": temperature,
-        **kwargs
-    }
-    key_string = json.dumps(key_components, sort_keys=True)
-    return hashlib.sha256(key_string.encode()).hexdigest()
\ No newline at end of file
+    hash_fn = _HASHES.get(algorithm)
+    if hash_fn is None:
+        raise ValueError(f"Unsupported hash algorithm: {algorithm!r}")
+
+    extra = json.dumps(kwargs, sort_keys=True, default=repr) if kwargs else ""
+    # JSON-encoding the list keeps field boundaries unambiguous
+    key_string = json.dumps([
+        prompt.strip(),
+        model,
+        schema_fingerprint(schema),
+        temperature,
+        extra
+    ])
+    return hash_fn(key_string.encode())
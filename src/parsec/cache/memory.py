@@ -1,21 +1,78 @@
 """In-memory LRU cache implementation."""
-from typing import Any, Optional
-from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 from .base import BaseCache
+from .policies import EvictionPolicy, LRUPolicy, TinyLFUPolicy
+import heapq
+import sys
 import time
 
+# Expired entries reclaimed per get/set by the incremental sweep
+_SWEEP_BATCH = 4
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Estimate the memory held by a value, in bytes.
+
+    Walks containers, pydantic models and other objects with a `__dict__`,
+    summing `sys.getsizeof` of everything reachable. Shared objects are
+    counted once.
+
+    Args:
+        value: Object to measure
+
+    Returns:
+        int: Approximate deep size in bytes
+    """
+    seen = set()
+    stack = [value]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+
+        if isinstance(obj, (str, bytes, bytearray, int, float, bool, type(None))):
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif hasattr(obj, "__dict__") and not isinstance(obj, type):
+            stack.append(obj.__dict__)
+    return total
+
 
 class InMemoryCache(BaseCache):
     """
     In-memory LRU (Least Recently Used) cache with TTL support.
 
-    This cache implementation uses an OrderedDict to maintain insertion/access order
-    and automatically evicts the least recently used items when the cache is full.
-    Each cached item has an optional TTL (time-to-live) after which it expires.
+    This cache implementation automatically evicts the least recently used items
+    when the cache is full. Each cached item has an optional TTL (time-to-live)
+    after which it expires.
+
+    Expiry times are kept in a min-heap. Each get/set reclaims a few expired
+    entries from the top of the heap, and when the cache is over budget all
+    expired entries are reclaimed before any live entry is evicted.
+
+    With `policy="tinylfu"` eviction uses W-TinyLFU instead of plain LRU: new
+    entries must prove they are requested more often than the entry they would
+    displace, so one-off scans (e.g. batch backfills) don't flush hot entries.
+
+    With `max_bytes` set, entries are also evicted until the estimated size of
+    all cached values fits the budget, so the cache can be sized against a
+    memory limit even when entry sizes vary widely.
 
     Attributes:
         _max_size: Maximum number of items the cache can hold
-        _cache: OrderedDict storing cached entries with metadata
+        _max_bytes: Optional budget for the estimated size of all entries
+        _bytes: Current estimated size of all entries
+        _cache: Dict storing cached entries with metadata
+        _expiry_heap: Min-heap of (expires_at, key); stale items are skipped
+        _policy: EvictionPolicy choosing which entry to evict
         _hits: Counter for cache hits (successful retrievals)
         _misses: Counter for cache misses (failed retrievals)
         _default_ttl: Default time-to-live in seconds for cache entries
@@ -26,23 +83,55 @@ class InMemoryCache(BaseCache):
         >>> cache.get("key1")
         {'data': 'value'}
         >>> cache.get_stats()
-        {'size': 1, 'hits': 1, 'misses': 0, 'hit_rate': '100.00%'}
+        {'size': 1, 'hits': 1, 'misses': 0, 'hit_rate': '100.00%', 'bytes': 0, 'evictions': 0, 'expirations': 0}
     """
 
-    def __init__(self, max_size: int = 1000, default_ttl: int = 3600):
+    def __init__(
+        self,
+        max_size: int = 1000,
+        default_ttl: int = 3600,
+        max_bytes: Optional[int] = None,
+        sizeof: Callable[[Any], int] = estimate_size,
+        policy: Union[str, EvictionPolicy] = "lru"
+    ):
         """
         Initialize the in-memory cache.
 
         Args:
             max_size: Maximum number of entries to store (default: 1000)
             default_ttl: Default time-to-live in seconds (default: 3600 = 1 hour)
+            max_bytes: Optional byte budget for all entries (default: None, count limit only)
+            sizeof: Function estimating an entry's size in bytes (default: estimate_size);
+                only called when `max_bytes` is set
+            policy: "lru", "tinylfu" or an EvictionPolicy instance (default: "lru")
+
+        Raises:
+            ValueError: If policy is an unknown name
         """
+        if policy == "lru":
+            policy = LRUPolicy()
+        elif policy == "tinylfu":
+            policy = TinyLFUPolicy(max_size)
+        elif not isinstance(policy, EvictionPolicy):
+            raise ValueError(f"Unknown eviction policy: {policy!r}")
         self._max_size = max_size
-        self._cache = OrderedDict()
+        self._max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._policy = policy
+        self._cache: Dict[str, dict] = {}
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._bytes = 0
         self._hits = 0
         self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
         self._default_ttl = default_ttl
 
+    @property
+    def default_ttl(self) -> Optional[float]:
+        """TTL in seconds applied when `set` gets none."""
+        return self._default_ttl
+
     def get(self, key: str) -> Optional[Any]:
         """
         Retrieve a value from the cache.
@@ -61,23 +150,45 @@ class InMemoryCache(BaseCache):
             - Moves accessed key to end (most recently used)
             - Deletes expired entries
         """
+        now = time.time()
+        self._sweep(now, _SWEEP_BATCH)
         if key in self._cache:
             entry = self._cache[key]
-            if entry["timestamp"] + entry["ttl"] < time.time():
-                self.delete(key)
+            if entry["expires_at"] < now:
+                self._expire(key)
                 self._misses += 1
                 return None
             self._hits += 1
-            self._cache.move_to_end(key)  # Mark as recently used
+            self._policy.on_access(key)  # Mark as recently used
             return entry["value"]
         self._misses += 1
         return None
 
+    def get_many_with_ttl(self, keys: Iterable[str]) -> Dict[str, Tuple[Any, Optional[float]]]:
+        """
+        Retrieve several values with their remaining time-to-live.
+
+        Args:
+            keys: Cache keys to retrieve
+
+        Returns:
+            Dict[str, Tuple[Any, Optional[float]]]: (value, seconds left) for
+            keys that were found and not expired
+        """
+        found: Dict[str, Tuple[Any, Optional[float]]] = {}
+        for key in dict.fromkeys(keys):
+            value = self.get(key)
+            if value is not None:
+                found[key] = (value, self._cache[key]["expires_at"] - time.time())
+        return found
+
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """
         Store a value in the cache.
 
-        If cache is full, evicts the least recently used item before insertion.
+        If cache is full, reclaims expired entries first, then evicts entries
+        chosen by the eviction policy (least recently used by default) until
+        the new entry fits.
 
         Args:
             key: Cache key
@@ -85,20 +196,85 @@ class InMemoryCache(BaseCache):
             ttl: Optional time-to-live in seconds (uses default_ttl if None)
 
         Side effects:
-            - May evict LRU item if cache is at max_size
+            - May evict items if cache is at max_size or over max_bytes
             - Updates existing entries if key already exists
+            - Values larger than max_bytes on their own are not stored
         """
-        if len(self._cache) >= self._max_size:
-            self._cache.popitem(last=False)  # Remove least recently used item
-
         if ttl is None:
             ttl = self._default_ttl
 
+        # Sizing walks the whole value, so only pay for it under a byte budget
+        size = 0
+        if self._max_bytes is not None:
+            size = self._sizeof(key) + self._sizeof(value)
+            if size > self._max_bytes:
+                self.delete(key)
+                return
+
+        now = time.time()
+        self._sweep(now, _SWEEP_BATCH)
+        previous = self._cache.get(key)
         self._cache[key] = {
             "value": value,
-            "timestamp": time.time(),
-            "ttl": ttl
+            "timestamp": now,
+            "ttl": ttl,
+            "expires_at": now + ttl,
+            "size": size
         }
+        heapq.heappush(self._expiry_heap, (now + ttl, key))
+        self._bytes += size
+        if previous is not None:
+            self._bytes -= previous["size"]
+            self._policy.on_access(key)
+        else:
+            self._policy.on_insert(key)
+
+        if self._over_budget():
+            self._sweep(now)
+            while self._over_budget():
+                self._evict()
+
+        # Overwrites leave stale heap items behind; rebuild before they pile up
+        if len(self._expiry_heap) > 2 * len(self._cache) + 64:
+            self._expiry_heap = [(entry["expires_at"], k) for k, entry in self._cache.items()]
+            heapq.heapify(self._expiry_heap)
+
+    def _over_budget(self) -> bool:
+        return len(self._cache) > self._max_size or (
+            self._max_bytes is not None and self._bytes > self._max_bytes
+        )
+
+    def _sweep(self, now: float, limit: Optional[int] = None) -> int:
+        """Reclaim up to `limit` expired entries (all if None) from the heap top."""
+        heap = self._expiry_heap
+        removed = 0
+        while heap and heap[0][0] < now and (limit is None or removed < limit):
+            expires_at, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # Skip items left behind by overwrites and deletes
+            if entry is not None and entry["expires_at"] == expires_at:
+                self._expire(key)
+                removed += 1
+        return removed
+
+    def _expire(self, key: str) -> None:
+        self.delete(key)
+        self._expirations += 1
+
+    def purge_expired(self) -> int:
+        """
+        Remove every expired entry now.
+
+        Returns:
+            int: Number of entries removed
+        """
+        return self._sweep(time.time())
+
+    def _evict(self) -> None:
+        """Remove the entry chosen by the eviction policy."""
+        entry = self._cache.pop(self._policy.evict())
+        self._bytes -= entry["size"]
+        self._evictions += 1
 
     def delete(self, key: str) -> None:
         """
@@ -110,8 +286,10 @@ class InMemoryCache(BaseCache):
         Note:
             No-op if key doesn't exist (won't raise KeyError)
         """
-        if key in self._cache:
-            del self._cache[key]
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry["size"]
+            self._policy.on_remove(key)
 
     def clear(self) -> None:
         """
@@ -121,21 +299,25 @@ class InMemoryCache(BaseCache):
             Does not reset hit/miss counters
         """
         self._cache.clear()
+        self._expiry_heap.clear()
+        self._policy.clear()
+        self._bytes = 0
 
     def exists(self, key: str) -> bool:
         """
-        Check if a key exists in the cache.
+        Check if an unexpired key exists in the cache.
 
         Args:
             key: Cache key to check
 
         Returns:
-            bool: True if key exists, False otherwise
+            bool: True if key exists and has not expired, False otherwise
 
         Note:
-            Does not check TTL expiration or update LRU ordering
+            Does not update LRU ordering or hit/miss counters
         """
-        return key in self._cache
+        entry = self._cache.get(key)
+        return entry is not None and entry["expires_at"] >= time.time()
 
     def get_stats(self) -> dict:
         """
@@ -147,10 +329,13 @@ class InMemoryCache(BaseCache):
                 - hits: Total number of successful retrievals
                 - misses: Total number of failed retrievals
                 - hit_rate: Percentage of requests that were hits (formatted string)
+                - bytes: Estimated size of all entries (0 unless max_bytes is set)
+                - evictions: Live entries removed to stay within max_size/max_bytes
+                - expirations: Entries removed because their TTL passed
 
         Example:
             >>> cache.get_stats()
-            {'size': 42, 'hits': 100, 'misses': 10, 'hit_rate': '90.91%'}
+            {'size': 42, 'hits': 100, 'misses': 10, 'hit_rate': '90.91%', 'bytes': 183204, 'evictions': 3, 'expirations': 7}
         """
         total = self._hits + self._misses
         hit_rate = (self._hits / total) * 100 if total > 0 else 0.0
@@ -159,5 +344,8 @@ class InMemoryCache(BaseCache):
             "size": len(self._cache),
             "hits": self._hits,
             "misses": self._misses,
-            "hit_rate": f"{hit_rate:.2f}%"
+            "hit_rate": f"{hit_rate:.2f}%",
+            "bytes": self._bytes,
+            "evictions": self._evictions,
+            "expirations": self._expirations
         }
\ No newline at end of file
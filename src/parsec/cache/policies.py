@@ -0,0 +1,205 @@
+"""Eviction policies for InMemoryCache."""
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Hashable
+
+
+class EvictionPolicy(ABC):
+    """
+    Decides which key an in-memory cache evicts next.
+
+    The cache reports every insert, hit and removal; when it is over budget
+    it calls `evict()` and deletes the returned key.
+    """
+
+    @abstractmethod
+    def on_insert(self, key: Hashable) -> None:
+        """A new key was stored."""
+        pass
+
+    @abstractmethod
+    def on_access(self, key: Hashable) -> None:
+        """A stored key was read."""
+        pass
+
+    @abstractmethod
+    def on_remove(self, key: Hashable) -> None:
+        """A key was deleted or expired (not via `evict`)."""
+        pass
+
+    @abstractmethod
+    def evict(self) -> Hashable:
+        """Choose a victim, forget it and return it."""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Forget all keys."""
+        pass
+
+
+class LRUPolicy(EvictionPolicy):
+    """Evict the least recently used key."""
+
+    def __init__(self):
+        self._order: "OrderedDict[Hashable, None]" = OrderedDict()
+
+    def on_insert(self, key: Hashable) -> None:
+        self._order[key] = None
+
+    def on_access(self, key: Hashable) -> None:
+        self._order.move_to_end(key)
+
+    def on_remove(self, key: Hashable) -> None:
+        self._order.pop(key, None)
+
+    def evict(self) -> Hashable:
+        return self._order.popitem(last=False)[0]
+
+    def clear(self) -> None:
+        self._order.clear()
+
+
+class CountMinSketch:
+    """
+    Approximate frequency counter with 4-bit counters and periodic aging.
+
+    Every `sample_size` increments all counters are halved, so the sketch
+    tracks recent popularity rather than all-time counts.
+    """
+
+    _DEPTH = 4
+    _SEEDS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93)
+
+    def __init__(self, capacity: int):
+        """
+        Initialize the sketch.
+
+        Args:
+            capacity: Number of entries the cache holds; sizes the table and aging period
+        """
+        # About four counters per cached entry keeps collisions between
+        # one-off keys from inflating their estimates
+        width = 16
+        while width < 4 * capacity:
+            width <<= 1
+        self._mask = width - 1
+        self._rows = [bytearray(width) for _ in range(self._DEPTH)]
+        self.sample_size = 10 * max(capacity, 1)
+        self._additions = 0
+
+    def _indexes(self, key: Hashable):
+        # Multiplicative hashing of the key's hash, one seed per row
+        h = hash(key) & 0xFFFFFFFFFFFFFFFF
+        mask = self._mask
+        return [((h ^ seed) * 0xFF51AFD7ED558CCD >> 32) & mask for seed in self._SEEDS]
+
+    def increment(self, key: Hashable) -> None:
+        """Count one occurrence of `key`."""
+        for row, i in zip(self._rows, self._indexes(key)):
+            if row[i] < 15:
+                row[i] += 1
+        self._additions += 1
+        if self._additions >= self.sample_size:
+            self._age()
+
+    def estimate(self, key: Hashable) -> int:
+        """Estimated recent frequency of `key` (never an undercount before aging)."""
+        return min(row[i] for row, i in zip(self._rows, self._indexes(key)))
+
+    def _age(self) -> None:
+        for row in self._rows:
+            for i, count in enumerate(row):
+                if count:
+                    row[i] = count >> 1
+        self._additions //= 2
+
+    def clear(self) -> None:
+        for row in self._rows:
+            row[:] = bytes(len(row))
+        self._additions = 0
+
+
+class TinyLFUPolicy(EvictionPolicy):
+    """
+    W-TinyLFU: a small LRU window in front of a frequency-filtered segmented LRU.
+
+    New keys enter the window. Keys leaving the window move to the probation
+    segment of the main cache while it has room; once it is full, a key
+    leaving the window is only admitted if the sketch says it is used more
+    often than the main cache's eviction victim. Hits in probation promote a
+    key to the protected segment. One-off keys, such as those from a batch
+    scan, therefore pass through the window without flushing popular entries.
+    """
+
+    def __init__(self, capacity: int, window_ratio: float = 0.01, protected_ratio: float = 0.8):
+        """
+        Initialize the policy.
+
+        Args:
+            capacity: Number of entries the cache holds
+            window_ratio: Share of capacity given to the admission window (default: 1%)
+            protected_ratio: Share of the main cache reserved for re-used keys (default: 80%)
+        """
+        self._window_capacity = max(1, int(capacity * window_ratio))
+        main_capacity = max(1, capacity - self._window_capacity)
+        self._protected_capacity = int(main_capacity * protected_ratio)
+        self._main_capacity = main_capacity
+        self._window: "OrderedDict[Hashable, None]" = OrderedDict()
+        self._probation: "OrderedDict[Hashable, None]" = OrderedDict()
+        self._protected: "OrderedDict[Hashable, None]" = OrderedDict()
+        self.sketch = CountMinSketch(capacity)
+
+    def on_insert(self, key: Hashable) -> None:
+        self.sketch.increment(key)
+        self._window[key] = None
+        # Spill window overflow into main while main still has free space
+        if len(self._window) > self._window_capacity and self._main_size() < self._main_capacity:
+            candidate, _ = self._window.popitem(last=False)
+            self._probation[candidate] = None
+
+    def on_access(self, key: Hashable) -> None:
+        self.sketch.increment(key)
+        if key in self._window:
+            self._window.move_to_end(key)
+        elif key in self._probation:
+            del self._probation[key]
+            self._protected[key] = None
+            if len(self._protected) > self._protected_capacity:
+                demoted, _ = self._protected.popitem(last=False)
+                self._probation[demoted] = None
+        elif key in self._protected:
+            self._protected.move_to_end(key)
+
+    def on_remove(self, key: Hashable) -> None:
+        for segment in (self._window, self._probation, self._protected):
+            if key in segment:
+                del segment[key]
+                return
+
+    def evict(self) -> Hashable:
+        main = self._probation or self._protected
+        if not main:
+            return self._window.popitem(last=False)[0]
+        if len(self._window) <= self._window_capacity or not self._window:
+            return main.popitem(last=False)[0]
+
+        # Window is over its share: its LRU key competes with main's victim
+        candidate = next(iter(self._window))
+        victim = next(iter(main))
+        if self.sketch.estimate(candidate) > self.sketch.estimate(victim):
+            del self._window[candidate]
+            del main[victim]
+            self._probation[candidate] = None
+            return victim
+        del self._window[candidate]
+        return candidate
+
+    def _main_size(self) -> int:
+        return len(self._probation) + len(self._protected)
+
+    def clear(self) -> None:
+        self._window.clear()
+        self._probation.clear()
+        self._protected.clear()
+        self.sketch.clear()
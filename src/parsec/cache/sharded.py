@@ -0,0 +1,227 @@
+"""Thread-safe, lock-striped in-memory cache."""
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+from .base import BaseCache
+from .memory import InMemoryCache
+import threading
+
+
+class ShardedCache(BaseCache):
+    """
+    Thread-safe in-memory cache split into independently locked shards.
+
+    Each key is mapped to one of `shards` `InMemoryCache` instances by hash,
+    and each shard has its own lock, so threads working on different keys
+    rarely wait for each other. Capacity (`max_size`, `max_bytes`) is divided
+    evenly between shards and eviction is per shard.
+
+    Use this instead of `InMemoryCache` when one cache is shared by engines
+    running in several threads (e.g. one event loop per worker thread).
+
+    Example:
+        >>> cache = ShardedCache(shards=16, max_size=10000)
+        >>> cache.set("key1", {"data": "value"})
+        >>> cache.get("key1")
+        {'data': 'value'}
+    """
+
+    def __init__(
+        self,
+        shards: int = 16,
+        max_size: int = 1000,
+        default_ttl: int = 3600,
+        max_bytes: Optional[int] = None,
+        **cache_kwargs: Any
+    ):
+        """
+        Initialize the sharded cache.
+
+        Args:
+            shards: Number of independently locked shards (default: 16)
+            max_size: Total maximum number of entries (default: 1000)
+            default_ttl: Default time-to-live in seconds (default: 3600)
+            max_bytes: Optional total byte budget
+            **cache_kwargs: Extra InMemoryCache options for every shard (e.g. policy)
+
+        Raises:
+            ValueError: If shards is less than 1
+        """
+        if shards < 1:
+            raise ValueError(f"shards must be at least 1, got {shards}")
+
+        per_shard_bytes = None if max_bytes is None else max_bytes // shards
+        self._shards = [
+            InMemoryCache(
+                max_size=max_size // shards + (1 if i < max_size % shards else 0),
+                default_ttl=default_ttl,
+                max_bytes=per_shard_bytes,
+                **cache_kwargs
+            )
+            for i in range(shards)
+        ]
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._default_ttl = default_ttl
+
+    @property
+    def default_ttl(self) -> Optional[float]:
+        """TTL in seconds applied when `set` gets none."""
+        return self._default_ttl
+
+    def _index(self, key: str) -> int:
+        return hash(key) % len(self._shards)
+
+    def _group(self, keys: Iterable[str]) -> Dict[int, List[str]]:
+        groups: Dict[int, List[str]] = {}
+        for key in keys:
+            groups.setdefault(self._index(key), []).append(key)
+        return groups
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Retrieve a value from the key's shard.
+
+        Args:
+            key: Cache key to retrieve
+
+        Returns:
+            Optional[Any]: Cached value if found and not expired, None otherwise
+        """
+        i = self._index(key)
+        with self._locks[i]:
+            return self._shards[i].get(key)
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """
+        Store a value in the key's shard.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Optional time-to-live in seconds (uses default_ttl if None)
+        """
+        i = self._index(key)
+        with self._locks[i]:
+            self._shards[i].set(key, value, ttl)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Retrieve several values, taking each shard's lock once.
+
+        Args:
+            keys: Cache keys to retrieve
+
+        Returns:
+            Dict[str, Any]: Values for keys that were found and not expired
+        """
+        found: Dict[str, Any] = {}
+        for i, shard_keys in self._group(keys).items():
+            with self._locks[i]:
+                found.update(self._shards[i].get_many(shard_keys))
+        return found
+
+    def get_many_with_ttl(self, keys: Iterable[str]) -> Dict[str, Tuple[Any, Optional[float]]]:
+        """
+        Retrieve several values with their remaining time-to-live.
+
+        Args:
+            keys: Cache keys to retrieve
+
+        Returns:
+            Dict[str, Tuple[Any, Optional[float]]]: (value, seconds left) for
+            keys that were found and not expired
+        """
+        found: Dict[str, Tuple[Any, Optional[float]]] = {}
+        for i, shard_keys in self._group(keys).items():
+            with self._locks[i]:
+                found.update(self._shards[i].get_many_with_ttl(shard_keys))
+        return found
+
+    def set_many(self, items: Mapping[str, Any], ttl: Optional[int] = None) -> None:
+        """
+        Store several values, taking each shard's lock once.
+
+        Args:
+            items: Mapping of cache keys to values
+            ttl: Optional time-to-live in seconds (uses default_ttl if None)
+        """
+        for i, shard_keys in self._group(items).items():
+            with self._locks[i]:
+                self._shards[i].set_many({key: items[key] for key in shard_keys}, ttl)
+
+    def delete(self, key: str) -> None:
+        """
+        Remove an entry from the cache.
+
+        Args:
+            key: Cache key to delete
+        """
+        i = self._index(key)
+        with self._locks[i]:
+            self._shards[i].delete(key)
+
+    def clear(self) -> None:
+        """
+        Remove all entries from every shard.
+
+        Note:
+            Does not reset hit/miss counters
+        """
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                shard.clear()
+
+    def exists(self, key: str) -> bool:
+        """
+        Check if an unexpired key exists in the cache.
+
+        Args:
+            key: Cache key to check
+
+        Returns:
+            bool: True if key exists and has not expired
+        """
+        i = self._index(key)
+        with self._locks[i]:
+            return self._shards[i].exists(key)
+
+    def purge_expired(self) -> int:
+        """
+        Remove every expired entry from every shard.
+
+        Returns:
+            int: Number of entries removed
+        """
+        removed = 0
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                removed += shard.purge_expired()
+        return removed
+
+    def get_stats(self) -> dict:
+        """
+        Get statistics aggregated over all shards.
+
+        Each shard's counters are read under its lock.
+
+        Returns:
+            dict: size, hits, misses, hit_rate, bytes, evictions and
+            expirations summed over shards, plus the number of shards
+        """
+        totals = {"size": 0, "hits": 0, "misses": 0, "bytes": 0, "evictions": 0, "expirations": 0}
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                stats = shard.get_stats()
+            for name in totals:
+                totals[name] += stats[name]
+
+        total = totals["hits"] + totals["misses"]
+        hit_rate = (totals["hits"] / total) * 100 if total > 0 else 0.0
+        return {
+            "size": totals["size"],
+            "hits": totals["hits"],
+            "misses": totals["misses"],
+            "hit_rate": f"{hit_rate:.2f}%",
+            "bytes": totals["bytes"],
+            "evictions": totals["evictions"],
+            "expirations": totals["expirations"],
+            "shards": len(self._shards)
+        }
@@ -0,0 +1,400 @@
+"""Persistent SQLite cache implementation."""
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+from pydantic import BaseModel
+from .base import BaseCache
+import json
+import sqlite3
+import sys
+import threading
+import time
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    expires_at REAL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_cache_entries_accessed ON cache_entries (accessed_at);
+CREATE INDEX IF NOT EXISTS idx_cache_entries_expires ON cache_entries (expires_at);
+"""
+
+# Keep IN (...) lists below SQLite's default host parameter limit
+_BATCH = 500
+
+# Writes between recounts of the table, which pick up other processes' entries
+_RECOUNT_EVERY = 1000
+
+
+def _is_busy(error: sqlite3.OperationalError) -> bool:
+    """Whether `error` only means another connection holds a lock."""
+    message = str(error).lower()
+    return "locked" in message or "busy" in message
+
+
+def _serialize(value: Any) -> str:
+    """Encode a value as JSON, tagging pydantic models with their class."""
+    if isinstance(value, BaseModel):
+        cls = type(value)
+        return json.dumps({
+            "__model__": f"{cls.__module__}:{cls.__qualname__}",
+            "data": value.model_dump(mode="json")
+        })
+    return json.dumps({"value": value})
+
+
+def _deserialize(text: str) -> Any:
+    """
+    Decode a stored value.
+
+    Model classes are only looked up in modules that are already imported:
+    the class name comes from the database, and importing whatever module it
+    names would let a shared or tampered file run import-time code.
+    """
+    payload = json.loads(text)
+    if "__model__" not in payload:
+        return payload["value"]
+
+    module_name, _, qualname = payload["__model__"].partition(":")
+    target: Any = sys.modules.get(module_name)
+    if target is None:
+        raise TypeError(f"{payload['__model__']} is not in an imported module")
+    for part in qualname.split("."):
+        target = getattr(target, part, None)
+    if not (isinstance(target, type) and issubclass(target, BaseModel)):
+        raise TypeError(f"{payload['__model__']} is not a pydantic model")
+    return target.model_validate(payload["data"])
+
+
+class SQLiteCache(BaseCache):
+    """
+    Disk-backed LRU cache with TTL support, stored in a SQLite database.
+
+    The database runs in WAL mode, so any number of processes can read it
+    while one writes, and cached responses survive restarts. Values are stored
+    as JSON; pydantic models such as `EnforcedOutput` are restored to their
+    original class, which must be in an already imported module. Each thread uses its own connection.
+
+    Reads never wait for the write lock: access times of hits are buffered
+    and written with the next `set`/`set_many` (or once enough pile up), and
+    expired rows are only removed when the lock is free. The entry count used
+    for eviction is tracked in memory and re-read from the database every
+    1000 writes.
+
+    Attributes:
+        path: Database file path
+        _max_size: Maximum number of entries before LRU eviction
+        _default_ttl: Default time-to-live in seconds (None for no expiry)
+
+    Example:
+        >>> cache = SQLiteCache("responses.db", max_size=10000)
+        >>> cache.set("key1", {"data": "value"})
+        >>> SQLiteCache("responses.db").get("key1")
+        {'data': 'value'}
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_size: int = 10000,
+        default_ttl: Optional[int] = 3600,
+        timeout: float = 5.0
+    ):
+        """
+        Initialize the SQLite cache.
+
+        Args:
+            path: Database file path (created if missing)
+            max_size: Maximum number of entries to store (default: 10000)
+            default_ttl: Default time-to-live in seconds (default: 3600, None for no expiry)
+            timeout: Seconds to wait for another writer's lock (default: 5.0)
+        """
+        self.path = path
+        self._max_size = max_size
+        self._default_ttl = default_ttl
+        self._timeout = timeout
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._touched: Dict[str, float] = {}
+        self._size: Optional[int] = None
+        self._writes = 0
+
+        with self._connection() as conn:
+            conn.executescript(_SCHEMA)
+
+    @property
+    def default_ttl(self) -> Optional[float]:
+        """TTL in seconds applied when `set` gets none."""
+        return self._default_ttl
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path, timeout=self._timeout, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def _expires_at(self, ttl: Optional[float], now: float) -> Optional[float]:
+        if ttl is None:
+            ttl = self._default_ttl
+        return None if ttl is None else now + ttl
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Retrieve a value from the cache.
+
+        Args:
+            key: Cache key to retrieve
+
+        Returns:
+            Optional[Any]: Cached value if found and not expired, None otherwise
+        """
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Retrieve several values with one query per batch of keys.
+
+        Args:
+            keys: Cache keys to retrieve
+
+        Returns:
+            Dict[str, Any]: Values for keys that were found and not expired
+        """
+        return {key: value for key, (value, _) in self.get_many_with_ttl(keys).items()}
+
+    def get_many_with_ttl(self, keys: Iterable[str]) -> Dict[str, Tuple[Any, Optional[float]]]:
+        """
+        Retrieve several values with their remaining time-to-live.
+
+        Args:
+            keys: Cache keys to retrieve
+
+        Returns:
+            Dict[str, Tuple[Any, Optional[float]]]: (value, seconds left, or
+            None for no expiry) for keys that were found and not expired
+        """
+        keys = list(dict.fromkeys(keys))
+        conn = self._connection()
+        now = time.time()
+        found: Dict[str, Tuple[Any, Optional[float]]] = {}
+        expired: List[str] = []
+
+        for i in range(0, len(keys), _BATCH):
+            batch = keys[i:i + _BATCH]
+            placeholders = ",".join("?" * len(batch))
+            rows = conn.execute(
+                f"SELECT key, value, expires_at FROM cache_entries WHERE key IN ({placeholders})",
+                batch
+            ).fetchall()
+            for key, value, expires_at in rows:
+                if expires_at is not None and expires_at < now:
+                    expired.append(key)
+                else:
+                    found[key] = (_deserialize(value), None if expires_at is None else expires_at - now)
+
+        with self._lock:
+            self._touched.update(dict.fromkeys(found, now))
+            pending = len(self._touched)
+        if expired or pending >= _BATCH:
+            self._try_write(conn, lambda: self._flush_touched(conn, expired, now))
+
+        with self._lock:
+            self._hits += len(found)
+            self._misses += len(keys) - len(found)
+        return found
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """
+        Store a value in the cache.
+
+        Args:
+            key: Cache key
+            value: JSON-compatible value or pydantic model
+            ttl: Optional time-to-live in seconds (uses default_ttl if None)
+        """
+        self.set_many({key: value}, ttl)
+
+    def set_many(self, items: Mapping[str, Any], ttl: Optional[int] = None) -> None:
+        """
+        Store several values in a single transaction.
+
+        Evicts least recently used entries if the cache grows past max_size.
+
+        Args:
+            items: Mapping of cache keys to values
+            ttl: Optional time-to-live in seconds (uses default_ttl if None)
+        """
+        now = time.time()
+        expires_at = self._expires_at(ttl, now)
+        rows = [(key, _serialize(value), expires_at, now) for key, value in items.items()]
+        conn = self._connection()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            # Apply buffered access times first so eviction sees them
+            self._flush_touched(conn, [], now)
+            if self._size is None or self._writes % _RECOUNT_EVERY == 0:
+                self._size = conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+            self._writes += 1
+
+            existing = 0
+            for i in range(0, len(rows), _BATCH):
+                batch = [row[0] for row in rows[i:i + _BATCH]]
+                placeholders = ",".join("?" * len(batch))
+                existing += conn.execute(
+                    f"SELECT COUNT(*) FROM cache_entries WHERE key IN ({placeholders})", batch
+                ).fetchone()[0]
+            conn.executemany(
+                "INSERT OR REPLACE INTO cache_entries (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            self._size += len(rows) - existing
+
+            overflow = self._size - self._max_size
+            if overflow > 0:
+                evicted = conn.execute(
+                    "DELETE FROM cache_entries WHERE key IN "
+                    "(SELECT key FROM cache_entries ORDER BY accessed_at LIMIT ?)",
+                    (overflow,)
+                ).rowcount
+                self._size -= evicted
+                self._evictions += evicted
+
+    def _flush_touched(self, conn: sqlite3.Connection, expired: List[str], now: float) -> None:
+        """Write buffered access times and drop `expired` keys (in the caller's transaction)."""
+        with self._lock:
+            touched, self._touched = self._touched, {}
+        try:
+            conn.executemany(
+                "UPDATE cache_entries SET accessed_at = MAX(accessed_at, ?) WHERE key = ?",
+                [(accessed_at, key) for key, accessed_at in touched.items()]
+            )
+            removed = conn.executemany(
+                "DELETE FROM cache_entries WHERE key = ? AND expires_at < ?",
+                [(key, now) for key in expired]
+            ).rowcount
+        except BaseException:
+            with self._lock:
+                for key, accessed_at in touched.items():
+                    self._touched.setdefault(key, accessed_at)
+            raise
+        if self._size is not None and removed > 0:
+            self._size -= removed
+
+    def _try_write(self, conn: sqlite3.Connection, write: Callable[[], None]) -> None:
+        """Run `write` in a transaction if the write lock is free right now; skip it otherwise."""
+        conn.execute("PRAGMA busy_timeout = 0")
+        try:
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                write()
+        except sqlite3.OperationalError as e:
+            if not _is_busy(e):
+                raise
+            # Another connection holds the lock; buffered touches wait for the next write
+        finally:
+            conn.execute(f"PRAGMA busy_timeout = {int(self._timeout * 1000)}")
+
+    def delete(self, key: str) -> None:
+        """
+        Remove an entry from the cache.
+
+        Args:
+            key: Cache key to delete
+        """
+        with self._connection() as conn:
+            removed = conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,)).rowcount
+        if self._size is not None:
+            self._size -= removed
+
+    def clear(self) -> None:
+        """
+        Remove all entries from the cache.
+
+        Note:
+            Does not reset hit/miss counters
+        """
+        with self._connection() as conn:
+            conn.execute("DELETE FROM cache_entries")
+        with self._lock:
+            self._touched.clear()
+        self._size = 0
+
+    def exists(self, key: str) -> bool:
+        """
+        Check if an unexpired key exists in the cache.
+
+        Args:
+            key: Cache key to check
+
+        Returns:
+            bool: True if key exists and has not expired
+        """
+        row = self._connection().execute(
+            "SELECT 1 FROM cache_entries WHERE key = ? AND (expires_at IS NULL OR expires_at >= ?)",
+            (key, time.time())
+        ).fetchone()
+        return row is not None
+
+    def purge_expired(self) -> int:
+        """
+        Delete every expired entry.
+
+        Returns:
+            int: Number of entries removed
+        """
+        with self._connection() as conn:
+            cursor = conn.execute(
+                "DELETE FROM cache_entries WHERE expires_at IS NOT NULL AND expires_at < ?",
+                (time.time(),)
+            )
+        if self._size is not None:
+            self._size -= cursor.rowcount
+        return cursor.rowcount
+
+    def get_stats(self) -> dict:
+        """
+        Get cache performance statistics.
+
+        Hits, misses and evictions are counted for this instance; size is
+        read from the database and includes entries written by other processes.
+
+        Returns:
+            dict: size, hits, misses, evictions and hit_rate (formatted string)
+        """
+        size = self._connection().execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+        with self._lock:
+            hits, misses = self._hits, self._misses
+        total = hits + misses
+        hit_rate = (hits / total) * 100 if total > 0 else 0.0
+
+        return {
+            "size": size,
+            "hits": hits,
+            "misses": misses,
+            "evictions": self._evictions,
+            "hit_rate": f"{hit_rate:.2f}%"
+        }
+
+    def close(self) -> None:
+        """Close every connection opened by this cache, saving buffered access times if possible."""
+        if self._touched:
+            conn = self._connection()
+            self._try_write(conn, lambda: self._flush_touched(conn, [], time.time()))
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
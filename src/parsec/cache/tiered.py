@@ -0,0 +1,245 @@
+"""Two-tier cache: a small in-process L1 in front of a larger L2."""
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+from .base import BaseCache
+from .memory import InMemoryCache
+import time
+
+
+def _rate(hits: int, misses: int) -> str:
+    total = hits + misses
+    return f"{(hits / total) * 100 if total > 0 else 0.0:.2f}%"
+
+
+class TieredCache(BaseCache):
+    """
+    Two-level cache with promotion of L2 hits into L1.
+
+    Lookups try the hot L1 tier (by default a small `InMemoryCache`) and fall
+    back to L2 (e.g. `SQLiteCache`); an L2 hit is copied into L1 so the next
+    lookup is served from memory. Writes go to both tiers immediately
+    (write-through) or, with `write_back=True`, to L1 at once and to L2 in
+    batches of `flush_every` entries or on `flush()`.
+
+    Promoted entries keep the lifetime they had left in L2 (capped at
+    `promote_ttl`), so they expire from L1 no later than from L2. Entries that
+    never expire in L2, or whose L2 can't report a TTL, get `promote_ttl` or
+    L1's default TTL.
+
+    Example:
+        >>> cache = TieredCache(SQLiteCache("responses.db"), l1=InMemoryCache(max_size=256))
+        >>> engine = EnforcementEngine(adapter, validator, cache=cache)
+        >>> cache.get_stats()["l1"]
+        {'hits': 0, 'misses': 0, 'hit_rate': '0.00%'}
+    """
+
+    def __init__(
+        self,
+        l2: BaseCache,
+        l1: Optional[BaseCache] = None,
+        write_back: bool = False,
+        flush_every: int = 100,
+        promote_ttl: Optional[int] = None
+    ):
+        """
+        Initialize the tiered cache.
+
+        Args:
+            l2: Large (disk or shared) cache tier
+            l1: Small hot tier (default: InMemoryCache(max_size=256))
+            write_back: Defer L2 writes and flush them in batches (default: False)
+            flush_every: Pending writes that trigger a flush in write-back mode
+            promote_ttl: Longest time-to-live in seconds for entries promoted
+                from L2 (default: no cap beyond their remaining L2 lifetime)
+        """
+        self.l1 = l1 if l1 is not None else InMemoryCache(max_size=256)
+        self.l2 = l2
+        self.write_back = write_back
+        self.flush_every = flush_every
+        self.promote_ttl = promote_ttl
+        # key -> (value, ttl as given, absolute expiry or None)
+        self._pending: Dict[str, Tuple[Any, Optional[int], Optional[float]]] = {}
+        self._pending_hits = 0
+        self._l1_hits = 0
+        self._l1_misses = 0
+        self._l2_hits = 0
+        self._l2_misses = 0
+        self._promotions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Retrieve a value, promoting it into L1 if it was found in L2.
+
+        Args:
+            key: Cache key to retrieve
+
+        Returns:
+            Optional[Any]: Cached value if found in either tier, None otherwise
+        """
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Retrieve several values, looking up L1 misses in L2 with one bulk call.
+
+        Args:
+            keys: Cache keys to retrieve
+
+        Returns:
+            Dict[str, Any]: Values for keys found in either tier
+        """
+        keys = list(dict.fromkeys(keys))
+        found = self.l1.get_many(keys)
+        self._l1_hits += len(found)
+        self._l1_misses += len(keys) - len(found)
+
+        missing = [key for key in keys if key not in found]
+        if not missing:
+            return found
+
+        # Write-back entries evicted from L1 are still pending for L2
+        now = time.time()
+        from_l2: Dict[str, Tuple[Any, Optional[float]]] = {}
+        for key in missing:
+            entry = self._pending.get(key)
+            if entry is None:
+                continue
+            value, _, expires_at = entry
+            if expires_at is not None and expires_at <= now:
+                del self._pending[key]
+                continue
+            from_l2[key] = (value, None if expires_at is None else expires_at - now)
+        self._pending_hits += len(from_l2)
+
+        queried = [key for key in missing if key not in from_l2]
+        if queried:
+            hits = self.l2.get_many_with_ttl(queried)
+            self._l2_hits += len(hits)
+            self._l2_misses += len(queried) - len(hits)
+            from_l2.update(hits)
+
+        by_ttl: Dict[Optional[float], Dict[str, Any]] = {}
+        for key, (value, remaining) in from_l2.items():
+            found[key] = value
+            ttl = self._promoted_ttl(remaining)
+            if ttl is None or ttl > 0:
+                by_ttl.setdefault(ttl, {})[key] = value
+        for ttl, items in by_ttl.items():
+            self.l1.set_many(items, ttl)
+            self._promotions += len(items)
+        return found
+
+    def _promoted_ttl(self, remaining: Optional[float]) -> Optional[float]:
+        """L1 TTL for a promoted entry with `remaining` seconds left in L2."""
+        if remaining is None:
+            return self.promote_ttl
+        if self.promote_ttl is None:
+            return remaining
+        return min(remaining, self.promote_ttl)
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """
+        Store a value in both tiers (L2 deferred in write-back mode).
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Optional time-to-live in seconds (each tier's default if None)
+        """
+        self.set_many({key: value}, ttl)
+
+    def set_many(self, items: Mapping[str, Any], ttl: Optional[int] = None) -> None:
+        """
+        Store several values in both tiers (L2 deferred in write-back mode).
+
+        Args:
+            items: Mapping of cache keys to values
+            ttl: Optional time-to-live in seconds (each tier's default if None)
+        """
+        self.l1.set_many(items, ttl)
+        if not self.write_back:
+            self.l2.set_many(items, ttl)
+            return
+
+        lifetime = self.l2.default_ttl if ttl is None else ttl
+        expires_at = None if lifetime is None else time.time() + lifetime
+        for key, value in items.items():
+            self._pending[key] = (value, ttl, expires_at)
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all pending write-back entries to L2."""
+        pending, self._pending = self._pending, {}
+        now = time.time()
+        by_ttl: Dict[Optional[int], Dict[str, Any]] = {}
+        for key, (value, ttl, expires_at) in pending.items():
+            if expires_at is None or expires_at > now:
+                by_ttl.setdefault(ttl, {})[key] = value
+        for ttl, items in by_ttl.items():
+            self.l2.set_many(items, ttl)
+
+    def delete(self, key: str) -> None:
+        """
+        Remove an entry from both tiers.
+
+        Args:
+            key: Cache key to delete
+        """
+        self._pending.pop(key, None)
+        self.l1.delete(key)
+        self.l2.delete(key)
+
+    def clear(self) -> None:
+        """
+        Remove all entries from both tiers, discarding pending writes.
+
+        Note:
+            Does not reset hit/miss counters
+        """
+        self._pending.clear()
+        self.l1.clear()
+        self.l2.clear()
+
+    def exists(self, key: str) -> bool:
+        """
+        Check if a key exists in either tier.
+
+        Args:
+            key: Cache key to check
+
+        Returns:
+            bool: True if key exists in L1, L2 or the write-back queue
+        """
+        entry = self._pending.get(key)
+        if entry is not None and (entry[2] is None or entry[2] > time.time()):
+            return True
+        return self.l1.exists(key) or self.l2.exists(key)
+
+    def get_stats(self) -> dict:
+        """
+        Get cache performance statistics.
+
+        Returns:
+            dict: Overall hits, misses and hit_rate; `l1` and `l2` hit/miss
+            counts and rates (L2 counts only lookups that reached it);
+            pending_hits (L1 misses served from the write-back queue),
+            promotions and pending_writes
+
+        Example:
+            >>> cache.get_stats()
+            {'hits': 9, 'misses': 1, 'hit_rate': '90.00%',
+             'l1': {'hits': 8, 'misses': 2, 'hit_rate': '80.00%'},
+             'l2': {'hits': 1, 'misses': 1, 'hit_rate': '50.00%'},
+             'pending_hits': 0, 'promotions': 1, 'pending_writes': 0}
+        """
+        hits = self._l1_hits + self._pending_hits + self._l2_hits
+        return {
+            "hits": hits,
+            "misses": self._l2_misses,
+            "hit_rate": _rate(hits, self._l2_misses),
+            "l1": {"hits": self._l1_hits, "misses": self._l1_misses, "hit_rate": _rate(self._l1_hits, self._l1_misses)},
+            "l2": {"hits": self._l2_hits, "misses": self._l2_misses, "hit_rate": _rate(self._l2_hits, self._l2_misses)},
+            "pending_hits": self._pending_hits,
+            "promotions": self._promotions,
+            "pending_writes": len(self._pending)
+        }
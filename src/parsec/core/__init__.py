@@ -1,10 +1,12 @@
 from .base import BaseLLMAdapter, ModelProviders, OutputFormats
+from .stream_buffer import StreamBuffer, LightStreamChunk
 from .schemas import (
     ValidationStatus,
     ValidationError,
     ValidationResult,
     GenerationResponse,
     StreamChunk,
+    StreamItem,
     StreamValidationResult
 )
 
@@ -17,5 +19,8 @@ __all__ = [
     "ValidationResult",
     "GenerationResponse",
     "StreamChunk",
+    "StreamItem",
     "StreamValidationResult",
+    "StreamBuffer",
+    "LightStreamChunk",
 ]
@@ -24,19 +24,89 @@ class OutputFormats(Enum):
 # Base classes for adapters and validators.
 #
 
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Optional, AsyncIterator, TYPE_CHECKING
 from pydantic import BaseModel
 
+if TYPE_CHECKING:
+    from parsec.core.schemas import GenerationResponse
+    from parsec.resilience import AdaptiveConcurrencyLimiter, RateLimiter
+
+
+class CallGuard:
+    """A provider call admitted by `BaseLLMAdapter._guard`; adapters record usage on it."""
+
+    __slots__ = ("estimated_tokens", "tokens_used")
+
+    def __init__(self, estimated_tokens: int = 0):
+        self.estimated_tokens = estimated_tokens
+        self.tokens_used: Optional[int] = None
+
+
 class BaseLLMAdapter(ABC):
     """Abstract base class for LLM adapters."""
 
-    def __init__(self, api_key: str, model: str, **kwargs):
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        rate_limiter: Optional["RateLimiter"] = None,
+        concurrency_limiter: Optional["AdaptiveConcurrencyLimiter"] = None,
+        **kwargs
+    ):
         self.api_key = api_key
         self.model = model
+        self.rate_limiter = rate_limiter  # Shared RPM/TPM budget, acquired per call
+        self.concurrency_limiter = concurrency_limiter  # Adaptive cap on calls in flight
         self.config = kwargs
         self._client = None  # Placeholder for the LLM client instance
 
+    @asynccontextmanager
+    async def _guard(
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        streaming: bool = False
+    ) -> AsyncIterator[CallGuard]:
+        """
+        Admit one provider call through the adapter's flow control.
+
+        Takes a slot from the concurrency limiter, then waits for the rate
+        limiter with an estimate based on the prompt and `max_tokens`. Set
+        `tokens_used` on the yielded guard once the provider reports it so the
+        estimate is corrected; otherwise (e.g. streams, errors) the estimate
+        stays charged. The call's latency and error are reported back to the
+        concurrency limiter, except for the latency of streams, which is paced
+        by the consumer.
+        """
+        concurrency = self.concurrency_limiter
+        limiter = self.rate_limiter
+        call = CallGuard()
+        latency, error = None, None
+
+        if concurrency is not None:
+            await concurrency.acquire()
+        try:
+            if limiter is not None:
+                call.estimated_tokens = await limiter.acquire(limiter.estimate_tokens(prompt, max_tokens))
+            start = time.perf_counter()
+            try:
+                yield call
+            except Exception as e:
+                error = e
+                raise
+            else:
+                if not streaming:
+                    latency = time.perf_counter() - start
+            finally:
+                if limiter is not None and call.tokens_used is not None:
+                    limiter.settle(call.estimated_tokens, call.tokens_used)
+        finally:
+            if concurrency is not None:
+                concurrency.release(latency, error)
+
     def get_client(self):
         """Return an initialized client instance, caching it on the adapter."""
         if self._client is None:
@@ -58,6 +128,14 @@ class BaseLLMAdapter(ABC):
         """Checks whether the adapter supports native structured output."""
         pass
 
+    def record_validation(self, generation: "GenerationResponse", valid: bool) -> None:
+        """
+        Hook called by `EnforcementEngine` after validating a generation.
+
+        Adapters that route between backends use it to spot a backend whose
+        output keeps failing validation. The default does nothing.
+        """
+
     def supports_streaming(self) -> bool:
         """Checks whether the adapter supports streaming."""
         return False
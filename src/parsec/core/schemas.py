@@ -48,3 +48,10 @@ class StreamValidationResult(BaseModel):
     errors: List[ValidationError] = Field(default_factory=list)
     is_partial: bool = True  # Whether this is a partial validation
     accumulated_text: str
+
+class StreamItem(BaseModel):
+    """A fully closed array element from a streaming response"""
+    index: int  # Position within the streamed array
+    path: str  # Location in the document, e.g. "items[3]"
+    data: Any
+    validation: Optional[ValidationResult] = None  # None when no element schema applies
@@ -0,0 +1,87 @@
+"""Low-overhead building blocks for high-volume streaming."""
+
+import time
+from typing import List, Optional
+
+
+class StreamBuffer:
+    """
+    Append-only text accumulator backed by a list of parts.
+
+    Appending is O(len(delta)). The full text is only joined when asked for,
+    and the join is cached until the next append, so a stream that never reads
+    the accumulated text never pays for building it.
+    """
+
+    __slots__ = ("_text", "_parts", "_length")
+
+    def __init__(self):
+        self._text = ""
+        self._parts: List[str] = []
+        self._length = 0
+
+    def append(self, delta: str) -> None:
+        """Add a delta to the end of the buffer."""
+        self._parts.append(delta)
+        self._length += len(delta)
+
+    def text(self, end: Optional[int] = None) -> str:
+        """
+        Return the accumulated text.
+
+        Args:
+            end: Return only the first `end` characters (a snapshot of an earlier point)
+        """
+        if self._parts:
+            self._text += "".join(self._parts)
+            self._parts.clear()
+        if end is None or end >= self._length:
+            return self._text
+        return self._text[:end]
+
+    def __len__(self) -> int:
+        return self._length
+
+
+class LightStreamChunk:
+    """
+    Lightweight streaming chunk with lazily materialised `accumulated` text.
+
+    Mirrors the fields of `StreamChunk` but is a plain `__slots__` object, so
+    producing one per token costs a handful of attribute stores instead of a
+    pydantic model and a copy of the whole response. `timestamp` is a
+    `time.time()` float rather than a datetime.
+    """
+
+    __slots__ = ("delta", "is_complete", "provider", "model", "timestamp", "_buffer", "_end")
+
+    def __init__(
+        self,
+        delta: str,
+        buffer: Optional[StreamBuffer],
+        is_complete: bool,
+        provider: str,
+        model: str
+    ):
+        self.delta = delta
+        self.is_complete = is_complete
+        self.provider = provider
+        self.model = model
+        self.timestamp = time.time()
+        self._buffer = buffer
+        self._end = len(buffer) if buffer is not None else 0
+
+    @property
+    def accumulated(self) -> str:
+        """
+        All content up to and including this chunk.
+
+        Raises:
+            ValueError: If the stream was produced in delta-only mode
+        """
+        if self._buffer is None:
+            raise ValueError("accumulated text is not tracked in delta-only mode")
+        return self._buffer.text(self._end)
+
+    def __repr__(self) -> str:
+        return f"LightStreamChunk(delta={self.delta!r}, is_complete={self.is_complete})"
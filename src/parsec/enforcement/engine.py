@@ -1,19 +1,47 @@
 from parsec.core import BaseLLMAdapter, GenerationResponse, ValidationResult, ValidationStatus
 from parsec.validators.base_validator import BaseValidator
 from pydantic import BaseModel
-from typing import Any, Optional, TYPE_CHECKING
-from parsec.cache.base import BaseCache
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple, Union, TYPE_CHECKING
+from parsec.cache.base import AsyncBaseCache, BaseCache
 from parsec.cache.keys import generate_cache_key
+from parsec.resilience.hedging import HedgingPolicy
+from parsec.resilience.retry import RetryPolicy
+from datetime import datetime
+from enum import Enum
+import asyncio
+import time
 
 if TYPE_CHECKING:
     from parsec.training.collector import DatasetCollector
 
+class Freshness(str, Enum):
+    FRESH = "fresh"      # generated for this call
+    CACHED = "cached"    # served from cache within the soft TTL
+    STALE = "stale"      # served from cache past the soft TTL; a refresh was scheduled
+
 class EnforcedOutput(BaseModel):
     data: Any
     generation: GenerationResponse
     validation: ValidationResult
     retry_count: int = 0
+    transport_retry_count: int = 0
     success: bool
+    freshness: Freshness = Freshness.FRESH
+
+class _Flight:
+    """A shared in-flight enforcement and the number of callers awaiting it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Future[EnforcedOutput]"):
+        self.task = task
+        self.waiters = 0
+
+
+def deterministic_only(params: Dict[str, Any]) -> bool:
+    """Negative-cache policy: only cache failures of temperature-0 calls."""
+    return params.get("temperature", 0.7) == 0
+
 
 class EnforcementEngine:
     """Main orchestrator"""
@@ -24,13 +52,66 @@ class EnforcementEngine:
         validator: BaseValidator,
         max_retries: int = 3,
         collector: Optional['DatasetCollector'] = None,
-        cache: Optional[BaseCache] = None
+        cache: Optional[Union[BaseCache, AsyncBaseCache]] = None,
+        coalesce: bool = False,
+        soft_ttl: Optional[float] = None,
+        hard_ttl: Optional[int] = None,
+        negative_ttl: Optional[int] = None,
+        negative_cache_policy: Callable[[Dict[str, Any]], bool] = deterministic_only,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedging: Optional[HedgingPolicy] = None
     ):
+        """
+        Initialize the engine.
+
+        Args:
+            adapter: LLM adapter used for generation
+            validator: Validator applied to every generation
+            max_retries: Retries after a failed validation
+            collector: Optional dataset collector
+            cache: Optional result cache; an `AsyncBaseCache` is awaited
+            coalesce: Share one in-flight enforcement between concurrent
+                identical calls (same cache key). Each caller gets its own
+                copy of the result.
+            soft_ttl: Seconds after generation when a cached result becomes
+                stale. Stale results are still returned immediately while a
+                background refresh (one per key) replaces them in the cache.
+            hard_ttl: TTL passed to the cache when storing results (default:
+                the cache's own default). Past it, `enforce` generates anew.
+            negative_ttl: Cache results that failed every retry for this many
+                seconds, so a known-bad input fails fast without new calls.
+                Off by default.
+            negative_cache_policy: Decides from the call's kwargs whether a
+                failure may be cached (default: only when temperature is 0,
+                where a retry would most likely fail the same way).
+            retry_policy: Retries adapter errors that look transient (429,
+                5xx, timeouts) with backoff. These retries are counted in
+                `EnforcedOutput.transport_retry_count`, separately from
+                validation retries, and don't use up `max_retries`.
+            hedging: Sends a duplicate generation when one runs past the
+                policy's percentile of generation latency (validation time is
+                not counted); the first copy that validates is
+                used and the other is cancelled. See `HedgingPolicy.get_stats()`
+                for hedges sent, won and wasted tokens.
+        """
         self.adapter = adapter
         self.validator = validator
         self.max_retries = max_retries
         self.collector = collector
         self.cache = cache
+        self.coalesce = coalesce
+        self.soft_ttl = soft_ttl
+        self.hard_ttl = hard_ttl
+        self.negative_ttl = negative_ttl
+        self.negative_cache_policy = negative_cache_policy
+        self.retry_policy = retry_policy
+        self.hedging = hedging
+        self._in_flight: Dict[str, _Flight] = {}
+        self._refreshes: Dict[str, asyncio.Task] = {}
+        self._stats = {
+            "requests": 0, "cache_hits": 0, "stale_hits": 0, "negative_hits": 0,
+            "refreshes": 0, "flights": 0, "joins": 0, "transport_retries": 0
+        }
     
     async def enforce(
         self,
@@ -39,30 +120,194 @@ class EnforcementEngine:
         **kwargs
     ) -> EnforcedOutput:
         """Generate and validate output with retries"""
+        self._stats["requests"] += 1
 
-        if self.cache:
+        cache_key = None
+        if self.cache or self.coalesce:
             cache_key = generate_cache_key(
                 prompt=prompt,
                 model=self.adapter.model,
                 schema=schema,
                 temperature=kwargs.get('temperature', 0.7)
                 )
-            cached_result = self.cache.get(cache_key)
+
+        if self.cache:
+            cached_result = await self._cache_get(cache_key)
             if cached_result:
-                return cached_result
+                self._stats["cache_hits"] += 1
+                freshness = Freshness.CACHED
+                if not cached_result.success:
+                    # Negative entries just expire; they are never refreshed
+                    self._stats["negative_hits"] += 1
+                elif self._is_stale(cached_result):
+                    self._stats["stale_hits"] += 1
+                    freshness = Freshness.STALE
+                    self._schedule_refresh(prompt, schema, cache_key, **kwargs)
+                return cached_result.model_copy(update={"freshness": freshness})
+
+        if not self.coalesce:
+            return await self._enforce_uncached(prompt, schema, cache_key, **kwargs)
+        return await self._join_flight(prompt, schema, cache_key, **kwargs)
+
+    async def _join_flight(
+        self,
+        prompt: str,
+        schema: Any,
+        cache_key: str,
+        **kwargs
+    ) -> EnforcedOutput:
+        """
+        Await the in-flight enforcement for `cache_key`, starting it if needed.
+
+        The shared task is shielded from each caller's cancellation and only
+        cancelled once every caller awaiting it has gone away.
+        """
+        flight = self._in_flight.get(cache_key)
+        if flight is None:
+            self._stats["flights"] += 1
+            flight = _Flight(asyncio.ensure_future(
+                self._enforce_uncached(prompt, schema, cache_key, **kwargs)
+            ))
+            self._in_flight[cache_key] = flight
+            flight.task.add_done_callback(lambda _: self._end_flight(cache_key, flight))
+        else:
+            self._stats["joins"] += 1
+
+        flight.waiters += 1
+        try:
+            result = await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Last caller cancelled: nobody wants the result any more
+                self._end_flight(cache_key, flight)
+                flight.task.cancel()
+        # A private copy, so one caller's changes aren't seen by the others
+        return result.model_copy(deep=True)
+
+    async def _attempt(
+        self,
+        prompt: str,
+        schema: Any,
+        **kwargs
+    ) -> Tuple[GenerationResponse, ValidationResult, int]:
+        """One generation plus validation, hedged when a hedging policy is set."""
+        if self.hedging is None:
+            attempt = await self._attempt_once(prompt, schema, **kwargs)
+        else:
+            # The hedge delay is learned from generation time alone, not validation
+            attempt = await self.hedging.run(
+                lambda: self._attempt_once(prompt, schema, **kwargs),
+                accept=lambda attempt: attempt[1].status == ValidationStatus.VALID,
+                cost=lambda attempt: attempt[0].tokens_used or 0,
+                latency=lambda attempt: attempt[3]
+            )
+        return attempt[:3]
+
+    async def _attempt_once(
+        self,
+        prompt: str,
+        schema: Any,
+        **kwargs
+    ) -> Tuple[GenerationResponse, ValidationResult, int, float]:
+        """Generate and validate once; also returns the seconds spent generating."""
+        started = time.perf_counter()
+        generation, transport_retries = await self._generate(prompt, schema, **kwargs)
+        generate_seconds = time.perf_counter() - started
+        validation = self.validator.validate_and_repair(generation.output, schema)
+        self.adapter.record_validation(generation, validation.status == ValidationStatus.VALID)
+        return generation, validation, transport_retries, generate_seconds
+
+    async def _generate(self, prompt: str, schema: Any, **kwargs) -> Tuple[GenerationResponse, int]:
+        """Call the adapter under the retry policy; returns the response and the transport retries used."""
+        if self.retry_policy is None:
+            return await self.adapter.generate(prompt, schema, **kwargs), 0
+        generation, retries = await self.retry_policy.run(
+            lambda: self.adapter.generate(prompt, schema, **kwargs)
+        )
+        self._stats["transport_retries"] += retries
+        return generation, retries
+
+    def _end_flight(self, cache_key: str, flight: _Flight) -> None:
+        if self._in_flight.get(cache_key) is flight:
+            del self._in_flight[cache_key]
+
+    def _is_stale(self, result: EnforcedOutput) -> bool:
+        if self.soft_ttl is None:
+            return False
+        age = (datetime.now() - result.generation.timestamp).total_seconds()
+        return age > self.soft_ttl
+
+    def _schedule_refresh(self, prompt: str, schema: Any, cache_key: str, **kwargs) -> None:
+        """Regenerate a stale entry in the background, at most once per key at a time."""
+        if cache_key in self._refreshes:
+            return
+        self._stats["refreshes"] += 1
+        task = asyncio.ensure_future(
+            self._enforce_uncached(prompt, schema, cache_key, cache_failure=False, **kwargs)
+        )
+        self._refreshes[cache_key] = task
+
+        def done(task: asyncio.Task) -> None:
+            del self._refreshes[cache_key]
+            if not task.cancelled():
+                # A failed refresh (error or invalid output) leaves the
+                # stale entry until the hard TTL
+                task.exception()
+
+        task.add_done_callback(done)
+
+    async def _cache_get(self, key: str) -> Optional[Any]:
+        if isinstance(self.cache, AsyncBaseCache):
+            return await self.cache.aget(key)
+        return self.cache.get(key)
 
+    async def _cache_set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        ttl = self.hard_ttl if ttl is None else ttl
+        if isinstance(self.cache, AsyncBaseCache):
+            await self.cache.aset(key, value, ttl)
+        else:
+            self.cache.set(key, value, ttl)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get engine statistics.
+
+        Returns:
+            Dict with `requests` (enforce calls), `cache_hits`, `stale_hits`
+            (cache hits past the soft TTL), `negative_hits` (cache hits on a
+            cached failure), `refreshes` (background refreshes
+            started), `flights`
+            (enforcements actually run under coalescing), `joins` (calls that
+            awaited another caller's in-flight enforcement),
+            `transport_retries` (adapter calls retried by the retry policy)
+            and `in_flight`
+        """
+        return {**self._stats, "in_flight": len(self._in_flight)}
+
+    async def _enforce_uncached(
+        self,
+        prompt: str,
+        schema: Any,
+        cache_key: Optional[str],
+        cache_failure: bool = True,
+        **kwargs
+    ) -> EnforcedOutput:
+        """
+        Run the generate/validate/retry loop and cache a successful result.
+
+        A result that fails every retry is cached too when negative caching is
+        enabled and the policy accepts the call; background refreshes pass
+        `cache_failure=False` so a failure never replaces a stale success.
+        """
         retry_count = 0
+        transport_retry_count = 0
         last_validation = None
         
         for attempt in range(self.max_retries + 1):
-            # Generate from LLM
-            generation = await self.adapter.generate(prompt, schema, **kwargs)
-            
-            # Validate and repair
-            validation = self.validator.validate_and_repair(
-                generation.output,
-                schema
-            )
+            # Generate from LLM and validate (hedged if configured)
+            generation, validation, transport_retries = await self._attempt(prompt, schema, **kwargs)
+            transport_retry_count += transport_retries
 
             last_validation = validation
             
@@ -87,11 +332,12 @@ class EnforcementEngine:
                     generation=generation,
                     validation=validation,
                     retry_count=retry_count,
+                    transport_retry_count=transport_retry_count,
                     success=True
                 )
 
                 if self.cache:
-                    self.cache.set(cache_key, result)
+                    await self._cache_set(cache_key, result)
                 
                 return result
 
@@ -117,10 +363,133 @@ class EnforcementEngine:
             })
             
         # All retries failed
-        return EnforcedOutput(
+        result = EnforcedOutput(
             data=None,
             generation=generation,
             validation=last_validation,
             retry_count=retry_count,
+            transport_retry_count=transport_retry_count,
             success=False
-        )
\ No newline at end of file
+        )
+
+        if (
+            self.cache
+            and cache_failure
+            and self.negative_ttl is not None
+            and self.negative_cache_policy(kwargs)
+        ):
+            await self._cache_set(cache_key, result, self.negative_ttl)
+
+        return result
+
+    async def enforce_many(
+        self,
+        prompts: Iterable[str],
+        schema: Any,
+        concurrency: int = 10,
+        **kwargs
+    ) -> List[Union[EnforcedOutput, Exception]]:
+        """
+        Enforce a batch of prompts with a bounded number of requests in flight.
+
+        Each prompt goes through `enforce`, so retries, validation, caching and
+        dataset collection behave exactly as for single calls. Errors are
+        isolated per item: if a prompt raises, the exception is returned in
+        that prompt's slot and the rest of the batch carries on.
+
+        Args:
+            prompts: Prompts to enforce (any iterable, consumed lazily)
+            schema: Schema shared by every prompt
+            concurrency: Maximum number of enforcements running at once
+            **kwargs: Additional arguments passed to `enforce`
+
+        Returns:
+            List[Union[EnforcedOutput, Exception]]: One entry per prompt, in input order
+        """
+        results = []
+        async for _, result in self.enforce_iter(prompts, schema, concurrency=concurrency, ordered=True, **kwargs):
+            results.append(result)
+        return results
+
+    async def enforce_iter(
+        self,
+        prompts: Iterable[str],
+        schema: Any,
+        concurrency: int = 10,
+        ordered: bool = False,
+        **kwargs
+    ) -> AsyncIterator[Tuple[int, Union[EnforcedOutput, Exception]]]:
+        """
+        Enforce a batch of prompts, yielding results as they finish.
+
+        At most `concurrency` enforcements are in flight; a new prompt is only
+        pulled from `prompts` when a slot frees up, so very large (or lazy)
+        inputs never create more than `concurrency` tasks at a time.
+
+        Args:
+            prompts: Prompts to enforce (any iterable, consumed lazily)
+            schema: Schema shared by every prompt
+            concurrency: Maximum number of enforcements running at once
+            ordered: Yield in input order instead of completion order
+            **kwargs: Additional arguments passed to `enforce`
+
+        Yields:
+            Tuple[int, Union[EnforcedOutput, Exception]]: Prompt index and its
+            result, or the exception raised while enforcing it
+
+        Raises:
+            ValueError: If concurrency is less than 1
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+        prompt_iter = enumerate(prompts)
+        exhausted = False
+        pending: Dict[asyncio.Future, int] = {}
+        finished: Dict[int, Union[EnforcedOutput, Exception]] = {}
+        next_index = 0
+
+        try:
+            while True:
+                # Top up the in-flight window
+                while not exhausted and len(pending) < concurrency:
+                    try:
+                        index, prompt = next(prompt_iter)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    task = asyncio.ensure_future(self._enforce_isolated(prompt, schema, **kwargs))
+                    pending[task] = index
+
+                if not pending:
+                    break
+
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=pending.get):
+                    index = pending.pop(task)
+                    if ordered:
+                        finished[index] = task.result()
+                    else:
+                        yield index, task.result()
+
+                while next_index in finished:
+                    yield next_index, finished.pop(next_index)
+                    next_index += 1
+        finally:
+            # Consumer stopped early or was cancelled: don't leak in-flight work
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _enforce_isolated(
+        self,
+        prompt: str,
+        schema: Any,
+        **kwargs
+    ) -> Union[EnforcedOutput, Exception]:
+        """Run `enforce`, returning any exception instead of raising it."""
+        try:
+            return await self.enforce(prompt, schema, **kwargs)
+        except Exception as e:
+            return e
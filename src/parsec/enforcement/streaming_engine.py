@@ -1,9 +1,36 @@
-from parsec.core import BaseLLMAdapter, StreamChunk
-from parsec.utils.partial_json import PartialJSONParser
-from typing import AsyncIterator, Any, Optional
+from parsec.core import (
+    BaseLLMAdapter, GenerationResponse, LightStreamChunk, StreamBuffer, StreamChunk, StreamItem,
+    StreamValidationResult, ValidationResult, ValidationStatus
+)
+from parsec.enforcement.engine import EnforcedOutput
+from parsec.utils.partial_json import PartialJSONParser, IncrementalJSONParser
+from parsec.utils.json_stream import JSONEvent, JSONStreamReader, Path, format_path, parse_selector
+from parsec.validators.base_validator import BaseValidator
+from parsec.validators.json_validator import JSONValidator
+from parsec.validators.schema_utils import standalone_subschema, subschema_at
+from parsec.validators.streaming_validator import StreamingSchemaValidator
+from typing import AsyncIterator, Any, Optional, Tuple, Union
 import time
 
 
+async def _aclose(iterator: AsyncIterator[Any]) -> None:
+    """Close an async iterator if it supports it (plain iterators don't have `aclose`)."""
+    aclose = getattr(iterator, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
+def _to_stream_chunk(chunk: LightStreamChunk) -> StreamChunk:
+    """Copy a light chunk into a pydantic `StreamChunk`."""
+    return StreamChunk(
+        delta=chunk.delta,
+        accumulated=chunk.accumulated,
+        is_complete=chunk.is_complete,
+        provider=chunk.provider,
+        model=chunk.model
+    )
+
+
 class StreamingEngine:
     """
     Engine for streaming structured outputs with progressive validation.
@@ -15,17 +42,26 @@ class StreamingEngine:
     - Completion detection
     """
 
-    def __init__(self, adapter: BaseLLMAdapter):
+    def __init__(
+        self,
+        adapter: BaseLLMAdapter,
+        validator: Optional[BaseValidator] = None,
+        max_retries: int = 3
+    ):
         """
         Initialize the streaming engine.
 
         Args:
             adapter: LLM adapter that supports streaming
+            validator: Validator for streamed values (default: JSONValidator)
+            max_retries: Retry budget for `enforce_stream`
         """
         if not adapter.supports_streaming():
             raise ValueError(f"{adapter.__class__.__name__} does not support streaming")
 
         self.adapter = adapter
+        self.validator = validator or JSONValidator()
+        self.max_retries = max_retries
         self.parser = PartialJSONParser()
 
     async def stream(
@@ -37,6 +73,9 @@ class StreamingEngine:
         """
         Stream structured output from the LLM.
 
+        Every chunk is a pydantic model carrying a full copy of the accumulated
+        text. For many concurrent or very long streams prefer `stream_light`.
+
         Args:
             prompt: The prompt to send to the LLM
             schema: Optional schema for structured output
@@ -45,74 +84,356 @@ class StreamingEngine:
         Yields:
             StreamChunk: Each chunk of the streaming response with accumulated content
         """
-        accumulated = ""
-        start_time = time.time()
+        async for chunk in self.stream_light(prompt, schema, **kwargs):
+            yield _to_stream_chunk(chunk)
 
-        async for delta in self.adapter.generate_stream(prompt, schema, **kwargs):
-            accumulated += delta
+    async def stream_light(
+        self,
+        prompt: str,
+        schema: Optional[Any] = None,
+        delta_only: bool = False,
+        **kwargs
+    ) -> AsyncIterator[LightStreamChunk]:
+        """
+        Stream output with minimal per-token overhead.
 
-            yield StreamChunk(
-                delta=delta,
-                accumulated=accumulated,
-                is_complete=False,
-                provider=self.adapter.provider.value,
-                model=self.adapter.model
-            )
+        Deltas are appended to a list-backed `StreamBuffer`; a chunk's
+        `accumulated` text is only joined if it is read. With `delta_only=True`
+        no accumulated text is kept at all.
+
+        Args:
+            prompt: The prompt to send to the LLM
+            schema: Optional schema for structured output
+            delta_only: Don't track accumulated text
+            **kwargs: Additional arguments to pass to the adapter
+
+        Yields:
+            LightStreamChunk: Each chunk, followed by a final chunk with is_complete=True
+        """
+        buffer = None if delta_only else StreamBuffer()
+        provider = self.adapter.provider.value
+        model = self.adapter.model
+
+        source = self.adapter.generate_stream(prompt, schema, **kwargs)
+        try:
+            async for delta in source:
+                if buffer is not None:
+                    buffer.append(delta)
+                yield LightStreamChunk(delta, buffer, False, provider, model)
+        finally:
+            # Close the provider stream promptly if the consumer stops early
+            await _aclose(source)
 
         # Final chunk marking completion
-        yield StreamChunk(
-            delta="",
-            accumulated=accumulated,
-            is_complete=True,
-            provider=self.adapter.provider.value,
-            model=self.adapter.model
-        )
+        yield LightStreamChunk("", buffer, True, provider, model)
 
     async def stream_with_parsing(
         self,
         prompt: str,
         schema: Optional[Any] = None,
+        light: bool = False,
         **kwargs
-    ) -> AsyncIterator[tuple[StreamChunk, Optional[Any]]]:
+    ) -> AsyncIterator[tuple[Union[StreamChunk, LightStreamChunk], Optional[Any]]]:
         """
         Stream with incremental JSON parsing.
 
+        Each delta is fed to an `IncrementalJSONParser`, so parsing cost per
+        chunk is proportional to the delta rather than the whole response. The
+        parsed value is the parser's live document and is updated in place by
+        later chunks; copy it if you need to keep a snapshot.
+
         Args:
             prompt: The prompt to send to the LLM
             schema: Optional schema for structured output
+            light: Yield `LightStreamChunk`s, as `stream_light` does
             **kwargs: Additional arguments to pass to the adapter
 
         Yields:
             tuple[StreamChunk, Optional[Any]]: Chunk and parsed partial JSON (if parseable)
         """
-        async for chunk in self.stream(prompt, schema, **kwargs):
-            parsed = self.parser.parse(chunk.accumulated)
-            yield chunk, parsed
+        parser = IncrementalJSONParser()
+        async for chunk in self.stream_light(prompt, schema, **kwargs):
+            parser.feed(chunk.delta)
+            yield (chunk if light else _to_stream_chunk(chunk)), parser.value
 
     async def stream_field(
         self,
         prompt: str,
         field_name: str,
         schema: Optional[Any] = None,
+        light: bool = False,
         **kwargs
-    ) -> AsyncIterator[tuple[StreamChunk, Optional[Any]]]:
+    ) -> AsyncIterator[tuple[Union[StreamChunk, LightStreamChunk], Optional[Any]]]:
         """
         Stream and extract a specific field as it becomes available.
 
         Useful for getting specific values before the full response completes.
+        Use `stream_path` for nested fields or to receive only closed values.
 
         Args:
             prompt: The prompt to send to the LLM
             field_name: Name of the field to extract
             schema: Optional schema for structured output
+            light: Yield `LightStreamChunk`s, as `stream_light` does
             **kwargs: Additional arguments to pass to the adapter
 
         Yields:
             tuple[StreamChunk, Optional[Any]]: Chunk and field value (if available)
         """
-        async for chunk in self.stream(prompt, schema, **kwargs):
-            field_value = self.parser.extract_field(chunk.accumulated, field_name)
-            yield chunk, field_value
+        parser = IncrementalJSONParser()
+        async for chunk in self.stream_light(prompt, schema, **kwargs):
+            parser.feed(chunk.delta)
+            parsed = parser.value
+            field_value = parsed.get(field_name) if isinstance(parsed, dict) else None
+            yield (chunk if light else _to_stream_chunk(chunk)), field_value
+
+    async def stream_with_validation(
+        self,
+        prompt: str,
+        schema: Any,
+        stop_on_unrepairable: bool = True,
+        light: bool = False,
+        **kwargs
+    ) -> AsyncIterator[tuple[Union[StreamChunk, LightStreamChunk], StreamValidationResult]]:
+        """
+        Stream while validating the partial document against the schema.
+
+        Wrong types, unexpected properties, enum/const violations on closed
+        scalars and missing required properties are reported as soon as they
+        are written, with status UNREPAIRABLE. The final chunk carries the
+        result of full validation (with repair) of the complete text.
+
+        Args:
+            prompt: The prompt to send to the LLM
+            schema: JSON schema the response must satisfy
+            stop_on_unrepairable: Stop generation as soon as the response is
+                provably invalid, closing the provider stream
+            light: Yield `LightStreamChunk`s, as `stream_light` does
+            **kwargs: Additional arguments to pass to the adapter
+
+        Yields:
+            tuple[StreamChunk, StreamValidationResult]: Chunk and validation state so far
+        """
+        checker = StreamingSchemaValidator(schema)
+        stream = self.stream_light(prompt, schema, **kwargs)
+        try:
+            async for chunk in stream:
+                out = chunk if light else _to_stream_chunk(chunk)
+                if chunk.is_complete:
+                    final = self.validator.validate_and_repair(chunk.accumulated, schema)
+                    yield out, StreamValidationResult(
+                        status=final.status,
+                        parsed_output=final.parsed_output,
+                        errors=final.errors,
+                        is_partial=False,
+                        accumulated_text=chunk.accumulated
+                    )
+                    return
+
+                checker.feed(chunk.delta)
+                yield out, checker.result(chunk.accumulated)
+                if stop_on_unrepairable and checker.is_unrepairable:
+                    return
+        finally:
+            await _aclose(stream)
+
+    async def stream_events(
+        self,
+        prompt: str,
+        schema: Optional[Any] = None,
+        **kwargs
+    ) -> AsyncIterator[JSONEvent]:
+        """
+        Stream structural JSON events (SAX-style) as tokens arrive.
+
+        Args:
+            prompt: The prompt to send to the LLM
+            schema: Optional schema for structured output
+            **kwargs: Additional arguments to pass to the adapter
+
+        Yields:
+            JSONEvent: start/end object and array, key and scalar value events
+        """
+        reader = JSONStreamReader()
+        async for chunk in self.stream_light(prompt, schema, delta_only=True, **kwargs):
+            for event in reader.feed(chunk.delta):
+                yield event
+
+    async def stream_path(
+        self,
+        prompt: str,
+        selector: str,
+        schema: Optional[Any] = None,
+        **kwargs
+    ) -> AsyncIterator[tuple[Path, Any]]:
+        """
+        Stream values matching a JSONPath-like selector as soon as each one closes.
+
+        Args:
+            prompt: The prompt to send to the LLM
+            selector: Selector such as `items[*].title` or `user.profile`
+            schema: Optional schema for structured output
+            **kwargs: Additional arguments to pass to the adapter
+
+        Yields:
+            tuple[Path, Any]: Concrete path (e.g. `("items", 3, "title")`) and complete value
+        """
+        reader = JSONStreamReader(emit_events=False)
+        matches = []
+        reader.subscribe(selector, lambda path, value: matches.append((path, value)))
+
+        async for chunk in self.stream_light(prompt, schema, delta_only=True, **kwargs):
+            reader.feed(chunk.delta)
+            if matches:
+                ready, matches[:] = list(matches), []
+                for match in ready:
+                    yield match
+
+    async def stream_items(
+        self,
+        prompt: str,
+        schema: Optional[Any] = None,
+        array_path: str = "$",
+        **kwargs
+    ) -> AsyncIterator[StreamItem]:
+        """
+        Stream the elements of an array one by one as each element closes.
+
+        Every element is yielded exactly once, while generation continues, so
+        downstream work can start on the first item before the last is written.
+        When a schema is given, each element is validated against the array's
+        `items` subschema.
+
+        Args:
+            prompt: The prompt to send to the LLM
+            schema: Optional JSON schema for the whole response
+            array_path: Selector for the array, e.g. `items` or `data.results` (`$` for a root array)
+            **kwargs: Additional arguments to pass to the adapter
+
+        Yields:
+            StreamItem: Index, path, element data and its validation result
+
+        Raises:
+            ValueError: If the schema doesn't describe an array at array_path
+        """
+        element_schema = None
+        if isinstance(schema, dict):
+            path = parse_selector(array_path)
+            array_schema = subschema_at(schema, path)
+            types = array_schema.get("type", "array") if isinstance(array_schema, dict) else None
+            # A list of types (e.g. ["array", "null"]) only needs to allow arrays
+            if not (types == "array" or isinstance(types, list) and "array" in types):
+                raise ValueError(f"Schema does not describe an array at {array_path!r}")
+            element_schema = subschema_at(schema, path + (0,))
+            element_schema = None if element_schema is True else standalone_subschema(schema, element_schema)
+
+        reader = JSONStreamReader(emit_events=False)
+        closed = []
+        reader.subscribe(f"{array_path}[*]", lambda path, value: closed.append((path, value)))
+
+        async for chunk in self.stream_light(prompt, schema, delta_only=True, **kwargs):
+            reader.feed(chunk.delta)
+            if not closed:
+                continue
+            ready, closed[:] = list(closed), []
+            for path, value in ready:
+                validation = None
+                if element_schema is not None:
+                    validation = self.validator.validate_parsed(value, element_schema)
+                yield StreamItem(
+                    index=path[-1],
+                    path=format_path(path),
+                    data=value,
+                    validation=validation
+                )
+
+    async def enforce_stream(
+        self,
+        prompt: str,
+        schema: Any,
+        **kwargs
+    ) -> EnforcedOutput:
+        """
+        Generate and validate output with retries, aborting bad attempts early.
+
+        Each attempt is streamed and checked against the schema as tokens
+        arrive. As soon as the output is provably invalid the provider stream
+        is closed and the next attempt starts with the error feedback, the same
+        way `EnforcementEngine.enforce` retries. Attempts that finish are
+        validated (with repair) in full.
+
+        Args:
+            prompt: The prompt to send to the LLM
+            schema: JSON schema (or pydantic model) the output must satisfy
+            **kwargs: Additional arguments to pass to the adapter
+
+        Returns:
+            EnforcedOutput: Result of the last attempt
+        """
+        retry_count = 0
+
+        for attempt in range(self.max_retries + 1):
+            generation, validation = await self._generate_checked(prompt, schema, **kwargs)
+
+            if validation.status == ValidationStatus.VALID:
+                return EnforcedOutput(
+                    data=validation.parsed_output,
+                    generation=generation,
+                    validation=validation,
+                    retry_count=retry_count,
+                    success=True
+                )
+
+            # Add errors to next prompt
+            if attempt < self.max_retries:
+                error_msg = "\n".join(e.message for e in validation.errors)
+                prompt = f"{prompt}\n\nPrevious attempt had errors:\n{error_msg}"
+                retry_count += 1
+
+        # All retries failed
+        return EnforcedOutput(
+            data=None,
+            generation=generation,
+            validation=validation,
+            retry_count=retry_count,
+            success=False
+        )
+
+    async def _generate_checked(
+        self,
+        prompt: str,
+        schema: Any,
+        **kwargs
+    ) -> Tuple[GenerationResponse, ValidationResult]:
+        """Stream one attempt, stopping as soon as it can no longer be valid."""
+        start = time.perf_counter()
+        checker = StreamingSchemaValidator(schema)
+        stream = self.stream_light(prompt, schema, **kwargs)
+        try:
+            async for chunk in stream:
+                checker.feed(chunk.delta)
+                if checker.is_unrepairable:
+                    break
+        finally:
+            await _aclose(stream)
+
+        output = chunk.accumulated
+        generation = GenerationResponse(
+            output=output,
+            provider=chunk.provider,
+            model=chunk.model,
+            latency_ms=(time.perf_counter() - start) * 1000
+        )
+        if checker.is_unrepairable:
+            validation = ValidationResult(
+                status=ValidationStatus.UNREPAIRABLE,
+                parsed_output=checker.value,
+                errors=list(checker.errors),
+                raw_output=output
+            )
+        else:
+            validation = self.validator.validate_and_repair(output, schema)
+        return generation, validation
 
     async def collect_stream(
         self,
@@ -132,7 +453,7 @@ class StreamingEngine:
             str: Complete accumulated response
         """
         final_chunk = None
-        async for chunk in self.stream(prompt, schema, **kwargs):
+        async for chunk in self.stream_light(prompt, schema, **kwargs):
             final_chunk = chunk
 
         return final_chunk.accumulated if final_chunk else ""
@@ -4,6 +4,7 @@ if TYPE_CHECKING:
     from .openai_adapter import OpenAIAdapter
     from .anthropic_adapter import AnthropicAdapter
     from .gemini_adapter import GeminiAdapter
+    from .fallback_adapter import FallbackAdapter
 
 def __getattr__(name: str):
     """Lazy import adapters to avoid requiring all dependencies."""
@@ -16,6 +17,9 @@ def __getattr__(name: str):
     elif name == "GeminiAdapter":
         from .gemini_adapter import GeminiAdapter
         return GeminiAdapter
+    elif name == "FallbackAdapter":
+        from .fallback_adapter import FallbackAdapter
+        return FallbackAdapter
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-__all__ = ["OpenAIAdapter", "AnthropicAdapter", "GeminiAdapter"]
+__all__ = ["OpenAIAdapter", "AnthropicAdapter", "GeminiAdapter", "FallbackAdapter"]
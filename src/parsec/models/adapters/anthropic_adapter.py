@@ -28,7 +28,6 @@ class AnthropicAdapter(BaseLLMAdapter):
                         max_tokens=None, **kwargs) -> GenerationResponse:
             if max_tokens is None:
                 max_tokens = 4096
-            start = time.perf_counter()
 
             self.logger.info(f"Generating response from Anthropic model {self.model}", extra={
                 "model": self.model,
@@ -60,7 +59,10 @@ class AnthropicAdapter(BaseLLMAdapter):
             client = self.get_client()
 
             try:
-                response = await client.messages.create(**message_params)
+                async with self._guard(message_params["messages"][0]["content"], max_tokens) as call:
+                    start = time.perf_counter()  # time the provider, not the rate-limit wait
+                    response = await client.messages.create(**message_params)
+                    call.tokens_used = response.usage.input_tokens + response.usage.output_tokens
 
                 # Extract text from content blocks
                 output = ""
@@ -118,9 +120,10 @@ class AnthropicAdapter(BaseLLMAdapter):
 
         client = self.get_client()
 
-        async with client.messages.stream(**message_params) as stream:
-            async for text in stream.text_stream:
-                yield text
+        async with self._guard(message_params["messages"][0]["content"], max_tokens, streaming=True):
+            async with client.messages.stream(**message_params) as stream:
+                async for text in stream.text_stream:
+                    yield text
 
     async def health_check(self) -> bool:
         """Check if the Anthropic API is accessible and credentials are valid."""
@@ -0,0 +1,358 @@
+"""
+Composite adapter that load-balances and fails over between backends.
+
+`FallbackAdapter` wraps several adapters (e.g. OpenAI, Anthropic and a local
+Ollama model) behind the `BaseLLMAdapter` interface, so an `EnforcementEngine`
+can use it unchanged. Each call is routed to the best available backend and
+retried on the next one if it raises. Backends that keep failing, or whose
+output keeps failing validation, are ejected for a while and only re-admitted
+once their (cached) `health_check()` passes.
+
+Example:
+    >>> adapter = FallbackAdapter(
+    ...     [(OpenAIAdapter(api_key=..., model="gpt-4o-mini"), 3), AnthropicAdapter(api_key=..., model="claude-3-5-haiku-latest")],
+    ...     strategy="least_outstanding",
+    ... )
+    >>> engine = EnforcementEngine(adapter, JSONValidator())
+"""
+
+import asyncio
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from parsec.core import BaseLLMAdapter, GenerationResponse
+from parsec.logging import get_logger
+
+STRATEGIES = ("priority", "least_outstanding", "latency")
+
+# Responses remembered so `record_validation` can credit the backend that produced them
+_MAX_ORIGINS = 1024
+
+
+class _Backend:
+    """Routing and health state for one wrapped adapter."""
+
+    __slots__ = (
+        "adapter", "weight", "index", "outstanding", "latency", "sampled_at", "probed_at",
+        "requests", "failures", "invalid", "consecutive_failures", "consecutive_invalid",
+        "ejected_until", "ejections", "checked_at", "healthy"
+    )
+
+    def __init__(self, adapter: BaseLLMAdapter, weight: float, index: int):
+        self.adapter = adapter
+        self.weight = weight
+        self.index = index
+        self.outstanding = 0
+        self.latency: Optional[float] = None  # EWMA of successful calls, seconds
+        self.sampled_at: Optional[float] = None
+        self.probed_at: Optional[float] = None
+        self.requests = 0
+        self.failures = 0
+        self.invalid = 0
+        self.consecutive_failures = 0
+        self.consecutive_invalid = 0
+        self.ejected_until: Optional[float] = None
+        self.ejections = 0
+        self.checked_at: Optional[float] = None
+        self.healthy = True
+
+    @property
+    def name(self) -> str:
+        return f"{self.index}:{self.adapter.model}"
+
+
+class FallbackAdapter(BaseLLMAdapter):
+    """
+    Route calls across several adapters with failover and outlier ejection.
+
+    Strategies:
+        - "priority": the first available backend in the given order
+        - "least_outstanding": fewest calls in flight per unit of weight
+        - "latency": lowest latency average (EWMA) per unit of weight;
+          backends without samples are tried first, and a backend whose
+          average is older than `latency_probe_interval` gets one call to
+          refresh it, so a recovered backend is noticed
+    """
+
+    def __init__(
+        self,
+        adapters: Sequence[Union[BaseLLMAdapter, Tuple[BaseLLMAdapter, float]]],
+        strategy: str = "priority",
+        failure_threshold: int = 3,
+        invalid_threshold: int = 5,
+        ejection_time: float = 30.0,
+        health_check_ttl: float = 30.0,
+        health_check_timeout: float = 5.0,
+        smoothing: float = 0.2,
+        latency_probe_interval: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        **kwargs
+    ):
+        """
+        Initialize the adapter.
+
+        Args:
+            adapters: Backends in priority order, each optionally paired with
+                a weight (default 1.0) as `(adapter, weight)`
+            strategy: "priority", "least_outstanding" or "latency"
+            failure_threshold: Consecutive errors that eject a backend
+            invalid_threshold: Consecutive outputs failing validation that
+                eject a backend (reported by `EnforcementEngine`)
+            ejection_time: Seconds an ejected backend sits out before its
+                health is checked again
+            health_check_ttl: Seconds a `health_check()` result is reused
+            health_check_timeout: Seconds before a health check counts as failed
+            smoothing: Weight of each new sample in the latency average
+            latency_probe_interval: Seconds after which a backend's latency
+                average is stale and the "latency" strategy probes it again
+            clock: Monotonic time source in seconds
+        """
+        if not adapters:
+            raise ValueError("FallbackAdapter needs at least one adapter")
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown strategy {strategy!r}; expected one of {STRATEGIES}")
+
+        backends = []
+        for index, entry in enumerate(adapters):
+            adapter, weight = entry if isinstance(entry, tuple) else (entry, 1.0)
+            if weight <= 0:
+                raise ValueError("Adapter weights must be positive")
+            backends.append(_Backend(adapter, float(weight), index))
+
+        super().__init__(api_key=None, model="|".join(b.adapter.model for b in backends), **kwargs)
+        self.backends = backends
+        self.strategy = strategy
+        self.failure_threshold = failure_threshold
+        self.invalid_threshold = invalid_threshold
+        self.ejection_time = ejection_time
+        self.health_check_ttl = health_check_ttl
+        self.health_check_timeout = health_check_timeout
+        self.smoothing = smoothing
+        self.latency_probe_interval = latency_probe_interval
+        self._clock = clock
+        # Keyed by id(); the weak reference tells a reused id from the original response
+        self._origins: "OrderedDict[int, Tuple[weakref.ref, _Backend]]" = OrderedDict()
+        self._failovers = 0
+        self.logger = get_logger(__name__)
+
+    @property
+    def provider(self):
+        return self.backends[0].adapter.provider
+
+    def supports_native_structure_output(self) -> bool:
+        return all(b.adapter.supports_native_structure_output() for b in self.backends)
+
+    def supports_streaming(self) -> bool:
+        return any(b.adapter.supports_streaming() for b in self.backends)
+
+    async def generate(self, prompt: str, schema=None, temperature=0.7,
+                       max_tokens=None, **kwargs) -> GenerationResponse:
+        """Generate with the best available backend, failing over to the others on errors."""
+        last_error: Optional[Exception] = None
+        for attempt, backend in enumerate(await self._route()):
+            if attempt:
+                self._failovers += 1
+            backend.outstanding += 1
+            backend.requests += 1
+            start = self._clock()
+            try:
+                response = await backend.adapter.generate(
+                    prompt, schema, temperature=temperature, max_tokens=max_tokens, **kwargs
+                )
+            except Exception as e:
+                last_error = e
+                self._record_failure(backend, e)
+                continue
+            finally:
+                backend.outstanding -= 1
+
+            self._record_success(backend, self._clock() - start)
+            self._remember(response, backend)
+            return response
+
+        raise last_error
+
+    async def generate_stream(self, prompt: str, schema=None, temperature=0.7,
+                              max_tokens=None, **kwargs) -> AsyncIterator[str]:
+        """
+        Stream from the best available backend.
+
+        Fails over only until the first chunk arrives; after that an error
+        propagates, since the consumer has already seen partial output.
+        """
+        last_error: Optional[Exception] = None
+        candidates = [b for b in await self._route() if b.adapter.supports_streaming()]
+        for attempt, backend in enumerate(candidates):
+            if attempt:
+                self._failovers += 1
+            backend.outstanding += 1
+            backend.requests += 1
+            stream = backend.adapter.generate_stream(
+                prompt, schema, temperature=temperature, max_tokens=max_tokens, **kwargs
+            )
+            try:
+                try:
+                    first = await stream.__anext__()
+                except StopAsyncIteration:
+                    self._record_success(backend, None)
+                    return
+                except Exception as e:
+                    last_error = e
+                    self._record_failure(backend, e)
+                    continue
+
+                yield first
+                async for chunk in stream:
+                    yield chunk
+                self._record_success(backend, None)
+                return
+            finally:
+                backend.outstanding -= 1
+                aclose = getattr(stream, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+
+        if last_error is None:
+            raise NotImplementedError("No backend of this FallbackAdapter supports streaming")
+        raise last_error
+
+    def record_validation(self, generation: GenerationResponse, valid: bool) -> None:
+        """Count a validated output against the backend that produced it."""
+        origin = self._origins.pop(id(generation), None)
+        if origin is None or origin[0]() is not generation:
+            return
+        backend = origin[1]
+        if valid:
+            backend.consecutive_invalid = 0
+            return
+        backend.invalid += 1
+        backend.consecutive_invalid += 1
+        if backend.consecutive_invalid >= self.invalid_threshold:
+            self._eject(backend, "repeated validation failures")
+
+    async def health_check(self) -> bool:
+        """Whether at least one backend is available."""
+        return any([await self._is_available(b) for b in self.backends])
+
+    # Routing
+
+    async def _route(self) -> List[_Backend]:
+        """Available backends in the order they should be tried."""
+        available = [b for b in self.backends if await self._is_available(b)]
+        if not available:
+            # Everything is ejected: trying beats failing outright
+            available = list(self.backends)
+
+        if self.strategy == "least_outstanding":
+            available.sort(key=lambda b: (b.outstanding / b.weight, b.index))
+        elif self.strategy == "latency":
+            now = self._clock()
+            stale = [
+                b for b in available
+                if b.latency is not None
+                and now - max(b.sampled_at, b.probed_at or b.sampled_at) >= self.latency_probe_interval
+            ]
+            available.sort(key=lambda b: ((b.latency or 0.0) / b.weight, b.index))
+            if stale:
+                # One call refreshes the stalest average; the rest keep the best backend
+                probe = min(stale, key=lambda b: b.sampled_at)
+                probe.probed_at = now
+                available.remove(probe)
+                available.insert(0, probe)
+        return available
+
+    async def _is_available(self, backend: _Backend) -> bool:
+        if backend.ejected_until is None:
+            return True
+        now = self._clock()
+        if now < backend.ejected_until:
+            return False
+        if backend.checked_at is None or now - backend.checked_at >= self.health_check_ttl:
+            # Concurrent callers see the previous result until this check finishes
+            backend.checked_at = now
+            backend.healthy = await self._check(backend)
+        if not backend.healthy:
+            backend.ejected_until = self._clock() + self.ejection_time
+            return False
+
+        backend.ejected_until = None
+        backend.consecutive_failures = 0
+        backend.consecutive_invalid = 0
+        self.logger.info(f"Re-admitted backend {backend.name}")
+        return True
+
+    async def _check(self, backend: _Backend) -> bool:
+        check = getattr(backend.adapter, "health_check", None)
+        if check is None:
+            return True
+        try:
+            return bool(await asyncio.wait_for(check(), timeout=self.health_check_timeout))
+        except Exception as e:
+            self.logger.debug(f"Health check of {backend.name} failed: {e}")
+            return False
+
+    # Bookkeeping
+
+    def _record_success(self, backend: _Backend, latency: Optional[float]) -> None:
+        backend.consecutive_failures = 0
+        if latency is None:
+            return
+        now = self._clock()
+        if backend.latency is None or now - backend.sampled_at >= self.latency_probe_interval:
+            # A stale average says nothing about the backend now
+            backend.latency = latency
+        else:
+            backend.latency += self.smoothing * (latency - backend.latency)
+        backend.sampled_at = now
+
+    def _record_failure(self, backend: _Backend, error: Exception) -> None:
+        self.logger.warning(f"Backend {backend.name} failed: {error}")
+        backend.failures += 1
+        backend.consecutive_failures += 1
+        if backend.consecutive_failures >= self.failure_threshold:
+            self._eject(backend, "repeated errors")
+
+    def _eject(self, backend: _Backend, reason: str) -> None:
+        if backend.ejected_until is not None:
+            return
+        self.logger.warning(f"Ejecting backend {backend.name} for {self.ejection_time}s: {reason}")
+        backend.ejected_until = self._clock() + self.ejection_time
+        backend.checked_at = None  # force a fresh health check on re-admission
+        backend.healthy = False
+        backend.ejections += 1
+
+    def _remember(self, response: GenerationResponse, backend: _Backend) -> None:
+        self._origins[id(response)] = (weakref.ref(response), backend)
+        if len(self._origins) > _MAX_ORIGINS:
+            self._origins.popitem(last=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get routing statistics.
+
+        Returns:
+            Dict with `failovers` (calls retried on another backend) and a
+            `backends` list with each backend's `model`, `weight`,
+            `outstanding` calls, `latency_ms` average, `requests`,
+            `failures`, `invalid` outputs, `ejections` and whether it is
+            currently `ejected`
+        """
+        return {
+            "failovers": self._failovers,
+            "backends": [
+                {
+                    "model": b.adapter.model,
+                    "weight": b.weight,
+                    "outstanding": b.outstanding,
+                    "latency_ms": b.latency * 1000 if b.latency is not None else None,
+                    "requests": b.requests,
+                    "failures": b.failures,
+                    "invalid": b.invalid,
+                    "ejections": b.ejections,
+                    "ejected": b.ejected_until is not None,
+                }
+                for b in self.backends
+            ],
+        }
@@ -51,7 +51,6 @@ class GeminiAdapter(BaseLLMAdapter):
         Returns:
             GenerationResponse with the generated content
         """
-        start = time.perf_counter()
         client = self.get_client()
 
         self.logger.info(f"Generating response from Gemini model {self.model}", extra={
@@ -79,21 +78,24 @@ class GeminiAdapter(BaseLLMAdapter):
         generation_config.update(kwargs)
 
         try:
-            # Generate response
-            response = await client.generate_content_async(
-                prompt,
-                generation_config=generation_config
-            )
+            async with self._guard(prompt, max_tokens) as call:
+                start = time.perf_counter()  # time the provider, not the rate-limit wait
+                # Generate response
+                response = await client.generate_content_async(
+                    prompt,
+                    generation_config=generation_config
+                )
 
-            latency = (time.perf_counter() - start) * 1000
+                latency = (time.perf_counter() - start) * 1000
 
-            # Extract token usage (Gemini provides token counts)
-            tokens_used = 0
-            if hasattr(response, 'usage_metadata'):
-                tokens_used = (
-                    response.usage_metadata.prompt_token_count +
-                    response.usage_metadata.candidates_token_count
-                )
+                # Extract token usage (Gemini provides token counts)
+                tokens_used = 0
+                if hasattr(response, 'usage_metadata'):
+                    tokens_used = (
+                        response.usage_metadata.prompt_token_count +
+                        response.usage_metadata.candidates_token_count
+                    )
+                    call.tokens_used = tokens_used
             self.logger.debug(f"Success: {tokens_used} tokens")
             return GenerationResponse(
                 output=response.text,
@@ -149,16 +151,17 @@ class GeminiAdapter(BaseLLMAdapter):
 
         generation_config.update(kwargs)
 
-        # Stream response
-        response = await client.generate_content_async(
-            prompt,
-            generation_config=generation_config,
-            stream=True
-        )
+        async with self._guard(prompt, max_tokens, streaming=True):
+            # Stream response
+            response = await client.generate_content_async(
+                prompt,
+                generation_config=generation_config,
+                stream=True
+            )
 
-        async for chunk in response:
-            if chunk.text:
-                yield chunk.text
+            async for chunk in response:
+                if chunk.text:
+                    yield chunk.text
 
     async def health_check(self) -> bool:
         """
@@ -30,7 +30,6 @@ class OllamaAdapter(BaseLLMAdapter):
     
     async def generate(self, prompt: str, schema=None, temperature=0.7,
                         max_tokens=None, **kwargs) -> GenerationResponse: 
-        start = time.perf_counter()  
         self.logger.info(f"Generating with Ollama model {self.model}")
         client = self.get_client() 
         
@@ -53,13 +52,16 @@ class OllamaAdapter(BaseLLMAdapter):
         # Make HTTP request
         url = f"{self.base_url}/api/generate"
         try:
-            async with client.post(url, json=payload) as resp:
-                data = await resp.json()
-                output = data["response"]  # Extract text
-                tokens_used = (
-                data.get("prompt_eval_count", 0) + 
-                data.get("eval_count", 0)
-            )
+            async with self._guard(prompt, max_tokens) as call:
+                start = time.perf_counter()  # time the provider, not the rate-limit wait
+                async with client.post(url, json=payload) as resp:
+                    data = await resp.json()
+                    output = data["response"]  # Extract text
+                    tokens_used = (
+                    data.get("prompt_eval_count", 0) + 
+                    data.get("eval_count", 0)
+                )
+                call.tokens_used = tokens_used
                 
                         # Calculate latency
             latency = (time.perf_counter() - start) * 1000
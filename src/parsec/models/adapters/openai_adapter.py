@@ -28,7 +28,6 @@ class OpenAIAdapter(BaseLLMAdapter):
     async def generate(self, prompt: str, schema=None, temperature=0.7,
                       max_tokens=None, **kwargs) -> GenerationResponse:
         client = self.get_client()
-        start = time.perf_counter()
 
         self.logger.info(f"Generating response from OpenAI model {self.model}", extra={
             "model": self.model,
@@ -44,14 +43,17 @@ class OpenAIAdapter(BaseLLMAdapter):
             # Add schema to prompt
             messages[0]["content"] = f"{prompt}\n\nReturn valid JSON matching this schema: {json.dumps(schema)}"
         try:
-            response = await client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                **extra_args,
-                **kwargs
-            )
+            async with self._guard(messages[0]["content"], max_tokens) as call:
+                start = time.perf_counter()  # time the provider, not the rate-limit wait
+                response = await client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    **extra_args,
+                    **kwargs
+                )
+                call.tokens_used = response.usage.total_tokens
             latency = (time.perf_counter() - start) * 1000
             self.logger.debug(f"Success: {response.usage.total_tokens} tokens")
 
@@ -87,19 +89,24 @@ class OpenAIAdapter(BaseLLMAdapter):
             extra_args["response_format"] = {"type": "json_object"}
             messages[0]["content"] = f"{prompt}\n\nReturn valid JSON matching this schema: {json.dumps(schema)}"
 
-        stream = await client.chat.completions.create(
-            model=self.model,
-            messages=messages,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            stream=True,
-            **extra_args,
-            **kwargs
-        )
-
-        async for chunk in stream:
-            if chunk.choices[0].delta.content:
-                yield chunk.choices[0].delta.content
+        async with self._guard(messages[0]["content"], max_tokens, streaming=True):
+            stream = await client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+                **extra_args,
+                **kwargs
+            )
+
+            try:
+                async for chunk in stream:
+                    if chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+            finally:
+                # Release the HTTP connection if the consumer stops early
+                await stream.close()
 
     async def health_check(self) -> bool:
         try:
@@ -0,0 +1,15 @@
+"""Flow control for provider calls: rate limiting, adaptive concurrency, retries and hedging."""
+
+from .concurrency import AdaptiveConcurrencyLimiter
+from .hedging import HedgingPolicy
+from .rate_limiter import RateLimiter, TokenBucket
+from .retry import RetryPolicy, is_transient
+
+__all__ = [
+    "AdaptiveConcurrencyLimiter",
+    "HedgingPolicy",
+    "RateLimiter",
+    "RetryPolicy",
+    "TokenBucket",
+    "is_transient",
+]
@@ -0,0 +1,192 @@
+"""
+Adaptive (AIMD) concurrency limiting for provider calls.
+
+`AdaptiveConcurrencyLimiter` caps the number of calls in flight and tunes the
+cap the way TCP congestion control tunes its window: every `limit` healthy
+calls raise it by one (additive increase), while an overload signal - a 429,
+503 or 529 response, a timeout, or a latency spike well above the recent
+average - cuts it by `decrease_factor` (multiplicative decrease), at most once
+per round trip.
+
+Example:
+    >>> limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=64)
+    >>> adapter = OpenAIAdapter(api_key=..., model="gpt-4o-mini", concurrency_limiter=limiter)
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+from .retry import error_status
+
+# Statuses that mean "you are sending too much", as opposed to a bad request
+OVERLOAD_STATUSES = frozenset({429, 503, 529})
+
+
+def is_overload(error: BaseException) -> bool:
+    """Whether `error` signals that the provider is saturated."""
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError)):
+        return True
+    status = error_status(error)
+    if status is not None:
+        return status in OVERLOAD_STATUSES
+    return any("Timeout" in cls.__name__ for cls in type(error).__mro__)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    In-flight call limit that grows additively and shrinks multiplicatively.
+
+    Waiters are admitted in arrival order as slots free up or the limit grows.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        decrease_factor: float = 0.5,
+        latency_spike_ratio: float = 2.0,
+        smoothing: float = 0.1,
+        warmup: int = 10,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial_limit: Starting number of calls allowed in flight
+            min_limit: Lower bound for the limit
+            max_limit: Upper bound for the limit
+            decrease_factor: Multiplier applied to the limit on overload
+            latency_spike_ratio: A call slower than this multiple of the
+                latency average counts as overload
+            smoothing: Weight of each new sample in the latency average (EWMA)
+            warmup: Successful calls to observe before latency spikes count
+            clock: Monotonic time source in seconds
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Expected 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_spike_ratio = latency_spike_ratio
+        self.smoothing = smoothing
+        self.warmup = warmup
+        self._clock = clock
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+        self._latency: Optional[float] = None
+        self._samples = 0
+        self._last_decrease = float("-inf")
+        self._stats = {"admitted": 0, "increases": 0, "decreases": 0}
+
+    @property
+    def limit(self) -> int:
+        """Current number of calls allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Calls currently holding a slot."""
+        return self._in_flight
+
+    async def acquire(self) -> None:
+        """Wait for a free slot and take it. Pair every call with `release`."""
+        if not self._waiters and self._in_flight < self.limit:
+            self._in_flight += 1
+            self._stats["admitted"] += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # A slot was handed over just as we were cancelled; pass it on
+                self._in_flight -= 1
+                self._wake()
+            else:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            raise
+        self._stats["admitted"] += 1
+
+    def release(self, latency: Optional[float] = None, error: Optional[BaseException] = None) -> None:
+        """
+        Free a slot and feed the outcome of the call into the limit.
+
+        Args:
+            latency: Seconds the call took, or None when it says nothing about
+                provider health (cancelled, or a stream paced by its consumer)
+            error: The exception the call raised, if any
+        """
+        self._in_flight -= 1
+        if error is not None:
+            if is_overload(error):
+                self._decrease()
+        elif latency is not None:
+            self._observe(latency)
+        self._wake()
+
+    def _observe(self, latency: float) -> None:
+        spike = False
+        if self._latency is None:
+            self._latency = latency
+        else:
+            spike = self._samples >= self.warmup and latency > self._latency * self.latency_spike_ratio
+            # Spikes still move the average, so a lasting slowdown becomes the new normal
+            self._latency += self.smoothing * (latency - self._latency)
+        self._samples += 1
+        if spike:
+            self._decrease()
+            return
+
+        if self._limit < self.max_limit:
+            # +1 per window of `limit` healthy calls
+            before = self.limit
+            self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+            if self.limit > before:
+                self._stats["increases"] += 1
+
+    def _decrease(self) -> None:
+        now = self._clock()
+        # At most one cut per round trip: calls already in flight when we cut
+        # would otherwise report the same overload again
+        if now - self._last_decrease < (self._latency or 0.0):
+            return
+        self._last_decrease = now
+        self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+        self._stats["decreases"] += 1
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get limiter metrics.
+
+        Returns:
+            Dict with the current `limit`, `in_flight` and `queued` calls,
+            `latency_ms` (moving average of healthy calls, None before the
+            first), and counters `admitted`, `increases` and `decreases`
+        """
+        return {
+            **self._stats,
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "queued": len(self._waiters),
+            "latency_ms": self._latency * 1000 if self._latency is not None else None,
+        }
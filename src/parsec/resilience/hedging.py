@@ -0,0 +1,173 @@
+"""
+Hedged requests for tail latency.
+
+`HedgingPolicy` starts a duplicate of a call that is still running after a
+percentile of recently observed latencies (p90 by default), returns whichever
+copy produces an acceptable result first and cancels the other. Hedges are
+capped at a fraction of all calls, which bounds the extra provider cost.
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class HedgingPolicy:
+    """
+    Fire a backup call when the first one is slower than usual.
+
+    The hedge delay adapts to the observed latency distribution; until
+    `min_samples` calls have completed no hedges are sent.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.9,
+        max_hedge_rate: float = 0.1,
+        min_delay: float = 0.0,
+        min_samples: int = 20,
+        window: int = 200
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            percentile: Latency percentile (0-1) after which a hedge is sent
+            max_hedge_rate: Largest share of calls that may be hedged
+            min_delay: Never hedge sooner than this many seconds
+            min_samples: Completed calls to observe before hedging starts
+            window: Number of recent latencies the percentile is taken over
+        """
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        self.percentile = percentile
+        self.max_hedge_rate = max_hedge_rate
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._stats = {"calls": 0, "hedges": 0, "hedge_wins": 0, "cancelled": 0, "wasted_tokens": 0}
+
+    def delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, or None while there is too little data."""
+        if len(self._latencies) < max(self.min_samples, 1):
+            return None
+        ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, int(self.percentile * len(ordered)))
+        return max(self.min_delay, ordered[index])
+
+    def record(self, latency: float) -> None:
+        """Add an observed call latency (seconds) to the window."""
+        self._latencies.append(latency)
+
+    def _allow_hedge(self) -> bool:
+        return self._stats["hedges"] < self.max_hedge_rate * self._stats["calls"]
+
+    async def run(
+        self,
+        call: Callable[[], Awaitable[T]],
+        accept: Callable[[T], bool] = lambda result: True,
+        cost: Callable[[T], int] = lambda result: 0,
+        latency: Optional[Callable[[T], float]] = None
+    ) -> T:
+        """
+        Await `call()`, hedging it with a second `call()` if it runs long.
+
+        Args:
+            call: Zero-argument function returning a fresh awaitable per copy
+            accept: Whether a result is good enough to win (e.g. it validated);
+                if neither copy is accepted the first result is returned
+            cost: Tokens spent by a result, counted as wasted when it loses
+            latency: Seconds of a result's call that the hedge delay should
+                learn from, e.g. the provider call without post-processing
+                (default: the whole call)
+
+        Returns:
+            The winning result
+
+        Raises:
+            The first copy's error when no copy produced a result
+        """
+        self._stats["calls"] += 1
+        loop = asyncio.get_running_loop()
+        started: Dict["asyncio.Future[T]", float] = {}
+
+        def launch() -> "asyncio.Future[T]":
+            task = asyncio.ensure_future(call())
+            started[task] = loop.time()
+            return task
+
+        primary = launch()
+        hedge = None
+        try:
+            delay = self.delay()
+            if delay is not None:
+                done, _ = await asyncio.wait({primary}, timeout=delay)
+                if not done and self._allow_hedge():
+                    self._stats["hedges"] += 1
+                    hedge = launch()
+
+            pending = set(started)
+            finished: List["asyncio.Future[T]"] = []
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Primary first when both finish together
+                for task in sorted(done, key=lambda t: t is not primary):
+                    finished.append(task)
+                    if task.exception() is not None:
+                        continue
+                    elapsed = loop.time() - started[task] if latency is None else latency(task.result())
+                    self.record(elapsed)
+                    if accept(task.result()):
+                        if task is hedge:
+                            self._stats["hedge_wins"] += 1
+                        self._settle(task, started, cost, loop.time())
+                        return task.result()
+
+            # Nothing acceptable: prefer a result over an error
+            fallback = next((t for t in finished if t.exception() is None), finished[0])
+            self._settle(fallback, started, cost, loop.time())
+            return fallback.result()
+        finally:
+            cancelled = [task for task in started if not task.done()]
+            for task in cancelled:
+                task.cancel()
+            # Let the losers finish unwinding before the caller moves on
+            await asyncio.gather(*cancelled, return_exceptions=True)
+
+    def _settle(
+        self,
+        winner: "asyncio.Future[T]",
+        started: Dict["asyncio.Future[T]", float],
+        cost: Callable[[T], int],
+        now: float
+    ) -> None:
+        """Account for the copies that lost to `winner`."""
+        winner_elapsed = now - started[winner]
+        for task, start in started.items():
+            if task is winner:
+                continue
+            if not task.done():
+                # Cancelled by the caller. A copy that has run longer than the
+                # winner shows the tail; one started later was cut off too
+                # early to say anything and is not recorded
+                self._stats["cancelled"] += 1
+                if now - start >= winner_elapsed:
+                    self.record(now - start)
+            elif task.exception() is None:
+                self._stats["wasted_tokens"] += cost(task.result())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get hedging statistics.
+
+        Returns:
+            Dict with `calls`, `hedges` (backup calls sent), `hedge_wins`
+            (backups that beat the original), `cancelled` (losing copies
+            cancelled mid-flight), `wasted_tokens` (tokens of losing copies
+            that completed) and the current hedge `delay_ms` (None while
+            warming up)
+        """
+        delay = self.delay()
+        return {**self._stats, "delay_ms": delay * 1000 if delay is not None else None}
@@ -0,0 +1,209 @@
+"""
+Client-side rate limiting for provider quotas.
+
+`RateLimiter` combines a requests-per-minute and a tokens-per-minute token
+bucket. Callers reserve an estimated token count before a request and settle
+it against the real `tokens_used` afterwards, so the limiter tracks what the
+provider actually bills. Waiters are served strictly in arrival order: a large
+request at the head of the queue is never starved by small ones behind it.
+
+Example:
+    >>> limiter = RateLimiter(requests_per_minute=500, tokens_per_minute=200_000)
+    >>> adapter = OpenAIAdapter(api_key=..., model="gpt-4o-mini", rate_limiter=limiter)
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+
+class TokenBucket:
+    """
+    Classic token bucket refilled continuously at `per_minute / 60` per second.
+
+    The level may go negative when a settled call used more than it reserved;
+    later callers then wait until the debt is paid back.
+    """
+
+    def __init__(self, per_minute: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the bucket (full).
+
+        Args:
+            per_minute: Budget per minute; also the bucket capacity
+            clock: Monotonic time source in seconds
+        """
+        if per_minute <= 0:
+            raise ValueError("per_minute must be positive")
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self._clock = clock
+        self._level = self.capacity
+        self._updated = clock()
+
+    @property
+    def level(self) -> float:
+        """Tokens available right now."""
+        self._refill()
+        return self._level
+
+    def delay(self, amount: float) -> float:
+        """Seconds until `amount` tokens are available (0 if they are now)."""
+        self._refill()
+        missing = amount - self._level
+        return max(0.0, missing / self.rate)
+
+    def take(self, amount: float) -> None:
+        """Remove `amount` tokens, going into debt if necessary."""
+        self._refill()
+        self._level -= amount
+
+    def give(self, amount: float) -> None:
+        """Return `amount` tokens, never filling past capacity."""
+        self._refill()
+        self._level = min(self.capacity, self._level + amount)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._level = min(self.capacity, self._level + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+class RateLimiter:
+    """
+    Shared async limiter for requests per minute and tokens per minute.
+
+    One limiter is meant to be shared by every adapter that draws on the same
+    provider quota. Either budget may be omitted.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        chars_per_token: float = 4.0,
+        default_completion_tokens: int = 256,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            requests_per_minute: Request budget (None for unlimited)
+            tokens_per_minute: Token budget, prompt plus completion (None for unlimited)
+            chars_per_token: Prompt characters per token used by `estimate_tokens`
+            default_completion_tokens: Completion estimate when a call sets no `max_tokens`
+            clock: Monotonic time source in seconds
+        """
+        self.requests = TokenBucket(requests_per_minute, clock) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute, clock) if tokens_per_minute else None
+        self.chars_per_token = chars_per_token
+        self.default_completion_tokens = default_completion_tokens
+        self._queue: Deque["asyncio.Future[None]"] = deque()
+        self._stats = {"acquired": 0, "waited": 0, "wait_seconds": 0.0}
+
+    def estimate_tokens(self, prompt: str, max_tokens: Optional[int] = None) -> int:
+        """Rough token cost of a call: prompt length plus the completion allowance."""
+        completion = self.default_completion_tokens if max_tokens is None else max_tokens
+        return int(len(prompt) / self.chars_per_token) + completion
+
+    async def acquire(self, tokens: int = 0) -> int:
+        """
+        Wait until one request and `tokens` tokens fit in the budgets, then take them.
+
+        Callers are served first come, first served.
+
+        Args:
+            tokens: Estimated tokens for the call (capped at the per-minute budget)
+
+        Returns:
+            int: The number of tokens reserved, to pass to `settle`
+        """
+        if self.tokens is not None:
+            tokens = int(min(tokens, self.tokens.capacity))
+
+        turn = asyncio.get_running_loop().create_future()
+        self._queue.append(turn)
+        if len(self._queue) == 1:
+            turn.set_result(None)
+
+        started = time.monotonic()
+        waited = False
+        try:
+            await turn
+            while True:
+                delay = self._delay(tokens)
+                if delay <= 0:
+                    break
+                waited = True
+                await asyncio.sleep(delay)
+        finally:
+            self._leave(turn)
+
+        if self.requests is not None:
+            self.requests.take(1)
+        if self.tokens is not None:
+            self.tokens.take(tokens)
+        self._stats["acquired"] += 1
+        if waited:
+            self._stats["waited"] += 1
+            self._stats["wait_seconds"] += time.monotonic() - started
+        return tokens
+
+    def settle(self, reserved: int, tokens_used: int) -> None:
+        """
+        Correct a reservation once the real token usage is known.
+
+        Over-estimates are refunded; under-estimates are charged, which may put
+        the token bucket into debt.
+        """
+        if self.tokens is None:
+            return
+        difference = reserved - tokens_used
+        if difference > 0:
+            self.tokens.give(difference)
+        elif difference < 0:
+            self.tokens.take(-difference)
+
+    def _delay(self, tokens: int) -> float:
+        delay = 0.0
+        if self.requests is not None:
+            delay = self.requests.delay(1)
+        if self.tokens is not None:
+            delay = max(delay, self.tokens.delay(tokens))
+        return delay
+
+    def _leave(self, turn: "asyncio.Future[None]") -> None:
+        """Drop `turn` from the queue and, if it was at the head, wake the next waiter."""
+        if self._queue and self._queue[0] is turn:
+            self._queue.popleft()
+            while self._queue:
+                head = self._queue[0]
+                if not head.done():
+                    head.set_result(None)
+                    break
+                # Cancelled, but its task hasn't resumed to remove it yet
+                self._queue.popleft()
+        else:
+            try:
+                self._queue.remove(turn)
+            except ValueError:
+                pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get limiter statistics.
+
+        Returns:
+            Dict with `acquired` (calls admitted), `waited` (calls that had to
+            wait), `wait_seconds` (total time spent waiting), `queued` (callers
+            waiting now) and the current `requests_available` /
+            `tokens_available` (None for an unlimited budget)
+        """
+        return {
+            **self._stats,
+            "queued": len(self._queue),
+            "requests_available": self.requests.level if self.requests is not None else None,
+            "tokens_available": self.tokens.level if self.tokens is not None else None,
+        }
@@ -0,0 +1,180 @@
+"""
+Transport-level retries for provider calls.
+
+`RetryPolicy` retries calls that failed for reasons a later attempt can fix
+(rate limits, overloads, timeouts, dropped connections) with capped
+exponential backoff and full jitter. A `Retry-After` (or `retry-after-ms`)
+header on the error's response takes precedence over the computed delay.
+
+Errors are classified without importing provider SDKs: the HTTP status is read
+from `status_code`, `status` or `code` attributes, and exceptions whose class
+names mention a timeout or connection failure are treated as transient.
+"""
+
+import asyncio
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# 408 timeout, 409 conflict, 425 too early, 429 rate limited, 5xx and Anthropic's 529 overloaded
+RETRYABLE_STATUSES = frozenset({408, 409, 425, 429, 500, 502, 503, 504, 529})
+
+
+def error_status(error: BaseException) -> Optional[int]:
+    """HTTP status carried by a provider error, if any."""
+    for attr in ("status_code", "status", "code"):
+        value = getattr(error, attr, None)
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+    response = getattr(error, "response", None)
+    value = getattr(response, "status_code", None)
+    return value if isinstance(value, int) else None
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """Seconds the server asked us to wait (`retry-after-ms` or `Retry-After`), if any."""
+    headers = getattr(error, "headers", None)
+    if headers is None:
+        headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers is None or not hasattr(headers, "get"):
+        return None
+
+    value = headers.get("retry-after-ms")
+    if value is not None:
+        try:
+            return max(0.0, float(value) / 1000)
+        except (TypeError, ValueError):
+            pass
+
+    value = headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def is_transient(error: BaseException) -> bool:
+    """Default classification: would retrying the same request plausibly succeed?"""
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError, ConnectionError)):
+        return True
+    status = error_status(error)
+    if status is not None:
+        return status in RETRYABLE_STATUSES
+    names = [cls.__name__ for cls in type(error).__mro__]
+    return any("Timeout" in name or "Connection" in name for name in names)
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter for transient provider errors.
+
+    Attempt `n` (0-based) waits a random time in `[0, min(max_delay,
+    base_delay * 2**n)]`, or exactly the server's `Retry-After` when one is
+    given. Non-transient errors are raised immediately.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        max_retry_after: float = 60.0,
+        jitter: bool = True,
+        classify: Optional[Callable[[BaseException], Optional[bool]]] = None
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            max_retries: Retries after the first failed call
+            base_delay: Backoff ceiling for the first retry, in seconds
+            max_delay: Upper bound for the backoff ceiling
+            max_retry_after: Longest `Retry-After` to honour; a server asking
+                for more makes the error final instead
+            jitter: Draw the delay uniformly below the ceiling (full jitter);
+                disable for deterministic delays
+            classify: Optional override returning True (retry), False (raise)
+                or None (use the default classification) for an error
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.jitter = jitter
+        self.classify = classify
+        self._stats = {"calls": 0, "retries": 0, "gave_up": 0}
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """Whether `error` should be retried (ignoring the retry budget)."""
+        if self.classify is not None:
+            verdict = self.classify(error)
+            if verdict is not None:
+                return verdict
+        return is_transient(error)
+
+    def delay(self, attempt: int, error: Optional[BaseException] = None) -> Optional[float]:
+        """
+        Seconds to wait before retry number `attempt` (0-based).
+
+        Returns:
+            The delay, or None if the server asked for a wait longer than
+            `max_retry_after`
+        """
+        if error is not None:
+            requested = retry_after(error)
+            if requested is not None:
+                return requested if requested <= self.max_retry_after else None
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(0, ceiling) if self.jitter else ceiling
+
+    async def run(self, call: Callable[[], Awaitable[T]]) -> Tuple[T, int]:
+        """
+        Await `call()` until it succeeds or fails for good.
+
+        Args:
+            call: Zero-argument function returning a fresh awaitable per attempt
+
+        Returns:
+            Tuple of the result and the number of retries it took
+
+        Raises:
+            The last error once it is non-retryable or the budget is spent
+        """
+        self._stats["calls"] += 1
+        attempt = 0
+        while True:
+            try:
+                return await call(), attempt
+            except Exception as e:
+                wait = None
+                if attempt < self.max_retries and self.is_retryable(e):
+                    wait = self.delay(attempt, e)
+                if wait is None:
+                    if attempt:
+                        self._stats["gave_up"] += 1
+                    raise
+            self._stats["retries"] += 1
+            attempt += 1
+            await asyncio.sleep(wait)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get retry statistics.
+
+        Returns:
+            Dict with `calls` (calls run through the policy), `retries` (extra
+            attempts made) and `gave_up` (calls that failed after retrying)
+        """
+        return dict(self._stats)
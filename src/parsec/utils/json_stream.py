@@ -0,0 +1,250 @@
+"""
+Event-based (SAX-style) reader for streamed JSON.
+
+`JSONStreamReader` turns arbitrary text deltas into structural events as they
+arrive and lets callers subscribe to JSONPath-like selectors. A subscribed
+value is delivered the moment it closes, without materialising the rest of the
+document.
+
+Selector syntax (a small JSONPath subset):
+    - `$` (optional) for the root
+    - `.name` or a leading `name` for an object key
+    - `["name"]` for keys that aren't identifiers
+    - `[0]` for an array index
+    - `[*]` / `.*` for any index or key
+
+Example:
+    >>> reader = JSONStreamReader()
+    >>> reader.subscribe("items[*].title", lambda path, value: print(path, value))
+    >>> reader.feed('{"items": [{"title": "a"}, {"ti')
+    ('items', 0, 'title') a
+    >>> reader.feed('tle": "b"}]}')
+    ('items', 1, 'title') b
+"""
+
+import json
+import re
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple, Union
+
+from .partial_json import JSONBuilder, JSONTokenizer
+
+
+Path = Tuple[Union[str, int], ...]
+
+START_OBJECT = "start_object"
+END_OBJECT = "end_object"
+START_ARRAY = "start_array"
+END_ARRAY = "end_array"
+KEY = "key"
+VALUE = "value"
+
+
+class _Wildcard:
+    """Selector segment matching any key or index."""
+
+    def __repr__(self) -> str:
+        return "*"
+
+
+ANY = _Wildcard()
+
+_SEGMENT = re.compile(
+    r'\.?(?P<name>[A-Za-z_$][\w$-]*|\*)'
+    r'|\[(?P<bracket>\*|\d+|"(?:[^"\\]|\\.)*"|\'[^\']*\')\]'
+)
+
+
+class JSONEvent(NamedTuple):
+    """A structural event. `path` locates the value (or, for keys, the object)."""
+    type: str
+    path: Path
+    value: Any = None
+
+
+def parse_selector(selector: str) -> Path:
+    """
+    Parse a selector such as `items[*].title` into path segments.
+
+    Raises:
+        ValueError: If the selector is malformed
+    """
+    text = selector.strip()
+    if text.startswith("$"):
+        text = text[1:]
+
+    segments: List[Union[str, int]] = []
+    pos = 0
+    while pos < len(text):
+        m = _SEGMENT.match(text, pos)
+        if m is None:
+            raise ValueError(f"Invalid selector {selector!r} at position {pos}")
+        name, bracket = m.group("name"), m.group("bracket")
+        if name is not None:
+            segments.append(ANY if name == "*" else name)
+        elif bracket == "*":
+            segments.append(ANY)
+        elif bracket[0] == '"':
+            segments.append(json.loads(bracket))
+        elif bracket[0] == "'":
+            segments.append(bracket[1:-1])
+        else:
+            segments.append(int(bracket))
+        pos = m.end()
+    return tuple(segments)
+
+
+def path_matches(pattern: Path, path: Path) -> bool:
+    """Whether a concrete path matches a parsed selector."""
+    if len(pattern) != len(path):
+        return False
+    for expected, actual in zip(pattern, path):
+        if expected is ANY:
+            continue
+        if expected != actual or type(expected) is not type(actual):
+            return False
+    return True
+
+
+def format_path(path: Path) -> str:
+    """Render a path as a selector string, e.g. `items[0].title`."""
+    parts = []
+    for segment in path:
+        if isinstance(segment, int):
+            parts.append(f"[{segment}]")
+        elif re.fullmatch(r"[A-Za-z_$][\w$-]*", segment):
+            parts.append(f".{segment}" if parts else segment)
+        else:
+            parts.append(f"[{json.dumps(segment)}]")
+    return "".join(parts) or "$"
+
+
+class JSONStreamReader:
+    """
+    Streaming JSON reader that emits events and delivers subscribed values.
+
+    Each `feed()` scans only the new delta. Subscribed containers are built
+    from events while they are open; nothing else is materialised.
+    """
+
+    def __init__(self, emit_events: bool = True):
+        """
+        Initialize the reader.
+
+        Args:
+            emit_events: Collect events for `feed()` to return. Disable when
+                only subscriptions are used.
+        """
+        self.emit_events = emit_events
+        self._tokenizer = JSONTokenizer(self)
+        self._kinds: List[str] = []
+        self._path: List[Union[str, int]] = []
+        self._events: List[JSONEvent] = []
+        self._subscriptions: List[Tuple[Path, Callable[[Path, Any], None]]] = []
+        self._captures: List[Tuple[JSONBuilder, Path, Callable[[Path, Any], None]]] = []
+
+    def subscribe(self, selector: str, callback: Callable[[Path, Any], None]) -> None:
+        """
+        Call `callback(path, value)` whenever a value matching `selector` closes.
+
+        Args:
+            selector: JSONPath-like selector, e.g. `items[*].title`
+            callback: Receives the concrete path and the complete value
+        """
+        self._subscriptions.append((parse_selector(selector), callback))
+
+    def feed(self, delta: str) -> List[JSONEvent]:
+        """
+        Consume the next chunk of streamed text.
+
+        Returns:
+            List[JSONEvent]: Events completed by this delta (empty if emit_events is False)
+        """
+        self._tokenizer.feed(delta)
+        events, self._events = self._events, []
+        return events
+
+    @property
+    def path(self) -> Path:
+        """Path of the container currently being read."""
+        return tuple(self._path[:-1])
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether the root value has been closed."""
+        return self._tokenizer.state == JSONTokenizer.DONE
+
+    @property
+    def error(self) -> Optional[str]:
+        """Description of the first syntax error, if any."""
+        return self._tokenizer.error
+
+    def _begin_value(self) -> Path:
+        """Advance the array index (if any) and return the new value's path."""
+        if self._kinds and self._kinds[-1] == START_ARRAY:
+            self._path[-1] += 1
+        return tuple(self._path)
+
+    def _emit(self, event_type: str, path: Path, value: Any = None) -> None:
+        if self.emit_events:
+            self._events.append(JSONEvent(event_type, path, value))
+
+    def _start(self, kind: str) -> None:
+        path = self._begin_value()
+        self._emit(kind, path)
+
+        for builder, _, _ in self._captures:
+            getattr(builder, f"on_{kind}")()
+        for pattern, callback in self._subscriptions:
+            if path_matches(pattern, path):
+                builder = JSONBuilder()
+                getattr(builder, f"on_{kind}")()
+                self._captures.append((builder, path, callback))
+
+        self._kinds.append(kind)
+        self._path.append(-1 if kind == START_ARRAY else "")
+
+    def _end(self, kind: str) -> None:
+        self._kinds.pop()
+        self._path.pop()
+        self._emit(kind, tuple(self._path))
+
+        closed = []
+        for capture in self._captures:
+            builder = capture[0]
+            getattr(builder, f"on_{kind}")()
+            if builder.done:
+                closed.append(capture)
+        # Innermost first: captures are nested, so later entries close first
+        for capture in reversed(closed):
+            self._captures.remove(capture)
+            builder, path, callback = capture
+            callback(path, builder.root)
+
+    # Tokenizer handler interface
+
+    def on_start_object(self) -> None:
+        self._start(START_OBJECT)
+
+    def on_start_array(self) -> None:
+        self._start(START_ARRAY)
+
+    def on_end_object(self) -> None:
+        self._end(END_OBJECT)
+
+    def on_end_array(self) -> None:
+        self._end(END_ARRAY)
+
+    def on_key(self, key: str) -> None:
+        self._path[-1] = key
+        self._emit(KEY, tuple(self._path[:-1]), key)
+        for builder, _, _ in self._captures:
+            builder.on_key(key)
+
+    def on_value(self, value: Any) -> None:
+        path = self._begin_value()
+        self._emit(VALUE, path, value)
+        for builder, _, _ in self._captures:
+            builder.on_value(value)
+        for pattern, callback in self._subscriptions:
+            if path_matches(pattern, path):
+                callback(path, value)
@@ -152,3 +152,397 @@ class PartialJSONParser:
             return True
         except json.JSONDecodeError:
             return False
+
+
+_WHITESPACE = frozenset(" \t\n\r")
+_NUMBER_CHARS = frozenset("0123456789+-.eE")
+_LITERAL_CHARS = frozenset("truefalsn")
+_LITERALS = {"true": True, "false": False, "null": None}
+_STRING_SPECIAL = re.compile(r'["\\]')
+_NUMBER = re.compile(r'-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?')
+_INCOMPLETE_UNICODE_ESCAPE = re.compile(r'(\\+)u[0-9a-fA-F]{0,3}$')
+_LENIENT_DECODER = json.JSONDecoder(strict=False)
+
+# Sentinel for "no partial scalar in progress" (None is a valid JSON value)
+MISSING = object()
+
+
+class JSONTokenizer:
+    """
+    Incremental JSON tokenizer that reports structure to a handler as it goes.
+
+    The tokenizer consumes text in arbitrary slices and keeps its lexical state
+    (container stack, open string, escape, partial number/literal) between
+    calls, so each character is scanned exactly once. Anything before the first
+    `{` or `[` (e.g. a markdown fence) and anything after the root value closes
+    is ignored.
+
+    The handler receives `on_start_object()`, `on_end_object()`,
+    `on_start_array()`, `on_end_array()`, `on_key(key)` and `on_value(value)`
+    calls in document order.
+    """
+
+    # Parser states
+    PREAMBLE = 0      # before the root container
+    VALUE = 1         # expecting a value
+    FIRST_VALUE = 2   # just after '[': value or ']'
+    FIRST_KEY = 3     # just after '{': key or '}'
+    KEY = 4           # after ',' in an object
+    COLON = 5         # after a key
+    AFTER_VALUE = 6   # after a value: ',' or a closing bracket
+    DONE = 7
+    ERROR = 8
+
+    # Lexemes in progress
+    _NONE = 0
+    _STRING = 1
+    _NUMBER = 2
+    _LITERAL = 3
+
+    def __init__(self, handler: Any):
+        self.handler = handler
+        self.state = self.PREAMBLE
+        self.error: Optional[str] = None
+        self.offset = 0
+        self._stack: List[str] = []
+        self._lexeme = self._NONE
+        self._buf: List[str] = []
+        self._is_key = False
+        self._escape = False
+        self._has_escape = False
+        # Last partial_scalar() result and the buffer it was computed from
+        self._partial_buf: Optional[List[str]] = None
+        self._partial: Any = MISSING
+
+    @property
+    def depth(self) -> int:
+        """Number of containers currently open."""
+        return len(self._stack)
+
+    def feed(self, text: str) -> None:
+        """Consume the next slice of the document."""
+        i, n = 0, len(text)
+        base = self.offset
+        self.offset += n
+
+        while i < n:
+            if self.state >= self.DONE:
+                return
+
+            lexeme = self._lexeme
+            if lexeme == self._STRING:
+                i = self._scan_string(text, i)
+                continue
+            if lexeme == self._NUMBER or lexeme == self._LITERAL:
+                chars = _NUMBER_CHARS if lexeme == self._NUMBER else _LITERAL_CHARS
+                j = i
+                while j < n and text[j] in chars:
+                    j += 1
+                self._buf.append(text[i:j])
+                if j == n:
+                    return
+                self._finish_scalar()
+                i = j
+                continue
+
+            c = text[i]
+            if c in _WHITESPACE:
+                i += 1
+                continue
+
+            state = self.state
+            if state == self.PREAMBLE:
+                starts = [p for p in (text.find("{", i), text.find("[", i)) if p >= 0]
+                if not starts:
+                    return
+                i = min(starts)
+                self._start_container(text[i])
+            elif state == self.VALUE or state == self.FIRST_VALUE:
+                if c == "]" and state == self.FIRST_VALUE:
+                    self._end_container(c)
+                elif c == "{" or c == "[":
+                    self._start_container(c)
+                elif c == '"':
+                    self._start_string(is_key=False)
+                elif c == "-" or "0" <= c <= "9":
+                    self._lexeme = self._NUMBER
+                    continue  # let the number scanner consume it
+                elif c in "tfn":
+                    self._lexeme = self._LITERAL
+                    continue
+                else:
+                    return self._fail(f"Unexpected {c!r} where a value was expected", base + i)
+            elif state == self.FIRST_KEY or state == self.KEY:
+                if c == '"':
+                    self._start_string(is_key=True)
+                elif c == "}" and state == self.FIRST_KEY:
+                    self._end_container(c)
+                else:
+                    return self._fail(f"Unexpected {c!r} where a key was expected", base + i)
+            elif state == self.COLON:
+                if c != ":":
+                    return self._fail(f"Expected ':' but found {c!r}", base + i)
+                self.state = self.VALUE
+            elif state == self.AFTER_VALUE:
+                if c == ",":
+                    self.state = self.KEY if self._stack[-1] == "}" else self.VALUE
+                elif c == self._stack[-1]:
+                    self._end_container(c)
+                else:
+                    return self._fail(f"Unexpected {c!r} after a value", base + i)
+            i += 1
+
+    def partial_scalar(self) -> Any:
+        """
+        Return the value of the string or number currently being read.
+
+        Returns MISSING when no value is in progress, when the lexeme is an
+        object key, or when the text so far isn't a usable prefix (e.g. "-").
+
+        The buffer is collapsed into one fragment on each call and the result
+        is reused until more text arrives, so reading after every delta
+        doesn't re-join all earlier fragments.
+        """
+        if self._lexeme == self._NUMBER or (self._lexeme == self._STRING and not self._is_key):
+            buf = self._buf
+            if self._partial_buf is buf and len(buf) == 1:
+                return self._partial
+            raw = "".join(buf)
+            buf[:] = [raw]
+            self._partial_buf = buf
+            self._partial = self._decode_partial(raw)
+            return self._partial
+        return MISSING
+
+    def _decode_partial(self, raw: str) -> Any:
+        if self._lexeme == self._NUMBER:
+            m = _NUMBER.match(raw)
+            return self._to_number(m.group(0)) if m else MISSING
+        if not self._has_escape:
+            return raw
+        if self._escape:
+            raw = raw[:-1]
+        m = _INCOMPLETE_UNICODE_ESCAPE.search(raw)
+        if m and len(m.group(1)) % 2 == 1:
+            raw = raw[:m.start() + len(m.group(1)) - 1]
+        try:
+            return _LENIENT_DECODER.decode(f'"{raw}"')
+        except ValueError:
+            return MISSING
+
+    def _scan_string(self, text: str, i: int) -> int:
+        n = len(text)
+        start = i
+        while i < n:
+            if self._escape:
+                self._escape = False
+                i += 1
+                continue
+            m = _STRING_SPECIAL.search(text, i)
+            if m is None:
+                break
+            j = m.start()
+            if text[j] == "\\":
+                self._has_escape = True
+                self._escape = True
+                i = j + 1
+                continue
+            self._buf.append(text[start:j])
+            self._finish_string()
+            return j + 1
+        self._buf.append(text[start:])
+        return n
+
+    def _start_string(self, is_key: bool) -> None:
+        self._lexeme = self._STRING
+        self._is_key = is_key
+        self._has_escape = False
+        self._escape = False
+        self._buf = []
+
+    def _finish_string(self) -> None:
+        raw = "".join(self._buf)
+        self._lexeme = self._NONE
+        self._buf = []
+        if self._has_escape:
+            try:
+                raw = _LENIENT_DECODER.decode(f'"{raw}"')
+            except ValueError as e:
+                return self._fail(f"Invalid string escape: {e}", self.offset)
+        if self._is_key:
+            self.handler.on_key(raw)
+            self.state = self.COLON
+        else:
+            self.handler.on_value(raw)
+            self.state = self.AFTER_VALUE
+
+    def _finish_scalar(self) -> None:
+        text = "".join(self._buf)
+        lexeme = self._lexeme
+        self._lexeme = self._NONE
+        self._buf = []
+        if lexeme == self._NUMBER:
+            if not _NUMBER.fullmatch(text):
+                return self._fail(f"Invalid number {text!r}", self.offset)
+            value = self._to_number(text)
+        else:
+            if text not in _LITERALS:
+                return self._fail(f"Invalid literal {text!r}", self.offset)
+            value = _LITERALS[text]
+        self.handler.on_value(value)
+        self.state = self.AFTER_VALUE
+
+    @staticmethod
+    def _to_number(text: str) -> Union[int, float]:
+        if "." in text or "e" in text or "E" in text:
+            return float(text)
+        return int(text)
+
+    def _start_container(self, c: str) -> None:
+        if c == "{":
+            self._stack.append("}")
+            self.handler.on_start_object()
+            self.state = self.FIRST_KEY
+        else:
+            self._stack.append("]")
+            self.handler.on_start_array()
+            self.state = self.FIRST_VALUE
+
+    def _end_container(self, c: str) -> None:
+        self._stack.pop()
+        if c == "}":
+            self.handler.on_end_object()
+        else:
+            self.handler.on_end_array()
+        self.state = self.AFTER_VALUE if self._stack else self.DONE
+
+    def _fail(self, message: str, position: int) -> None:
+        self.state = self.ERROR
+        self.error = f"{message} at offset {position}"
+
+
+class JSONBuilder:
+    """
+    Tokenizer handler that assembles parsed events into Python values.
+
+    Containers are created as soon as they open and filled in place, so `root`
+    is always the document built so far.
+    """
+
+    def __init__(self):
+        self.root: Optional[Any] = None
+        self.done = False
+        self._stack: List[Union[Dict[str, Any], List[Any]]] = []
+        self._keys: List[Optional[str]] = []
+        self._tip_attached = False
+
+    @property
+    def depth(self) -> int:
+        """Number of containers currently open."""
+        return len(self._stack)
+
+    def attach(self, value: Any, tip: bool = False) -> None:
+        """
+        Add a value at the current position.
+
+        A `tip` value is a provisional prefix of a string or number still being
+        read; it is overwritten by the next attach at the same position.
+        """
+        if not self._stack:
+            self.root = value
+            self.done = not isinstance(value, (dict, list))
+            return
+        top = self._stack[-1]
+        if type(top) is dict:
+            top[self._keys[-1]] = value
+        elif self._tip_attached:
+            top[-1] = value
+        else:
+            top.append(value)
+        self._tip_attached = tip
+
+    def on_start_object(self) -> None:
+        self._push({})
+
+    def on_start_array(self) -> None:
+        self._push([])
+
+    def on_end_object(self) -> None:
+        self._pop()
+
+    def on_end_array(self) -> None:
+        self._pop()
+
+    def on_key(self, key: str) -> None:
+        self._keys[-1] = key
+
+    def on_value(self, value: Any) -> None:
+        self.attach(value)
+
+    def _push(self, container: Union[Dict[str, Any], List[Any]]) -> None:
+        self.attach(container)
+        self._stack.append(container)
+        self._keys.append(None)
+
+    def _pop(self) -> None:
+        self._stack.pop()
+        self._keys.pop()
+        self._tip_attached = False
+        self.done = not self._stack
+
+
+class IncrementalJSONParser:
+    """
+    Stateful partial-JSON parser for streaming responses.
+
+    Unlike `PartialJSONParser.parse`, which re-parses the whole accumulated
+    text on every call, this parser consumes only each new delta and builds the
+    document in place. The cost of `feed()` is proportional to the delta size,
+    not to the response length.
+
+    `value` is the live partial document: containers are updated in place as
+    more text arrives, so copy it if you need a snapshot. Strings and numbers
+    still being written are included with their current prefix; keys without a
+    value yet and incomplete literals (`tru`) are omitted.
+
+    Example:
+        >>> parser = IncrementalJSONParser()
+        >>> parser.feed('{"name": "Jo')
+        >>> parser.value
+        {'name': 'Jo'}
+        >>> parser.feed('hn", "age": 3')
+        >>> parser.value
+        {'name': 'John', 'age': 3}
+    """
+
+    def __init__(self):
+        self._builder = JSONBuilder()
+        self._tokenizer = JSONTokenizer(self._builder)
+
+    def feed(self, delta: str) -> None:
+        """
+        Consume the next chunk of streamed text.
+
+        Args:
+            delta: Newly received text (not the accumulated response)
+        """
+        self._tokenizer.feed(delta)
+
+    @property
+    def value(self) -> Optional[Any]:
+        """Current partial document, or None before the root container starts."""
+        if self._builder.depth:
+            partial = self._tokenizer.partial_scalar()
+            if partial is not MISSING:
+                self._builder.attach(partial, tip=True)
+        return self._builder.root
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether the root value has been closed."""
+        return self._tokenizer.state == JSONTokenizer.DONE
+
+    @property
+    def error(self) -> Optional[str]:
+        """Description of the first syntax error, if the text stopped being valid JSON."""
+        return self._tokenizer.error
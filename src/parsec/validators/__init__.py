@@ -1,6 +1,7 @@
 from .base_validator import BaseValidator
 from .json_validator import JSONValidator
 from .pydantic_validator import PydanticValidator
+from .streaming_validator import StreamingSchemaValidator
 from parsec.core.schemas import ValidationResult, ValidationStatus, ValidationError
 
 __all__ = [
@@ -10,4 +11,5 @@ __all__ = [
     'ValidationError',
     'JSONValidator',
     'PydanticValidator',
+    'StreamingSchemaValidator',
 ]
@@ -1,5 +1,6 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from abc import ABC, abstractmethod
+import json
 from parsec.core.schemas import ValidationStatus, ValidationError, ValidationResult
 
 class BaseValidator(ABC):
@@ -10,6 +11,15 @@ class BaseValidator(ABC):
         """Validate the given output against the provided schema."""
         pass
 
+    def validate_parsed(self, data: Any, schema: Any, raw_output: Optional[str] = None) -> ValidationResult:
+        """
+        Validate an already-parsed value against the schema.
+
+        The default implementation re-serialises the value and calls `validate`;
+        validators that work on parsed data directly should override it.
+        """
+        return self.validate(raw_output if raw_output is not None else json.dumps(data), schema)
+
     @abstractmethod
     def repair(self, output: str, errors: List[ValidationError]) -> str:
         """Attempt to repair the given output to conform to the provided schema."""
@@ -1,15 +1,102 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+from collections import OrderedDict
 from .base_validator import BaseValidator, ValidationResult, ValidationStatus, ValidationError
 from .repair_utils import JSONRepairUtils
+from .schema_compiler import compile_schema
 import jsonschema
+import hashlib
 import json
 
 
+class _CompiledSchema(NamedTuple):
+    validator: Any
+    fast_check: Optional[Callable[[Any], bool]]
+
+
 class JSONValidator(BaseValidator):
-    """Validator that checks if the output is valid JSON and conforms to a given schema."""
+    """
+    Validator that checks if the output is valid JSON and conforms to a given schema.
+
+    Compiled schema validators are cached so repeated validations against the same
+    schema don't rebuild them. Lookups hit an identity map first (same schema
+    object) and fall back to a content hash (equal schema, different object).
+    Schemas are assumed not to be mutated after first use; call `clear_cache()`
+    if one is.
+
+    Schemas in the common Draft 7 subset are additionally compiled into a
+    generated Python check (see `schema_compiler`). Valid outputs are accepted
+    by that check alone; anything it rejects is re-validated with jsonschema,
+    so error records are identical to the jsonschema-only path.
+
+    Example:
+        >>> validator = JSONValidator(cache_size=256, check_schema=True)
+        >>> validator.validate('{"name": "Ada"}', schema).status
+        <ValidationStatus.VALID: 'valid'>
+    """
 
-    def __init__(self):
+    def __init__(self, cache_size: int = 128, check_schema: bool = False, fast_path: bool = True):
+        """
+        Initialize the JSON validator.
+
+        Args:
+            cache_size: Maximum number of compiled schemas to keep (0 disables caching)
+            check_schema: Check each schema against the Draft 7 metaschema when it is compiled
+            fast_path: Use generated validation code for schemas that support it
+        """
         self.validator = jsonschema.Draft7Validator
+        self.cache_size = cache_size
+        self.check_schema = check_schema
+        self.fast_path = fast_path
+        self._compiled: "OrderedDict[str, Any]" = OrderedDict()
+        self._by_identity: "OrderedDict[int, Tuple[Any, Any]]" = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    def compile(self, schema: Dict[str, Any]) -> Any:
+        """
+        Return a compiled validator for the schema, building it at most once.
+
+        Args:
+            schema: JSON schema to compile
+
+        Returns:
+            A jsonschema validator instance bound to the schema
+
+        Raises:
+            jsonschema.exceptions.SchemaError: If check_schema is enabled and the schema is invalid
+        """
+        return self._compile_entry(schema).validator
+
+    def _compile_entry(self, schema: Dict[str, Any]) -> _CompiledSchema:
+        """Look up or build the compiled form of a schema."""
+        if self.cache_size <= 0:
+            self._cache_misses += 1
+            return self._build(schema)
+
+        # Identity fast path; the entry holds a reference so the id can't be reused
+        entry = self._by_identity.get(id(schema))
+        if entry is not None and entry[0] is schema:
+            self._by_identity.move_to_end(id(schema))
+            self._cache_hits += 1
+            return entry[1]
+
+        key = self._schema_hash(schema)
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            self._cache_misses += 1
+            compiled = self._build(schema)
+            self._compiled[key] = compiled
+            if len(self._compiled) > self.cache_size:
+                self._compiled.popitem(last=False)
+        else:
+            self._cache_hits += 1
+            self._compiled.move_to_end(key)
+
+        self._by_identity[id(schema)] = (schema, compiled)
+        if len(self._by_identity) > self.cache_size:
+            self._by_identity.popitem(last=False)
+
+        return compiled
 
     def validate(self, output: str, schema: Dict[str, Any]) -> ValidationResult:
         errors = []
@@ -29,9 +116,33 @@ class JSONValidator(BaseValidator):
                 errors=errors,
                 raw_output=output
             )
-        
-        schema_validator = self.validator(schema)
-        schema_errors = list(schema_validator.iter_errors(parsed))
+
+        return self.validate_parsed(parsed, schema, output)
+
+    def validate_parsed(self, parsed: Any, schema: Dict[str, Any], raw_output: Optional[str] = None) -> ValidationResult:
+        """
+        Validate an already-parsed value against the schema.
+
+        Args:
+            parsed: Decoded JSON value
+            schema: JSON schema to validate against
+            raw_output: Original text, if available (serialised from `parsed` otherwise)
+
+        Returns:
+            ValidationResult: Same result `validate` would give for the text
+        """
+        output = raw_output if raw_output is not None else json.dumps(parsed)
+        errors = []
+
+        compiled = self._compile_entry(schema)
+        if compiled.fast_check is not None and compiled.fast_check(parsed):
+            return ValidationResult(
+                status=ValidationStatus.VALID,
+                parsed_output=parsed,
+                raw_output=output
+            )
+
+        schema_errors = list(compiled.validator.iter_errors(parsed))
 
         if not schema_errors:
             return ValidationResult(
@@ -59,4 +170,39 @@ class JSONValidator(BaseValidator):
         
     def repair(self, output: str, errors: List[ValidationError]) -> str:
         """Repair common JSON issues using shared repair utilities."""
-        return JSONRepairUtils.repair(output)
\ No newline at end of file
+        return JSONRepairUtils.repair(output)
+
+    def clear_cache(self) -> None:
+        """Drop all compiled schemas. Hit/miss counters are preserved."""
+        self._compiled.clear()
+        self._by_identity.clear()
+
+    def get_cache_stats(self) -> dict:
+        """
+        Get compiled-schema cache statistics.
+
+        Returns:
+            dict: size, hits, misses and hit_rate (formatted string)
+        """
+        total = self._cache_hits + self._cache_misses
+        hit_rate = (self._cache_hits / total) * 100 if total > 0 else 0.0
+
+        return {
+            "size": len(self._compiled),
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "hit_rate": f"{hit_rate:.2f}%"
+        }
+
+    def _build(self, schema: Dict[str, Any]) -> _CompiledSchema:
+        """Construct a validator, optionally checking the schema first."""
+        if self.check_schema:
+            self.validator.check_schema(schema)
+        fast_check = compile_schema(schema) if self.fast_path else None
+        return _CompiledSchema(self.validator(schema), fast_check)
+
+    @staticmethod
+    def _schema_hash(schema: Dict[str, Any]) -> str:
+        """Content hash of a schema, stable across key ordering."""
+        canonical = json.dumps(schema, sort_keys=True, default=repr)
+        return hashlib.sha256(canonical.encode()).hexdigest()
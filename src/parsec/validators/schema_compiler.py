@@ -0,0 +1,256 @@
+"""
+Compile JSON schemas into specialised Python validation functions.
+
+The generated function answers one question - "is this instance valid?" - for
+the common Draft 7 subset (type, required, properties, additionalProperties,
+enum, const, items, min/max, length and pattern keywords). It is deliberately
+conservative: it never reports an invalid instance as valid, but may reject a
+few valid edge cases (e.g. `1.0` against `enum: [1]`). Callers are expected to
+fall back to a full validator to confirm failures and build error records.
+
+Schemas using any other keyword ($ref, oneOf, patternProperties, ...) are not
+compiled; `compile_schema` returns None for them.
+"""
+
+import math
+import re
+from typing import Any, Callable, Dict, List, Optional, Set
+
+
+# Draft 7 keywords that never affect validity without a format checker
+_ANNOTATIONS = {
+    "$schema", "$id", "$comment", "title", "description", "default",
+    "examples", "format", "definitions", "readOnly", "writeOnly",
+    "contentMediaType", "contentEncoding",
+}
+
+_TYPE_CHECKS = {
+    "string": "type({v}) is str",
+    "integer": "(type({v}) is int or (type({v}) is float and {v}.is_integer()))",
+    "number": "(type({v}) is int or type({v}) is float)",
+    "boolean": "type({v}) is bool",
+    "null": "{v} is None",
+    "object": "type({v}) is dict",
+    "array": "type({v}) is list",
+}
+
+_NUMBER_CHECK = "(type({v}) is int or type({v}) is float)"
+
+_OBJECT_KEYWORDS = {"required", "properties", "additionalProperties", "minProperties", "maxProperties"}
+_ARRAY_KEYWORDS = {"items", "minItems", "maxItems"}
+_STRING_KEYWORDS = {"minLength", "maxLength", "pattern"}
+_NUMBER_KEYWORDS = {"minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum"}
+
+_SUPPORTED = (
+    _ANNOTATIONS | _OBJECT_KEYWORDS | _ARRAY_KEYWORDS | _STRING_KEYWORDS
+    | _NUMBER_KEYWORDS | {"type", "enum", "const"}
+)
+
+
+class UnsupportedSchema(Exception):
+    """Raised internally when a schema uses keywords the compiler can't handle."""
+
+
+class SchemaCompiler:
+    """Generates the source of a validation function for a single schema."""
+
+    def __init__(self):
+        self._lines: List[str] = []
+        self._constants: Dict[str, Any] = {}
+        self._counter = 0
+
+    def compile(self, schema: Any) -> Callable[[Any], bool]:
+        """
+        Compile a schema into a predicate returning True for valid instances.
+
+        Raises:
+            UnsupportedSchema: If the schema uses keywords outside the supported subset
+        """
+        self._emit(0, "def check(x0):")
+        self._schema(schema, "x0", 1)
+        self._emit(1, "return True")
+
+        namespace = dict(self._constants)
+        exec("\n".join(self._lines), namespace)
+        check = namespace["check"]
+        check.__source__ = "\n".join(self._lines)
+        return check
+
+    def _emit(self, indent: int, line: str) -> None:
+        self._lines.append("    " * indent + line)
+
+    def _block(self, indent: int, header: str, body: Callable[[int], None]) -> None:
+        """Emit `header` followed by an indented body, padding empty bodies with pass."""
+        self._emit(indent, header)
+        mark = len(self._lines)
+        body(indent + 1)
+        if len(self._lines) == mark:
+            self._emit(indent + 1, "pass")
+
+    def _name(self, prefix: str) -> str:
+        self._counter += 1
+        return f"{prefix}{self._counter}"
+
+    def _constant(self, value: Any) -> str:
+        name = self._name("_c")
+        self._constants[name] = value
+        return name
+
+    def _schema(self, schema: Any, v: str, indent: int) -> None:
+        """Emit checks for `schema` against the value held in variable `v`."""
+        if schema is True:
+            return
+        if schema is False:
+            self._emit(indent, "return False")
+            return
+        if not isinstance(schema, dict):
+            raise UnsupportedSchema(f"Schema must be an object or boolean, got {type(schema).__name__}")
+
+        unsupported = set(schema) - _SUPPORTED
+        if unsupported:
+            raise UnsupportedSchema(f"Unsupported keywords: {sorted(unsupported)}")
+
+        types = self._types(schema)
+        if types is not None:
+            checks = " or ".join(_TYPE_CHECKS[t].format(v=v) for t in sorted(types))
+            self._emit(indent, f"if not ({checks}):")
+            self._emit(indent + 1, "return False")
+
+        if "enum" in schema:
+            self._enum(schema["enum"], v, indent)
+        if "const" in schema:
+            self._enum([schema["const"]], v, indent)
+
+        self._group(schema, types, "object", _OBJECT_KEYWORDS, "type({v}) is dict", v, indent, self._object)
+        self._group(schema, types, "array", _ARRAY_KEYWORDS, "type({v}) is list", v, indent, self._array)
+        self._group(schema, types, "string", _STRING_KEYWORDS, "type({v}) is str", v, indent, self._string)
+        self._group(schema, types, "number", _NUMBER_KEYWORDS, _NUMBER_CHECK, v, indent, self._number)
+
+    @staticmethod
+    def _types(schema: Dict[str, Any]) -> Optional[Set[str]]:
+        if "type" not in schema:
+            return None
+        types = schema["type"]
+        if isinstance(types, str):
+            types = [types]
+        if not isinstance(types, list) or not types or any(t not in _TYPE_CHECKS for t in types):
+            raise UnsupportedSchema(f"Unsupported type declaration: {schema['type']!r}")
+        return set(types)
+
+    def _group(self, schema, types, kind, keywords, guard, v, indent, emit) -> None:
+        """Emit type-specific keyword checks, guarded unless the type is already pinned."""
+        if not keywords & set(schema):
+            return
+        if types is not None:
+            applicable = {"integer", "number"} if kind == "number" else {kind}
+            if not types & applicable:
+                return  # instance can never be this type, keywords are inert
+            if types <= applicable:
+                emit(schema, v, indent)
+                return
+        self._block(indent, f"if {guard.format(v=v)}:", lambda i: emit(schema, v, i))
+
+    def _size(self, schema: Dict[str, Any], keyword: str, op: str, v: str, indent: int) -> None:
+        """Emit a len() bound check for a count keyword such as minItems."""
+        if keyword not in schema:
+            return
+        bound = schema[keyword]
+        if isinstance(bound, bool) or not isinstance(bound, int) or bound < 0:
+            raise UnsupportedSchema(f"{keyword} must be a non-negative integer")
+        self._emit(indent, f"if len({v}) {op} {bound!r}:")
+        self._emit(indent + 1, "return False")
+
+    def _enum(self, values: Any, v: str, indent: int) -> None:
+        if not isinstance(values, list) or any(isinstance(e, (dict, list)) for e in values):
+            raise UnsupportedSchema("Only scalar enum/const values are supported")
+        # Pair each value with its type so True and 1 don't compare equal
+        allowed = self._constant(frozenset((type(e), e) for e in values))
+        self._emit(indent, f"if type({v}) is dict or type({v}) is list or (type({v}), {v}) not in {allowed}:")
+        self._emit(indent + 1, "return False")
+
+    def _object(self, schema: Dict[str, Any], v: str, indent: int) -> None:
+        required = schema.get("required", [])
+        if not isinstance(required, list) or not all(isinstance(key, str) for key in required):
+            raise UnsupportedSchema("required must be a list of strings")
+        for key in required:
+            self._emit(indent, f"if {key!r} not in {v}:")
+            self._emit(indent + 1, "return False")
+
+        self._size(schema, "minProperties", "<", v, indent)
+        self._size(schema, "maxProperties", ">", v, indent)
+
+        properties = schema.get("properties", {})
+        if not isinstance(properties, dict) or not all(isinstance(key, str) for key in properties):
+            raise UnsupportedSchema("properties must be an object")
+        for key, subschema in properties.items():
+            if subschema is True or subschema == {}:
+                continue
+            child = self._name("x")
+            self._emit(indent, f"if {key!r} in {v}:")
+            self._emit(indent + 1, f"{child} = {v}[{key!r}]")
+            self._schema(subschema, child, indent + 1)
+
+        additional = schema.get("additionalProperties", True)
+        if additional is not True and additional != {}:
+            known = self._constant(frozenset(properties))
+            key_var, child = self._name("k"), self._name("x")
+            self._emit(indent, f"for {key_var}, {child} in {v}.items():")
+            self._block(indent + 1, f"if {key_var} not in {known}:", lambda i: self._schema(additional, child, i))
+
+    def _array(self, schema: Dict[str, Any], v: str, indent: int) -> None:
+        self._size(schema, "minItems", "<", v, indent)
+        self._size(schema, "maxItems", ">", v, indent)
+
+        items = schema.get("items", True)
+        if isinstance(items, list):
+            raise UnsupportedSchema("Tuple-form items are not supported")
+        if items is not True and items != {}:
+            child = self._name("x")
+            self._block(indent, f"for {child} in {v}:", lambda i: self._schema(items, child, i))
+
+    def _string(self, schema: Dict[str, Any], v: str, indent: int) -> None:
+        self._size(schema, "minLength", "<", v, indent)
+        self._size(schema, "maxLength", ">", v, indent)
+        if "pattern" in schema:
+            try:
+                pattern = self._constant(re.compile(schema["pattern"]))
+            except (re.error, TypeError) as e:
+                raise UnsupportedSchema(f"Pattern does not compile: {e}")
+            self._emit(indent, f"if {pattern}.search({v}) is None:")
+            self._emit(indent + 1, "return False")
+
+    def _number(self, schema: Dict[str, Any], v: str, indent: int) -> None:
+        bounds = [
+            ("minimum", "<"),
+            ("maximum", ">"),
+            ("exclusiveMinimum", "<="),
+            ("exclusiveMaximum", ">="),
+        ]
+        for keyword, op in bounds:
+            if keyword not in schema:
+                continue
+            bound = schema[keyword]
+            if isinstance(bound, bool) or not isinstance(bound, (int, float)) or not math.isfinite(bound):
+                raise UnsupportedSchema(f"{keyword} must be a number")
+            self._emit(indent, f"if {v} {op} {bound!r}:")
+            self._emit(indent + 1, "return False")
+
+
+def compile_schema(schema: Any) -> Optional[Callable[[Any], bool]]:
+    """
+    Compile a schema into a fast validity predicate.
+
+    Args:
+        schema: Draft 7 JSON schema
+
+    Returns:
+        A function returning True only for instances that are valid against the
+        schema, or None if the schema uses unsupported keywords or is nested too
+        deeply for the generated source to compile
+    """
+    try:
+        return SchemaCompiler().compile(schema)
+    except (UnsupportedSchema, SyntaxError, RecursionError, MemoryError):
+        # Python caps statically nested blocks (and indentation depth), so very
+        # deep schemas are left to jsonschema
+        return None
@@ -0,0 +1,86 @@
+"""Helpers for navigating JSON schemas by document path."""
+
+from typing import Any, Dict, Optional, Sequence, Union
+
+
+def resolve_ref(root: Dict[str, Any], schema: Any) -> Any:
+    """
+    Follow local `$ref` pointers (e.g. `#/definitions/item`) until a concrete schema.
+
+    Args:
+        root: Root schema the pointers are relative to
+        schema: Schema that may be a `{"$ref": ...}` object
+
+    Returns:
+        The referenced schema, or None if a pointer can't be resolved
+    """
+    seen = set()
+    while isinstance(schema, dict) and "$ref" in schema:
+        ref = schema["$ref"]
+        if not isinstance(ref, str) or not ref.startswith("#") or ref in seen:
+            return None
+        seen.add(ref)
+        target: Any = root
+        for part in ref.lstrip("#").split("/"):
+            if not part:
+                continue
+            part = part.replace("~1", "/").replace("~0", "~")
+            if isinstance(target, dict) and part in target:
+                target = target[part]
+            elif isinstance(target, list) and part.isdigit() and int(part) < len(target):
+                target = target[int(part)]
+            else:
+                return None
+        schema = target
+    return schema
+
+
+def subschema_at(root: Dict[str, Any], path: Sequence[Union[str, int, Any]]) -> Optional[Any]:
+    """
+    Find the schema that applies to the value at `path` in a document.
+
+    String segments step into `properties` (then `additionalProperties`);
+    any other segment (an index or wildcard) steps into `items`.
+
+    Args:
+        root: Root JSON schema
+        path: Document path, e.g. `("items", 0, "title")`
+
+    Returns:
+        The subschema, True for "anything goes", or None if it can't be determined
+    """
+    schema = resolve_ref(root, root)
+    for segment in path:
+        if schema is True:
+            return True
+        if not isinstance(schema, dict):
+            return None
+        if isinstance(segment, str):
+            properties = schema.get("properties", {})
+            if segment in properties:
+                schema = properties[segment]
+            else:
+                schema = schema.get("additionalProperties", True)
+        else:
+            items = schema.get("items", True)
+            if isinstance(items, list):
+                if isinstance(segment, int) and segment < len(items):
+                    items = items[segment]
+                else:
+                    items = schema.get("additionalItems", True)
+            schema = items
+        schema = resolve_ref(root, schema)
+    return schema
+
+
+def standalone_subschema(root: Dict[str, Any], schema: Any) -> Any:
+    """
+    Make a subschema validatable on its own by carrying over the root's definitions.
+
+    Nested `$ref`s such as `#/definitions/point` keep resolving when the
+    subschema is used as a root schema.
+    """
+    if not isinstance(schema, dict) or schema is root:
+        return schema
+    carried = {key: root[key] for key in ("definitions", "$defs") if key in root and key not in schema}
+    return {**schema, **carried} if carried else schema
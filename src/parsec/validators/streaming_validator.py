@@ -0,0 +1,280 @@
+"""
+Progressive schema validation for streaming responses.
+
+`StreamingSchemaValidator` checks a JSON document against a schema while it is
+still being generated. It only reports violations that no continuation of the
+text can fix: a value of the wrong type, an unexpected property where
+`additionalProperties` is false, a closed scalar outside its `enum`/`const`,
+or an object that closed without a required property. Keywords it doesn't
+understand are ignored, so a clean partial result means "not provably invalid
+yet", not "valid".
+"""
+
+from typing import Any, Dict, List, Optional, Union
+
+from parsec.core.schemas import StreamValidationResult, ValidationError, ValidationStatus
+from parsec.utils.json_stream import Path, format_path
+from parsec.utils.partial_json import JSONBuilder, JSONTokenizer
+from .schema_utils import resolve_ref
+
+
+def _json_type(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int):
+        return "integer"
+    if isinstance(value, float):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, dict):
+        return "object"
+    return "array"
+
+
+def _type_matches(declared: str, actual: str, value: Any) -> bool:
+    if declared == actual:
+        return True
+    if declared == "number":
+        return actual == "integer"
+    if declared == "integer":
+        return actual == "number" and value.is_integer()
+    return False
+
+
+def _json_equal(a: Any, b: Any) -> bool:
+    """Equality with JSON Schema semantics: 1 == 1.0, but True != 1."""
+    if isinstance(a, bool) or isinstance(b, bool):
+        return type(a) is type(b) and a == b
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_json_equal(a[k], b[k]) for k in a)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_json_equal(x, y) for x, y in zip(a, b))
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+        return a == b
+    return type(a) is type(b) and a == b
+
+
+class _Frame:
+    """An open container and the schema that applies to it."""
+
+    __slots__ = ("schema", "kind", "keys")
+
+    def __init__(self, schema: Optional[Dict[str, Any]], kind: str):
+        self.schema = schema
+        self.kind = kind
+        self.keys = set() if kind == "object" else None
+
+
+class StreamingSchemaValidator:
+    """
+    Validate a streamed JSON document against a schema as tokens arrive.
+
+    Example:
+        >>> checker = StreamingSchemaValidator({"type": "object", "additionalProperties": False})
+        >>> checker.feed('{"unexpected": ')
+        >>> checker.status
+        <ValidationStatus.UNREPAIRABLE: 'unrepairable'>
+    """
+
+    def __init__(self, schema: Any):
+        """
+        Initialize the validator.
+
+        Args:
+            schema: JSON schema (or pydantic model) for the whole document
+        """
+        if hasattr(schema, "model_json_schema"):
+            schema = schema.model_json_schema()
+        self.schema = schema
+        self.errors: List[ValidationError] = []
+        self._builder = JSONBuilder()
+        self._tokenizer = JSONTokenizer(self)
+        self._frames: List[_Frame] = []
+        self._path: List[Union[str, int]] = []
+
+    def feed(self, delta: str) -> None:
+        """Consume the next chunk of streamed text."""
+        self._tokenizer.feed(delta)
+
+    @property
+    def status(self) -> ValidationStatus:
+        """
+        UNREPAIRABLE once a schema violation is proven, INVALID after a syntax
+        error (which repair may still fix), VALID while nothing is wrong so far.
+        """
+        if self.errors:
+            return ValidationStatus.UNREPAIRABLE
+        if self._tokenizer.error:
+            return ValidationStatus.INVALID
+        return ValidationStatus.VALID
+
+    @property
+    def is_unrepairable(self) -> bool:
+        """Whether the document can no longer become valid."""
+        return bool(self.errors)
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether the root value has been closed."""
+        return self._tokenizer.state == JSONTokenizer.DONE
+
+    @property
+    def value(self) -> Optional[Any]:
+        """Closed values of the document so far (updated in place)."""
+        return self._builder.root
+
+    def result(self, accumulated_text: str) -> StreamValidationResult:
+        """Build a partial StreamValidationResult for the current state."""
+        errors = list(self.errors)
+        if self._tokenizer.error and not errors:
+            errors.append(ValidationError(
+                path=format_path(tuple(self._path)),
+                message=self._tokenizer.error,
+                expected="Valid JSON",
+                actual="syntax error",
+                severity="error"
+            ))
+        return StreamValidationResult(
+            status=self.status,
+            parsed_output=self.value,
+            errors=errors,
+            is_partial=True,
+            accumulated_text=accumulated_text
+        )
+
+    # Schema navigation
+
+    def _normalize(self, schema: Any) -> Union[Dict[str, Any], bool, None]:
+        """Resolve refs; None means "nothing to check", False rejects everything."""
+        schema = resolve_ref(self.schema, schema) if isinstance(self.schema, dict) else None
+        if schema is False:
+            return False
+        if not isinstance(schema, dict) or not schema:
+            return None
+        return schema
+
+    def _child_schema(self) -> Union[Dict[str, Any], bool, None]:
+        """Advance to the next value position and return the schema that applies there."""
+        if not self._frames:
+            return self._normalize(self.schema)
+
+        frame = self._frames[-1]
+        if frame.kind == "array":
+            self._path[-1] += 1
+        schema = frame.schema
+        if schema is None:
+            return None
+
+        if frame.kind == "array":
+            items = schema.get("items")
+            if isinstance(items, list):
+                index = self._path[-1]
+                items = items[index] if index < len(items) else schema.get("additionalItems")
+            return self._normalize(items)
+
+        key = self._path[-1]
+        properties = schema.get("properties", {})
+        if key in properties:
+            return self._normalize(properties[key])
+        if "patternProperties" in schema:
+            return None  # a pattern may apply; don't guess
+        return self._normalize(schema.get("additionalProperties"))
+
+    # Checks
+
+    def _error(self, path: Path, message: str, expected: Any, actual: Any) -> None:
+        self.errors.append(ValidationError(
+            path=format_path(path),
+            message=message,
+            expected=expected,
+            actual=actual,
+            severity="error"
+        ))
+
+    def _check_value(self, schema: Union[Dict[str, Any], bool, None], actual: str, value: Any = None) -> None:
+        """Check type (and for scalars enum/const) at the current position."""
+        if schema is None:
+            return
+        path = tuple(self._path)
+        shown = repr(value) if actual not in ("object", "array") else actual
+        if schema is False:
+            self._error(path, f"False schema does not allow {shown}", "nothing", actual)
+            return
+
+        declared = schema.get("type")
+        if declared is not None:
+            types = [declared] if isinstance(declared, str) else declared
+            if isinstance(types, list) and not any(_type_matches(t, actual, value) for t in types):
+                expected = ", ".join(repr(t) for t in types)
+                self._error(path, f"{shown} is not of type {expected}", declared, actual)
+
+        if actual in ("object", "array"):
+            return
+        if "enum" in schema and isinstance(schema["enum"], list):
+            if not any(_json_equal(option, value) for option in schema["enum"]):
+                self._error(path, f"{value!r} is not one of {schema['enum']!r}", schema["enum"], value)
+        if "const" in schema and not _json_equal(schema["const"], value):
+            self._error(path, f"{schema['const']!r} was expected", schema["const"], value)
+
+    # Tokenizer handler interface
+
+    def on_start_object(self) -> None:
+        self._open("object")
+        self._builder.on_start_object()
+
+    def on_start_array(self) -> None:
+        self._open("array")
+        self._builder.on_start_array()
+
+    def on_end_object(self) -> None:
+        frame = self._close()
+        self._builder.on_end_object()
+        schema = frame.schema
+        if schema is None:
+            return
+        required = schema.get("required", [])
+        for key in required if isinstance(required, list) else []:
+            if key not in frame.keys:
+                self._error(tuple(self._path), f"{key!r} is a required property", key, "missing")
+
+    def on_end_array(self) -> None:
+        self._close()
+        self._builder.on_end_array()
+
+    def on_key(self, key: str) -> None:
+        self._builder.on_key(key)
+        frame = self._frames[-1]
+        self._path[-1] = key
+        frame.keys.add(key)
+
+        schema = frame.schema
+        if (
+            schema is not None
+            and schema.get("additionalProperties") is False
+            and "patternProperties" not in schema
+            and key not in schema.get("properties", {})
+        ):
+            self._error(
+                tuple(self._path[:-1]),
+                f"Additional properties are not allowed ({key!r} was unexpected)",
+                sorted(schema.get("properties", {})),
+                key
+            )
+
+    def on_value(self, value: Any) -> None:
+        self._builder.on_value(value)
+        schema = self._child_schema()
+        self._check_value(schema, _json_type(value), value)
+
+    def _open(self, kind: str) -> None:
+        schema = self._child_schema()
+        self._check_value(schema, kind)
+        self._frames.append(_Frame(schema if isinstance(schema, dict) else None, kind))
+        self._path.append(-1 if kind == "array" else "")
+
+    def _close(self) -> _Frame:
+        self._path.pop()
+        return self._frames.pop()
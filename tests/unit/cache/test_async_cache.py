@@ -0,0 +1,75 @@
+"""Tests for the async cache interface and AsyncCacheAdapter."""
+
+import asyncio
+import threading
+import time
+import pytest
+
+from parsec.cache import AsyncBaseCache, AsyncCacheAdapter, BaseCache, InMemoryCache
+
+
+class SlowCache(InMemoryCache):
+    """InMemoryCache whose operations block like a network round trip."""
+
+    def __init__(self, latency: float):
+        super().__init__()
+        self.latency = latency
+        self.threads = set()
+
+    def get(self, key):
+        self.threads.add(threading.get_ident())
+        time.sleep(self.latency)
+        return super().get(key)
+
+
+class TestBaseCacheBulk:
+
+    def test_get_many_and_set_many(self):
+        cache = InMemoryCache()
+        cache.set_many({"a": 1, "b": 2})
+
+        assert cache.get_many(["a", "b", "c"]) == {"a": 1, "b": 2}
+
+
+class TestAsyncCacheAdapter:
+
+    async def test_round_trip(self):
+        cache = AsyncCacheAdapter(InMemoryCache())
+
+        await cache.aset("key", {"data": 1})
+        assert await cache.aget("key") == {"data": 1}
+
+        await cache.adelete("key")
+        assert await cache.aget("key") is None
+        assert cache.get_stats()["hits"] == 1
+
+    async def test_bulk_operations(self):
+        cache = AsyncCacheAdapter(InMemoryCache())
+
+        await cache.aset_many({"a": 1, "b": 2}, ttl=60)
+
+        assert await cache.aget_many(["a", "b", "c"]) == {"a": 1, "b": 2}
+
+    async def test_offload_runs_off_the_event_loop(self):
+        slow = SlowCache(latency=0.05)
+        cache = AsyncCacheAdapter(slow, offload=True)
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        task = asyncio.ensure_future(ticker())
+        await cache.aget("missing")
+        task.cancel()
+
+        assert threading.get_ident() not in slow.threads
+        assert ticks > 3
+
+    async def test_is_async_cache(self):
+        assert isinstance(AsyncCacheAdapter(InMemoryCache()), AsyncBaseCache)
+        assert not isinstance(AsyncCacheAdapter(InMemoryCache()), BaseCache)
+
@@ -0,0 +1,80 @@
+"""Tests for cache key generation and schema fingerprints."""
+
+import pytest
+from pydantic import BaseModel
+
+from parsec.cache import generate_cache_key, schema_fingerprint
+from parsec.cache import keys as keys_module
+
+
+class Person(BaseModel):
+    name: str
+
+
+class Company(BaseModel):
+    name: str
+
+
+class TestSchemaFingerprint:
+
+    def test_stable_across_key_order(self):
+        a = {"type": "object", "properties": {"x": {"type": "string"}}}
+        b = {"properties": {"x": {"type": "string"}}, "type": "object"}
+
+        assert schema_fingerprint(a) == schema_fingerprint(b)
+        assert len(schema_fingerprint(a)) == 64
+
+    def test_different_schemas_differ(self):
+        assert schema_fingerprint({"type": "object"}) != schema_fingerprint({"type": "array"})
+
+    def test_empty_schema(self):
+        assert schema_fingerprint(None) == ""
+        assert schema_fingerprint({}) == ""
+
+    def test_memoized_per_dict_object(self, monkeypatch):
+        schema = {"type": "object"}
+        schema_fingerprint(schema)
+
+        calls = []
+        monkeypatch.setattr(keys_module, "_content_hash", lambda s: calls.append(s) or "x")
+        schema_fingerprint(schema)
+        schema_fingerprint({"type": "object"})
+
+        assert len(calls) == 1
+
+    def test_pydantic_model_classes(self):
+        assert schema_fingerprint(Person) == schema_fingerprint(Person)
+        assert schema_fingerprint(Person) != schema_fingerprint(Company)
+
+
+class TestGenerateCacheKey:
+
+    def test_deterministic(self):
+        key = generate_cache_key("What is 2+2?", "gpt-4", temperature=0.0)
+
+        assert len(key) == 64
+        assert key == generate_cache_key("  What is 2+2?\n", "gpt-4", temperature=0.0)
+
+    def test_parameters_change_key(self):
+        base = generate_cache_key("p", "gpt-4", {"type": "object"})
+
+        assert base != generate_cache_key("p", "gpt-4o", {"type": "object"})
+        assert base != generate_cache_key("p", "gpt-4", {"type": "array"})
+        assert base != generate_cache_key("p", "gpt-4", {"type": "object"}, temperature=0.0)
+        assert base != generate_cache_key("p", "gpt-4", {"type": "object"}, max_tokens=10)
+
+    def test_field_boundaries_are_unambiguous(self):
+        assert generate_cache_key("ab", "c") != generate_cache_key("a", "bc")
+
+    def test_pydantic_schema(self):
+        assert generate_cache_key("p", "gpt-4", Person) != generate_cache_key("p", "gpt-4", Company)
+
+    def test_blake2b(self):
+        key = generate_cache_key("p", "gpt-4", algorithm="blake2b")
+
+        assert len(key) == 64
+        assert key != generate_cache_key("p", "gpt-4")
+
+    def test_unknown_algorithm(self):
+        with pytest.raises(ValueError):
+            generate_cache_key("p", "gpt-4", algorithm="md5")
@@ -3,7 +3,8 @@
 import pytest
 import time
 
-from parsec.cache.memory import InMemoryCache
+from parsec.cache import memory as memory_module
+from parsec.cache.memory import InMemoryCache, estimate_size
 
 
 class TestInMemoryCacheBasics:
@@ -358,3 +359,167 @@ class TestInMemoryCacheEdgeCases:
         cache.set("", "empty_key_value")
 
         assert cache.get("") == "empty_key_value"
+
+
+class TestInMemoryCacheBytes:
+    """Test byte-size-aware eviction."""
+
+    def test_estimate_size_grows_with_content(self):
+        """Test that larger values are estimated as larger."""
+        small = {"data": "x"}
+        large = {"data": "x" * 10000, "items": list(range(100))}
+        assert estimate_size(large) > estimate_size(small) + 10000
+
+    def test_bytes_tracked_in_stats(self):
+        """Test that stored bytes are reported and released."""
+        cache = InMemoryCache(max_bytes=10**6)
+        cache.set("key1", "x" * 1000)
+        assert cache.get_stats()["bytes"] > 1000
+
+        cache.delete("key1")
+        assert cache.get_stats()["bytes"] == 0
+
+    def test_no_sizing_without_byte_budget(self):
+        """Test that sizeof is never called when max_bytes is not set."""
+        def sizeof(value):
+            raise AssertionError("sizeof called without a byte budget")
+
+        cache = InMemoryCache(max_size=2, sizeof=sizeof)
+        for key in ("a", "b", "c", "a"):
+            cache.set(key, {"data": key})
+
+        assert cache.get("a") == {"data": "a"}
+        assert cache.get_stats()["bytes"] == 0
+
+    def test_evicts_by_bytes(self):
+        """Test that LRU entries are evicted to stay within max_bytes."""
+        cache = InMemoryCache(max_bytes=5000, sizeof=lambda v: len(v))
+        cache.set("a", "x" * 2000)
+        cache.set("b", "x" * 2000)
+        cache.get("a")
+        cache.set("c", "x" * 2000)
+
+        assert cache.exists("a")
+        assert not cache.exists("b")
+        assert cache.exists("c")
+        stats = cache.get_stats()
+        assert stats["bytes"] == 4002
+        assert stats["evictions"] == 1
+
+    def test_large_entry_evicts_several(self):
+        """Test that one large entry can displace several small ones."""
+        cache = InMemoryCache(max_bytes=1000, sizeof=lambda v: len(v))
+        for i in range(9):
+            cache.set(f"k{i}", "x" * 99)
+        cache.set("big", "x" * 500)
+
+        assert cache.get_stats()["size"] == 5
+        assert cache.get_stats()["evictions"] == 5
+
+    def test_oversized_entry_not_stored(self):
+        """Test that an entry larger than the whole budget is rejected."""
+        cache = InMemoryCache(max_bytes=100, sizeof=lambda v: len(v))
+        cache.set("a", "x" * 50)
+        cache.set("huge", "x" * 500)
+
+        assert cache.get("huge") is None
+        assert cache.get("a") == "x" * 50
+
+    def test_overwrite_replaces_bytes(self):
+        """Test that updating a key doesn't double count or evict others."""
+        cache = InMemoryCache(max_size=2, max_bytes=1000, sizeof=lambda v: len(v))
+        cache.set("a", "x" * 10)
+        cache.set("b", "x" * 10)
+        cache.set("a", "x" * 20)
+
+        assert cache.exists("b")
+        stats = cache.get_stats()
+        assert stats["bytes"] == (1 + 20) + (1 + 10)
+        assert stats["evictions"] == 0
+
+
+class TestInMemoryCacheExpiry:
+    """Test proactive TTL expiry."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Controllable replacement for time.time in the memory module."""
+        now = [1000.0]
+        monkeypatch.setattr(memory_module.time, "time", lambda: now[0])
+        return now
+
+    def test_exists_honors_ttl(self, clock):
+        """Test that exists() is False once an entry has expired."""
+        cache = InMemoryCache()
+        cache.set("key", "value", ttl=10)
+        assert cache.exists("key")
+
+        clock[0] += 11
+        assert not cache.exists("key")
+
+    def test_expired_entries_reclaimed_before_live_ones(self, clock):
+        """Test that a full cache drops expired entries instead of evicting live LRU ones."""
+        cache = InMemoryCache(max_size=3)
+        cache.set("live", 1, ttl=100)
+        cache.set("short1", 2, ttl=1)
+        cache.set("short2", 3, ttl=1)
+
+        clock[0] += 5
+        cache.set("new", 4)
+
+        assert cache.exists("live")
+        assert cache.exists("new")
+        stats = cache.get_stats()
+        assert stats["evictions"] == 0
+        assert stats["expirations"] == 2
+        assert stats["size"] == 2
+
+    def test_incremental_sweep_on_access(self, clock):
+        """Test that get/set reclaim expired entries without touching them."""
+        cache = InMemoryCache()
+        for i in range(8):
+            cache.set(f"k{i}", i, ttl=1)
+
+        clock[0] += 5
+        cache.get("other")
+        cache.get("other")
+
+        assert cache.get_stats()["size"] == 0
+        assert cache.get_stats()["expirations"] == 8
+
+    def test_purge_expired(self, clock):
+        """Test purging all expired entries at once."""
+        cache = InMemoryCache()
+        for i in range(20):
+            cache.set(f"k{i}", i, ttl=1 if i % 2 else 100)
+
+        clock[0] += 5
+        assert cache.purge_expired() == 10
+        assert cache.get_stats()["size"] == 10
+
+    def test_overwrite_resets_expiry(self, clock):
+        """Test that a stale heap item doesn't expire a rewritten entry."""
+        cache = InMemoryCache()
+        cache.set("key", "old", ttl=1)
+        cache.set("key", "new", ttl=100)
+
+        clock[0] += 5
+        assert cache.purge_expired() == 0
+        assert cache.get("key") == "new"
+
+    def test_heap_stays_bounded_under_overwrites(self, clock):
+        """Test that repeated overwrites don't grow the expiry heap without bound."""
+        cache = InMemoryCache()
+        for i in range(10000):
+            cache.set("key", i)
+
+        assert len(cache._expiry_heap) < 200
+
+    def test_get_many_with_ttl(self, clock):
+        """Test that bulk reads report the seconds each entry has left."""
+        cache = InMemoryCache()
+        cache.set("a", 1, ttl=10)
+        cache.set("b", 2, ttl=100)
+        clock[0] += 4
+
+        assert cache.get_many_with_ttl(["a", "b", "missing"]) == {"a": (1, 6.0), "b": (2, 96.0)}
@@ -0,0 +1,106 @@
+"""Tests for InMemoryCache eviction policies."""
+
+import pytest
+
+from parsec.cache.memory import InMemoryCache
+from parsec.cache.policies import CountMinSketch, LRUPolicy, TinyLFUPolicy
+
+
+class TestCountMinSketch:
+
+    def test_estimates_frequency(self):
+        sketch = CountMinSketch(capacity=100)
+        for _ in range(5):
+            sketch.increment("hot")
+        sketch.increment("cold")
+
+        assert sketch.estimate("hot") >= 5
+        assert sketch.estimate("hot") > sketch.estimate("cold")
+        assert sketch.estimate("never") <= 1
+
+    def test_counters_saturate(self):
+        sketch = CountMinSketch(capacity=1000)
+        for _ in range(100):
+            sketch.increment("key")
+
+        assert sketch.estimate("key") == 15
+
+    def test_aging_halves_counts(self):
+        sketch = CountMinSketch(capacity=1)
+        for _ in range(8):
+            sketch.increment("key")
+        before = sketch.estimate("key")
+        for _ in range(sketch.sample_size):
+            sketch.increment("key")
+
+        assert sketch.estimate("key") < 15
+        assert before == 8
+
+
+class TestTinyLFUPolicy:
+
+    @staticmethod
+    def hot_hit_rate(cache):
+        """Hot-key hit rate when every round of hot traffic is followed by a scan."""
+        hot = [f"hot-{i}" for i in range(50)]
+        hits = lookups = 0
+        for round_ in range(6):
+            for key in hot:
+                lookups += 1
+                if cache.get(key) is not None:
+                    hits += 1
+                else:
+                    cache.set(key, key)
+            for i in range(200):
+                cache.set(f"scan-{round_}-{i}", i)
+        return hits / lookups
+
+    def test_scans_do_not_flush_hot_keys(self):
+        assert self.hot_hit_rate(InMemoryCache(max_size=100, policy="tinylfu")) > 0.5
+
+    def test_lru_is_flushed_by_scans(self):
+        assert self.hot_hit_rate(InMemoryCache(max_size=100)) == 0
+
+    def test_respects_capacity_and_removal(self):
+        cache = InMemoryCache(max_size=10, policy="tinylfu")
+        for i in range(50):
+            cache.set(f"k{i}", i)
+            if i % 3 == 0:
+                cache.delete(f"k{i}")
+
+        assert cache.get_stats()["size"] <= 10
+        cache.clear()
+        assert cache.get_stats()["size"] == 0
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+    def test_policy_instance_and_unknown_name(self):
+        cache = InMemoryCache(max_size=2, policy=LRUPolicy())
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+        with pytest.raises(ValueError):
+            InMemoryCache(policy="fifo")
+
+    def test_frequent_window_key_displaces_main_victim(self):
+        policy = TinyLFUPolicy(capacity=3, window_ratio=0.34)
+        for key in ("a", "b", "c"):
+            policy.on_insert(key)
+        for _ in range(3):
+            policy.on_access("b")
+            policy.on_access("c")
+        policy.on_insert("d")
+
+        # "c" leaves the window and is used more often than probation's "a"
+        assert policy.evict() == "a"
+
+    def test_infrequent_window_key_is_rejected(self):
+        policy = TinyLFUPolicy(capacity=3, window_ratio=0.34)
+        for key in ("a", "b", "c"):
+            policy.on_insert(key)
+        for _ in range(3):
+            policy.on_access("a")
+            policy.on_access("b")
+        policy.on_insert("d")
+
+        assert policy.evict() == "c"
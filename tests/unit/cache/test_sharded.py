@@ -0,0 +1,87 @@
+"""Tests for ShardedCache."""
+
+import threading
+import pytest
+
+from parsec.cache import ShardedCache
+
+
+class TestShardedCache:
+
+    def test_set_get_delete(self):
+        cache = ShardedCache(shards=4)
+        cache.set("key", {"data": 1})
+
+        assert cache.get("key") == {"data": 1}
+        assert cache.exists("key")
+        cache.delete("key")
+        assert cache.get("key") is None
+
+    def test_keys_spread_over_shards(self):
+        cache = ShardedCache(shards=8, max_size=1000)
+        for i in range(400):
+            cache.set(f"k{i}", i)
+
+        sizes = [shard.get_stats()["size"] for shard in cache._shards]
+        assert sum(sizes) == 400
+        assert min(sizes) > 0
+
+    def test_capacity_divided_between_shards(self):
+        cache = ShardedCache(shards=4, max_size=40)
+        for i in range(1000):
+            cache.set(f"k{i}", i)
+
+        stats = cache.get_stats()
+        assert stats["size"] <= 40
+        assert stats["evictions"] == 1000 - stats["size"]
+
+    def test_bulk_operations(self):
+        cache = ShardedCache(shards=4)
+        cache.set_many({f"k{i}": i for i in range(50)})
+
+        assert cache.get_many([f"k{i}" for i in range(60)]) == {f"k{i}": i for i in range(50)}
+        stats = cache.get_stats()
+        assert stats["hits"] == 50
+        assert stats["misses"] == 10
+
+    def test_clear(self):
+        cache = ShardedCache(shards=4)
+        cache.set_many({"a": 1, "b": 2})
+        cache.clear()
+
+        assert cache.get_stats()["size"] == 0
+
+    def test_invalid_shard_count(self):
+        with pytest.raises(ValueError):
+            ShardedCache(shards=0)
+
+    def test_passes_options_to_shards(self):
+        cache = ShardedCache(shards=2, max_size=100, policy="tinylfu")
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+
+    def test_concurrent_access_keeps_accurate_stats(self):
+        cache = ShardedCache(shards=8, max_size=500)
+        n_threads, ops = 8, 2000
+        errors = []
+
+        def worker(seed):
+            try:
+                for i in range(ops):
+                    key = f"k{(seed * 7919 + i) % 700}"
+                    if cache.get(key) is None:
+                        cache.set(key, i)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(t,)) for t in range(n_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not errors
+        stats = cache.get_stats()
+        assert stats["hits"] + stats["misses"] == n_threads * ops
+        assert stats["size"] <= 500
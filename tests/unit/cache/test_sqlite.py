@@ -0,0 +1,247 @@
+"""Tests for SQLiteCache."""
+
+import sqlite3
+import sys
+import threading
+import time
+import pytest
+
+from parsec.cache import SQLiteCache
+from parsec.cache import sqlite as sqlite_module
+from parsec.core import GenerationResponse, ValidationResult, ValidationStatus
+from parsec.enforcement.engine import EnforcedOutput
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "cache.db")
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for time.time in the sqlite module."""
+    now = [1000.0]
+    monkeypatch.setattr(sqlite_module.time, "time", lambda: now[0])
+    return now
+
+
+def make_output(name="John"):
+    return EnforcedOutput(
+        data={"name": name},
+        generation=GenerationResponse(
+            output=f'{{"name": "{name}"}}', provider="openai", model="gpt-4o", tokens_used=12, latency_ms=850.0
+        ),
+        validation=ValidationResult(
+            status=ValidationStatus.VALID, parsed_output={"name": name}, raw_output=f'{{"name": "{name}"}}'
+        ),
+        success=True
+    )
+
+
+class TestSQLiteCache:
+
+    def test_set_and_get(self, db_path):
+        cache = SQLiteCache(db_path)
+        cache.set("key1", {"data": [1, 2]})
+
+        assert cache.get("key1") == {"data": [1, 2]}
+        assert cache.get("missing") is None
+        stats = cache.get_stats()
+        assert stats["hits"] == 1 and stats["misses"] == 1 and stats["size"] == 1
+
+    def test_enforced_output_round_trip(self, db_path):
+        cache = SQLiteCache(db_path)
+        output = make_output()
+        cache.set("key", output)
+
+        restored = cache.get("key")
+
+        assert isinstance(restored, EnforcedOutput)
+        assert restored == output
+
+    def test_survives_restart(self, db_path):
+        cache = SQLiteCache(db_path)
+        cache.set("key", make_output())
+        cache.close()
+
+        assert SQLiteCache(db_path).get("key").data == {"name": "John"}
+
+    def test_ttl_expiry(self, db_path, clock):
+        cache = SQLiteCache(db_path, default_ttl=10)
+        cache.set("short", 1, ttl=1)
+        cache.set("default", 2)
+
+        clock[0] += 5
+        assert cache.get("short") is None
+        assert not cache.exists("short")
+        assert cache.get("default") == 2
+
+        clock[0] += 10
+        assert cache.purge_expired() == 1
+        assert cache.get_stats()["size"] == 0
+
+    def test_no_expiry_by_default_ttl_none(self, db_path, clock):
+        cache = SQLiteCache(db_path, default_ttl=None)
+        cache.set("key", 1)
+
+        clock[0] += 10 ** 9
+        assert cache.get("key") == 1
+
+    def test_lru_eviction(self, db_path, clock):
+        cache = SQLiteCache(db_path, max_size=2)
+        cache.set("a", 1)
+        clock[0] += 1
+        cache.set("b", 2)
+        clock[0] += 1
+        cache.get("a")
+        clock[0] += 1
+        cache.set("c", 3)
+
+        assert cache.exists("a")
+        assert not cache.exists("b")
+        assert cache.exists("c")
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_bulk_operations(self, db_path):
+        cache = SQLiteCache(db_path)
+        items = {f"k{i}": i for i in range(1200)}
+        cache.set_many(items)
+
+        found = cache.get_many(list(items) + ["missing"])
+
+        assert found == items
+        assert cache.get_stats()["misses"] == 1
+
+    def test_delete_and_clear(self, db_path):
+        cache = SQLiteCache(db_path)
+        cache.set_many({"a": 1, "b": 2})
+
+        cache.delete("a")
+        assert not cache.exists("a")
+
+        cache.clear()
+        assert cache.get_stats()["size"] == 0
+
+    def test_concurrent_instances(self, db_path):
+        writer = SQLiteCache(db_path)
+        reader = SQLiteCache(db_path)
+        errors = []
+
+        def write():
+            try:
+                for i in range(100):
+                    writer.set(f"k{i}", i)
+            except Exception as e:
+                errors.append(e)
+
+        def read():
+            try:
+                for i in range(100):
+                    reader.get(f"k{i}")
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=write)] + [threading.Thread(target=read) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not errors
+        assert reader.get("k99") == 99
+        writer.close()
+        reader.close()
+
+    def test_reads_do_not_wait_for_writer_lock(self, db_path, clock):
+        cache = SQLiteCache(db_path, default_ttl=10, timeout=5.0)
+        cache.set_many({"live": 1, "stale": 2})
+        cache.set("stale", 2, ttl=1)
+        clock[0] += 5
+
+        blocker = sqlite3.connect(db_path, isolation_level=None)
+        blocker.execute("BEGIN IMMEDIATE")
+        try:
+            started = time.monotonic()
+            assert cache.get_many(["live", "stale"]) == {"live": 1}
+            assert time.monotonic() - started < 1.0
+        finally:
+            blocker.execute("ROLLBACK")
+            blocker.close()
+
+    def test_access_times_written_with_next_write(self, db_path, clock):
+        cache = SQLiteCache(db_path)
+        cache.set("a", 1)
+        clock[0] += 1
+        statements = []
+        cache._connection().set_trace_callback(statements.append)
+
+        cache.get("a")
+        assert not any(s.startswith("UPDATE") for s in statements)
+
+        clock[0] += 1
+        cache.set("b", 2)
+        assert any(s.startswith("UPDATE") for s in statements)
+
+    def test_writes_do_not_count_table(self, db_path):
+        cache = SQLiteCache(db_path, max_size=50)
+        cache.set("first", 0)
+        statements = []
+        cache._connection().set_trace_callback(statements.append)
+
+        for i in range(200):
+            cache.set(f"k{i}", i)
+
+        assert not any(s == "SELECT COUNT(*) FROM cache_entries" for s in statements)
+        stats = cache.get_stats()
+        assert stats["size"] == 50
+        assert stats["evictions"] == 151
+
+    def test_eviction_after_delete_and_overwrite(self, db_path, clock):
+        cache = SQLiteCache(db_path, max_size=3)
+        cache.set_many({"a": 1, "b": 2, "c": 3})
+        cache.delete("a")
+        clock[0] += 1
+        cache.set("b", 20)
+        cache.set("d", 4)
+
+        assert cache.get_stats()["evictions"] == 0
+        assert cache.get_many(["b", "c", "d"]) == {"b": 20, "c": 3, "d": 4}
+
+    def test_get_many_with_ttl(self, db_path, clock):
+        cache = SQLiteCache(db_path, default_ttl=None)
+        cache.set("short", 1, ttl=10)
+        cache.set("forever", 2)
+        clock[0] += 4
+
+        assert cache.get_many_with_ttl(["short", "forever", "missing"]) == {
+            "short": (1, 6.0),
+            "forever": (2, None),
+        }
+
+    def test_model_module_not_imported_from_row(self, db_path, tmp_path, monkeypatch):
+        (tmp_path / "planted_module.py").write_text("import sys\nsys.planted = True\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        cache = SQLiteCache(db_path)
+        cache.set("key", 1)
+        cache._connection().execute(
+            "UPDATE cache_entries SET value = ?",
+            ('{"__model__": "planted_module:Model", "data": {}}',)
+        )
+
+        with pytest.raises(TypeError):
+            cache.get("key")
+        assert "planted_module" not in sys.modules
+        assert not hasattr(sys, "planted")
+
+    def test_only_lock_errors_skip_best_effort_writes(self, db_path):
+        cache = SQLiteCache(db_path)
+        conn = cache._connection()
+
+        def fail(message):
+            def write():
+                raise sqlite3.OperationalError(message)
+            return write
+
+        cache._try_write(conn, fail("database is locked"))
+        with pytest.raises(sqlite3.OperationalError, match="disk I/O"):
+            cache._try_write(conn, fail("disk I/O error"))
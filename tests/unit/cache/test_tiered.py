@@ -0,0 +1,154 @@
+"""Tests for TieredCache."""
+
+import time
+
+import pytest
+
+from parsec.cache import InMemoryCache, SQLiteCache, TieredCache
+
+
+@pytest.fixture
+def l2(tmp_path):
+    return SQLiteCache(str(tmp_path / "l2.db"))
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for time.time in both tiers."""
+    now = [1000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    return now
+
+
+class TestTieredCache:
+
+    def test_l1_hit(self, l2):
+        cache = TieredCache(l2)
+        cache.set("key", 1)
+
+        assert cache.get("key") == 1
+        stats = cache.get_stats()
+        assert stats["l1"]["hits"] == 1
+        assert stats["l2"]["hits"] == 0
+
+    def test_l2_hit_is_promoted(self, l2):
+        l2.set("key", {"data": 1})
+        cache = TieredCache(l2)
+
+        assert cache.get("key") == {"data": 1}
+        assert cache.l1.exists("key")
+        assert cache.get("key") == {"data": 1}
+
+        stats = cache.get_stats()
+        assert stats["promotions"] == 1
+        assert stats["l1"] == {"hits": 1, "misses": 1, "hit_rate": "50.00%"}
+        assert stats["l2"] == {"hits": 1, "misses": 0, "hit_rate": "100.00%"}
+        assert stats["hit_rate"] == "100.00%"
+
+    def test_miss_in_both_tiers(self, l2):
+        cache = TieredCache(l2)
+
+        assert cache.get("missing") is None
+        assert cache.get_stats()["misses"] == 1
+
+    def test_write_through(self, l2):
+        cache = TieredCache(l2)
+        cache.set("key", 1)
+
+        assert l2.get("key") == 1
+
+    def test_write_back_batches_l2_writes(self, l2):
+        cache = TieredCache(l2, write_back=True, flush_every=3)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        assert not l2.exists("a")
+        assert cache.get_stats()["pending_writes"] == 2
+
+        cache.set("c", 3)
+        assert l2.get_many(["a", "b", "c"]) == {"a": 1, "b": 2, "c": 3}
+        assert cache.get_stats()["pending_writes"] == 0
+
+    def test_write_back_survives_l1_eviction(self, l2):
+        cache = TieredCache(l2, l1=InMemoryCache(max_size=1), write_back=True)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        assert not cache.l1.exists("a")
+        assert cache.get("a") == 1
+
+        cache.flush()
+        assert l2.get("b") == 2
+
+    def test_get_many(self, l2):
+        l2.set_many({"b": 2, "c": 3})
+        cache = TieredCache(l2)
+        cache.set("a", 1)
+
+        assert cache.get_many(["a", "b", "c", "d"]) == {"a": 1, "b": 2, "c": 3}
+        stats = cache.get_stats()
+        assert stats["l1"]["hits"] == 1
+        assert stats["l2"]["hits"] == 2
+        assert stats["l2"]["misses"] == 1
+
+    def test_delete_and_clear(self, l2):
+        cache = TieredCache(l2, write_back=True)
+        cache.set("a", 1)
+        cache.delete("a")
+        assert not cache.exists("a")
+
+        l2.set("b", 2)
+        cache.set("c", 3)
+        cache.clear()
+        assert not cache.exists("b")
+        assert not cache.exists("c")
+
+    def test_promoted_entry_keeps_l2_expiry(self, l2, clock):
+        l2.set("short", 1, ttl=5)
+        cache = TieredCache(l2, l1=InMemoryCache(default_ttl=3600))
+
+        clock[0] += 3
+        assert cache.get("short") == 1
+        assert cache.l1.exists("short")
+
+        clock[0] += 3
+        assert not cache.l1.exists("short")
+        assert cache.get("short") is None
+
+    def test_promote_ttl_caps_lifetime(self, l2, clock):
+        l2.set_many({"a": 1}, ttl=3600)
+        l2.set_many({"b": 2}, ttl=None)
+        cache = TieredCache(l2, promote_ttl=10)
+
+        assert cache.get_many(["a", "b"]) == {"a": 1, "b": 2}
+
+        clock[0] += 11
+        assert not cache.l1.exists("a")
+        assert not cache.l1.exists("b")
+        assert cache.get("a") == 1
+
+    def test_pending_write_expires_with_l2_default(self, tmp_path, clock):
+        l2 = SQLiteCache(str(tmp_path / "short.db"), default_ttl=1)
+        cache = TieredCache(l2, l1=InMemoryCache(max_size=1, default_ttl=1), write_back=True)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        clock[0] += 1.2
+        assert cache.get("a") is None
+        assert not cache.exists("a")
+        cache.flush()
+        assert not l2.exists("a")
+
+    def test_pending_hit_keeps_remaining_ttl(self, l2, clock):
+        cache = TieredCache(l2, l1=InMemoryCache(max_size=1), write_back=True)
+        cache.set("a", 1, ttl=10)
+        cache.set("b", 2)
+
+        clock[0] += 6
+        assert cache.get("a") == 1
+        stats = cache.get_stats()
+        assert stats["pending_hits"] == 1
+        assert stats["l2"] == {"hits": 0, "misses": 0, "hit_rate": "0.00%"}
+
+        clock[0] += 5
+        assert not cache.l1.exists("a")
@@ -0,0 +1,19 @@
+"""Fixtures shared by all unit tests."""
+
+import pytest
+
+
+class FakeClock:
+    """Manually advanced monotonic clock; set `now` to move time."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """A FakeClock starting at 0."""
+    return FakeClock()
@@ -0,0 +1,56 @@
+"""Tests for StreamBuffer and LightStreamChunk."""
+
+import pytest
+
+from parsec.core import LightStreamChunk, StreamBuffer
+
+
+class TestStreamBuffer:
+
+    def test_append_and_text(self):
+        buffer = StreamBuffer()
+        for delta in ["ab", "c", "", "de"]:
+            buffer.append(delta)
+
+        assert buffer.text() == "abcde"
+        assert len(buffer) == 5
+
+    def test_text_after_more_appends(self):
+        buffer = StreamBuffer()
+        buffer.append("ab")
+        assert buffer.text() == "ab"
+
+        buffer.append("cd")
+        assert buffer.text() == "abcd"
+
+    def test_snapshot(self):
+        buffer = StreamBuffer()
+        buffer.append("abc")
+        buffer.append("def")
+
+        assert buffer.text(3) == "abc"
+
+
+class TestLightStreamChunk:
+
+    def test_accumulated_is_snapshot_at_creation(self):
+        buffer = StreamBuffer()
+        buffer.append("ab")
+        first = LightStreamChunk("ab", buffer, False, "openai", "m")
+        buffer.append("cd")
+        second = LightStreamChunk("cd", buffer, False, "openai", "m")
+
+        assert first.accumulated == "ab"
+        assert second.accumulated == "abcd"
+
+    def test_delta_only(self):
+        chunk = LightStreamChunk("ab", None, False, "openai", "m")
+
+        assert chunk.delta == "ab"
+        with pytest.raises(ValueError):
+            chunk.accumulated
+
+    def test_slots(self):
+        chunk = LightStreamChunk("ab", None, False, "openai", "m")
+        with pytest.raises(AttributeError):
+            chunk.extra = 1
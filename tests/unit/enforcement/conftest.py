@@ -0,0 +1,89 @@
+"""Shared fixtures for enforcement engine tests."""
+
+import asyncio
+import json
+import pytest
+
+from parsec.core import BaseLLMAdapter, GenerationResponse, ModelProviders
+
+
+class FakeAdapter(BaseLLMAdapter):
+    """Scriptable adapter that answers from a function of the prompt."""
+
+    def __init__(self, respond=None, delay: float = 0.0, model: str = "fake-model", chunk_size: int = 4):
+        super().__init__(api_key="test", model=model)
+        self.respond = respond or (lambda prompt: '{"name": "John"}')
+        self.delay = delay
+        self.chunk_size = chunk_size
+        self.streams_closed = 0
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @property
+    def provider(self) -> ModelProviders:
+        return ModelProviders.OPENAI
+
+    def supports_native_structure_output(self) -> bool:
+        return True
+
+    def supports_streaming(self) -> bool:
+        return True
+
+    async def generate(self, prompt, schema=None, temperature=0.7, max_tokens=None, **kwargs):
+        self.calls.append(prompt)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            delay = self.delay(prompt) if callable(self.delay) else self.delay
+            await asyncio.sleep(delay)
+            output = self.respond(prompt)
+            if isinstance(output, Exception):
+                raise output
+            return GenerationResponse(
+                output=output,
+                provider=self.provider.value,
+                model=self.model,
+                tokens_used=10,
+                latency_ms=delay * 1000
+            )
+        finally:
+            self.in_flight -= 1
+
+    async def generate_stream(self, prompt, schema=None, temperature=0.7, max_tokens=None, **kwargs):
+        self.calls.append(prompt)
+        output = self.respond(prompt)
+        try:
+            for i in range(0, len(output), self.chunk_size):
+                await asyncio.sleep(0)
+                yield output[i:i + self.chunk_size]
+        finally:
+            self.streams_closed += 1
+
+
+def echo(prompt):
+    """Answer {"name": <first line of the prompt>}; prompts starting with "boom" fail."""
+    if prompt.startswith("boom"):
+        return RuntimeError(f"provider failed for {prompt}")
+    return json.dumps({"name": prompt.split("\n")[0]})
+
+
+@pytest.fixture
+def fake_adapter():
+    """Factory for FakeAdapter instances."""
+    return FakeAdapter
+
+
+@pytest.fixture(name="echo")
+def echo_fixture():
+    """Responder for FakeAdapter that echoes the prompt back as the name."""
+    return echo
+
+
+@pytest.fixture
+def name_schema():
+    return {
+        "type": "object",
+        "properties": {"name": {"type": "string"}},
+        "required": ["name"]
+    }
@@ -0,0 +1,87 @@
+"""Tests for EnforcementEngine batch enforcement."""
+
+import pytest
+
+from parsec.cache import InMemoryCache
+from parsec.enforcement.engine import EnforcementEngine, EnforcedOutput
+from parsec.validators import JSONValidator
+
+
+class TestEnforceMany:
+
+    async def test_results_in_input_order(self, fake_adapter, name_schema, echo):
+        # Earlier prompts take longer, so completion order is reversed
+        adapter = fake_adapter(echo, delay=lambda p: 0.05 - int(p[1:]) * 0.01)
+        engine = EnforcementEngine(adapter, JSONValidator())
+
+        prompts = [f"p{i}" for i in range(5)]
+        results = await engine.enforce_many(prompts, name_schema, concurrency=5)
+
+        assert [r.data["name"] for r in results] == prompts
+
+    async def test_concurrency_is_bounded(self, fake_adapter, name_schema, echo):
+        adapter = fake_adapter(echo, delay=0.01)
+        engine = EnforcementEngine(adapter, JSONValidator())
+
+        results = await engine.enforce_many((f"p{i}" for i in range(20)), name_schema, concurrency=3)
+
+        assert len(results) == 20
+        assert adapter.max_in_flight == 3
+
+    async def test_errors_are_isolated(self, fake_adapter, name_schema, echo):
+        adapter = fake_adapter(echo)
+        engine = EnforcementEngine(adapter, JSONValidator())
+
+        results = await engine.enforce_many(["a", "boom", "c"], name_schema)
+
+        assert isinstance(results[0], EnforcedOutput)
+        assert isinstance(results[1], RuntimeError)
+        assert isinstance(results[2], EnforcedOutput)
+
+    async def test_uses_cache(self, fake_adapter, name_schema, echo):
+        adapter = fake_adapter(echo)
+        cache = InMemoryCache()
+        engine = EnforcementEngine(adapter, JSONValidator(), cache=cache)
+
+        await engine.enforce_many(["a", "b"], name_schema)
+        await engine.enforce_many(["a", "b"], name_schema)
+
+        assert len(adapter.calls) == 2
+        assert cache.get_stats()["hits"] == 2
+
+    async def test_invalid_concurrency(self, fake_adapter, name_schema, echo):
+        engine = EnforcementEngine(fake_adapter(echo), JSONValidator())
+
+        with pytest.raises(ValueError):
+            await engine.enforce_many(["a"], name_schema, concurrency=0)
+
+
+class TestEnforceIter:
+
+    async def test_completion_order(self, fake_adapter, name_schema, echo):
+        adapter = fake_adapter(echo, delay=lambda p: 0.03 if p == "slow" else 0.0)
+        engine = EnforcementEngine(adapter, JSONValidator())
+
+        indices = [i async for i, _ in engine.enforce_iter(["slow", "fast"], name_schema)]
+
+        assert indices == [1, 0]
+
+    async def test_ordered(self, fake_adapter, name_schema, echo):
+        adapter = fake_adapter(echo, delay=lambda p: 0.03 if p == "slow" else 0.0)
+        engine = EnforcementEngine(adapter, JSONValidator())
+
+        indices = [i async for i, _ in engine.enforce_iter(["slow", "fast"], name_schema, ordered=True)]
+
+        assert indices == [0, 1]
+
+    async def test_early_exit_cancels_pending(self, fake_adapter, name_schema, echo):
+        adapter = fake_adapter(echo, delay=lambda p: 0.0 if p == "p0" else 10)
+        engine = EnforcementEngine(adapter, JSONValidator())
+
+        stream = engine.enforce_iter([f"p{i}" for i in range(4)], name_schema, concurrency=4)
+        async for index, result in stream:
+            assert index == 0
+            break
+        await stream.aclose()
+
+        assert adapter.in_flight == 0
@@ -0,0 +1,111 @@
+"""Tests for single-flight coalescing in EnforcementEngine."""
+
+import asyncio
+import pytest
+
+from parsec.cache import InMemoryCache
+from parsec.enforcement.engine import EnforcementEngine
+from parsec.validators import JSONValidator
+
+
+class TestCoalescing:
+
+    async def test_identical_calls_share_one_generation(self, fake_adapter, name_schema, echo):
+        adapter = fake_adapter(echo, delay=0.02)
+        engine = EnforcementEngine(adapter, JSONValidator(), cache=InMemoryCache(), coalesce=True)
+
+        results = await asyncio.gather(*(engine.enforce("a", name_schema) for _ in range(10)))
+
+        assert len(adapter.calls) == 1
+        assert all(r.data == {"name": "a"} for r in results)
+        stats = engine.get_stats()
+        assert stats["requests"] == 10
+        assert stats["flights"] == 1
+        assert stats["joins"] == 9
+        assert stats["in_flight"] == 0
+
+    async def test_different_calls_are_not_coalesced(self, fake_adapter, name_schema, echo):
+        adapter = fake_adapter(echo, delay=0.01)
+        engine = EnforcementEngine(adapter, JSONValidator(), coalesce=True)
+
+        await asyncio.gather(
+            engine.enforce("a", name_schema),
+            engine.enforce("b", name_schema),
+            engine.enforce("a", name_schema, temperature=0.0),
+        )
+
+        assert len(adapter.calls) == 3
+        assert engine.get_stats()["joins"] == 0
+
+    async def test_off_by_default(self, fake_adapter, name_schema, echo):
+        adapter = fake_adapter(echo, delay=0.01)
+        engine = EnforcementEngine(adapter, JSONValidator(), cache=InMemoryCache())
+
+        await asyncio.gather(*(engine.enforce("a", name_schema) for _ in range(3)))
+
+        assert len(adapter.calls) == 3
+
+    async def test_later_calls_hit_cache(self, fake_adapter, name_schema, echo):
+        adapter = fake_adapter(echo, delay=0.01)
+        engine = EnforcementEngine(adapter, JSONValidator(), cache=InMemoryCache(), coalesce=True)
+
+        await asyncio.gather(*(engine.enforce("a", name_schema) for _ in range(3)))
+        await engine.enforce("a", name_schema)
+
+        assert len(adapter.calls) == 1
+        assert engine.get_stats()["cache_hits"] == 1
+
+    async def test_callers_get_independent_results(self, fake_adapter, name_schema, echo):
+        adapter = fake_adapter(echo, delay=0.01)
+        engine = EnforcementEngine(adapter, JSONValidator(), coalesce=True)
+
+        first, second = await asyncio.gather(*(engine.enforce("a", name_schema) for _ in range(2)))
+        first.data["name"] = "changed"
+
+        assert first is not second
+        assert second.data == {"name": "a"}
+
+    async def test_errors_propagate_to_all_waiters(self, fake_adapter, name_schema):
+        adapter = fake_adapter(lambda p: RuntimeError("down"), delay=0.01)
+        engine = EnforcementEngine(adapter, JSONValidator(), coalesce=True)
+
+        results = await asyncio.gather(
+            *(engine.enforce("a", name_schema) for _ in range(3)), return_exceptions=True
+        )
+
+        assert len(adapter.calls) == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert engine.get_stats()["in_flight"] == 0
+
+    async def test_cancelling_one_waiter_keeps_flight_alive(self, fake_adapter, name_schema, echo):
+        adapter = fake_adapter(echo, delay=0.05)
+        engine = EnforcementEngine(adapter, JSONValidator(), coalesce=True)
+
+        leader = asyncio.ensure_future(engine.enforce("a", name_schema))
+        follower = asyncio.ensure_future(engine.enforce("a", name_schema))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        result = await follower
+        assert result.data == {"name": "a"}
+        assert leader.cancelled()
+        assert len(adapter.calls) == 1
+
+    async def test_cancelling_all_waiters_cancels_flight(self, fake_adapter, name_schema, echo):
+        adapter = fake_adapter(echo, delay=0.05)
+        engine = EnforcementEngine(adapter, JSONValidator(), coalesce=True)
+
+        waiters = [asyncio.ensure_future(engine.enforce("a", name_schema)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert adapter.in_flight == 0
+        assert engine.get_stats()["in_flight"] == 0
+
+        # A new call starts a fresh flight rather than joining the cancelled one
+        result = await engine.enforce("a", name_schema)
+        assert result.success
+        assert engine.get_stats()["flights"] == 2
@@ -0,0 +1,194 @@
+"""Tests for EnforcementEngine cache integration."""
+
+import asyncio
+from datetime import datetime, timedelta
+import pytest
+
+from parsec.cache import AsyncCacheAdapter, InMemoryCache
+from parsec.cache.keys import generate_cache_key
+from parsec.enforcement.engine import EnforcementEngine, Freshness
+from parsec.validators import JSONValidator
+
+
+class TestAsyncCache:
+
+    async def test_engine_awaits_async_cache(self, fake_adapter, name_schema, echo):
+        adapter = fake_adapter(echo)
+        cache = AsyncCacheAdapter(InMemoryCache(), offload=True)
+        engine = EnforcementEngine(adapter, JSONValidator(), cache=cache)
+
+        first = await engine.enforce("a", name_schema)
+        second = await engine.enforce("a", name_schema)
+
+        assert second.data == first.data
+        assert len(adapter.calls) == 1
+        assert cache.get_stats()["hits"] == 1
+
+
+class TestStaleWhileRevalidate:
+
+    @staticmethod
+    def age_cached_entry(engine, prompt, schema, seconds):
+        """Backdate the cached result for `prompt` by `seconds`."""
+        key = generate_cache_key(prompt=prompt, model=engine.adapter.model, schema=schema, temperature=0.7)
+        cached = engine.cache.get(key)
+        cached.generation.timestamp = datetime.now() - timedelta(seconds=seconds)
+
+    async def test_freshness_recorded(self, fake_adapter, name_schema, echo):
+        engine = EnforcementEngine(fake_adapter(echo), JSONValidator(), cache=InMemoryCache(), soft_ttl=60)
+
+        first = await engine.enforce("a", name_schema)
+        second = await engine.enforce("a", name_schema)
+
+        assert first.freshness == Freshness.FRESH
+        assert second.freshness == Freshness.CACHED
+        assert engine.get_stats()["stale_hits"] == 0
+
+    async def test_stale_result_served_and_refreshed(self, fake_adapter, name_schema, echo):
+        adapter = fake_adapter(echo, delay=0.02)
+        engine = EnforcementEngine(adapter, JSONValidator(), cache=InMemoryCache(), soft_ttl=60)
+        await engine.enforce("a", name_schema)
+        self.age_cached_entry(engine, "a", name_schema, 120)
+
+        stale = await engine.enforce("a", name_schema)
+        assert stale.freshness == Freshness.STALE
+        assert len(adapter.calls) == 1  # returned without waiting for the refresh
+
+        await asyncio.sleep(0.05)
+        assert len(adapter.calls) == 2
+        refreshed = await engine.enforce("a", name_schema)
+        assert refreshed.freshness == Freshness.CACHED
+
+    async def test_refresh_deduplicated_per_key(self, fake_adapter, name_schema, echo):
+        adapter = fake_adapter(echo, delay=0.02)
+        engine = EnforcementEngine(adapter, JSONValidator(), cache=InMemoryCache(), soft_ttl=60)
+        await engine.enforce("a", name_schema)
+        self.age_cached_entry(engine, "a", name_schema, 120)
+
+        results = await asyncio.gather(*(engine.enforce("a", name_schema) for _ in range(5)))
+        await asyncio.sleep(0.05)
+
+        assert all(r.freshness == Freshness.STALE for r in results)
+        assert len(adapter.calls) == 2
+        stats = engine.get_stats()
+        assert stats["stale_hits"] == 5
+        assert stats["refreshes"] == 1
+
+    async def test_failed_refresh_keeps_stale_entry(self, fake_adapter, name_schema):
+        responses = iter(['{"name": "a"}'])
+        adapter = fake_adapter(lambda p: next(responses, RuntimeError("down")))
+        engine = EnforcementEngine(adapter, JSONValidator(), cache=InMemoryCache(), soft_ttl=60)
+        await engine.enforce("a", name_schema)
+        self.age_cached_entry(engine, "a", name_schema, 120)
+
+        await engine.enforce("a", name_schema)
+        await asyncio.sleep(0.01)
+
+        again = await engine.enforce("a", name_schema)
+        assert again.data == {"name": "a"}
+        assert again.freshness == Freshness.STALE
+
+    async def test_hard_ttl_passed_to_cache(self, fake_adapter, name_schema, echo):
+        adapter = fake_adapter(echo)
+        engine = EnforcementEngine(adapter, JSONValidator(), cache=InMemoryCache(), soft_ttl=1, hard_ttl=0)
+
+        await engine.enforce("a", name_schema)
+        await asyncio.sleep(0.01)
+        result = await engine.enforce("a", name_schema)
+
+        assert result.freshness == Freshness.FRESH
+        assert len(adapter.calls) == 2
+
+
+class TestPydanticSchemaCaching:
+
+    async def test_model_class_schema_is_cacheable(self, fake_adapter, echo):
+        from pydantic import BaseModel
+        from parsec.validators import PydanticValidator
+
+        class Person(BaseModel):
+            name: str
+
+        adapter = fake_adapter(echo)
+        engine = EnforcementEngine(adapter, PydanticValidator(), cache=InMemoryCache())
+
+        await engine.enforce("a", Person)
+        result = await engine.enforce("a", Person)
+
+        assert result.freshness == Freshness.CACHED
+        assert len(adapter.calls) == 1
+
+
+class TestNegativeCaching:
+
+    async def test_failure_cached_at_temperature_zero(self, fake_adapter, name_schema):
+        adapter = fake_adapter(lambda p: '{"age": 1}')
+        engine = EnforcementEngine(adapter, JSONValidator(), max_retries=2, cache=InMemoryCache(), negative_ttl=60)
+
+        first = await engine.enforce("a", name_schema, temperature=0)
+        second = await engine.enforce("a", name_schema, temperature=0)
+
+        assert not first.success and not second.success
+        assert second.freshness == Freshness.CACHED
+        assert len(adapter.calls) == 3
+        assert engine.get_stats()["negative_hits"] == 1
+
+    async def test_failure_not_cached_when_policy_rejects(self, fake_adapter, name_schema):
+        adapter = fake_adapter(lambda p: '{"age": 1}')
+        engine = EnforcementEngine(adapter, JSONValidator(), max_retries=0, cache=InMemoryCache(), negative_ttl=60)
+
+        await engine.enforce("a", name_schema, temperature=0.7)
+        await engine.enforce("a", name_schema, temperature=0.7)
+
+        assert len(adapter.calls) == 2
+        assert engine.get_stats()["negative_hits"] == 0
+
+    async def test_failure_not_cached_by_default(self, fake_adapter, name_schema):
+        adapter = fake_adapter(lambda p: '{"age": 1}')
+        engine = EnforcementEngine(adapter, JSONValidator(), max_retries=0, cache=InMemoryCache())
+
+        await engine.enforce("a", name_schema, temperature=0)
+        await engine.enforce("a", name_schema, temperature=0)
+
+        assert len(adapter.calls) == 2
+
+    async def test_custom_policy(self, fake_adapter, name_schema):
+        adapter = fake_adapter(lambda p: '{"age": 1}')
+        engine = EnforcementEngine(
+            adapter, JSONValidator(), max_retries=0, cache=InMemoryCache(),
+            negative_ttl=60, negative_cache_policy=lambda params: True
+        )
+
+        await engine.enforce("a", name_schema)
+        await engine.enforce("a", name_schema)
+
+        assert len(adapter.calls) == 1
+
+    async def test_negative_entry_uses_short_ttl(self, fake_adapter, name_schema):
+        adapter = fake_adapter(lambda p: '{"age": 1}')
+        engine = EnforcementEngine(
+            adapter, JSONValidator(), max_retries=0, cache=InMemoryCache(), hard_ttl=3600, negative_ttl=0
+        )
+
+        await engine.enforce("a", name_schema, temperature=0)
+        await asyncio.sleep(0.01)
+        await engine.enforce("a", name_schema, temperature=0)
+
+        assert len(adapter.calls) == 2
+
+    async def test_failed_refresh_does_not_replace_stale_success(self, fake_adapter, name_schema):
+        responses = iter(['{"name": "a"}'])
+        adapter = fake_adapter(lambda p: next(responses, '{"age": 1}'))
+        engine = EnforcementEngine(
+            adapter, JSONValidator(), max_retries=0, cache=InMemoryCache(), soft_ttl=60, negative_ttl=60
+        )
+        await engine.enforce("a", name_schema, temperature=0)
+        key = generate_cache_key(prompt="a", model=adapter.model, schema=name_schema, temperature=0)
+        engine.cache.get(key).generation.timestamp = datetime.now() - timedelta(seconds=120)
+
+        await engine.enforce("a", name_schema, temperature=0)
+        await asyncio.sleep(0.01)
+
+        again = await engine.enforce("a", name_schema, temperature=0)
+        assert again.success
+        assert again.data == {"name": "a"}
@@ -0,0 +1,51 @@
+"""Tests for hedged generations in EnforcementEngine."""
+
+import time
+
+from parsec.enforcement.engine import EnforcementEngine
+from parsec.resilience import HedgingPolicy
+from parsec.validators import JSONValidator
+
+
+class SlowValidator(JSONValidator):
+    def validate_and_repair(self, output, schema):
+        time.sleep(0.05)
+        return super().validate_and_repair(output, schema)
+
+
+class TestEngineHedging:
+
+    async def test_stalled_generation_hedged(self, fake_adapter, name_schema):
+        delays = iter([1.0, 0.0])
+        adapter = fake_adapter(lambda p: '{"name": "a"}', delay=lambda p: next(delays))
+        hedging = HedgingPolicy(min_samples=1, max_hedge_rate=1.0)
+        hedging.record(0.01)
+        engine = EnforcementEngine(adapter, JSONValidator(), hedging=hedging)
+
+        result = await engine.enforce("a", name_schema)
+
+        assert result.success
+        assert len(adapter.calls) == 2
+        assert hedging.get_stats()["hedge_wins"] == 1
+
+    async def test_invalid_copy_does_not_win(self, fake_adapter, name_schema):
+        delays = iter([0.03, 0.05])
+        outputs = iter(['{"age": 1}', '{"name": "a"}'])
+        adapter = fake_adapter(lambda p: next(outputs), delay=lambda p: next(delays))
+        hedging = HedgingPolicy(min_samples=1, max_hedge_rate=1.0)
+        hedging.record(0.01)
+        engine = EnforcementEngine(adapter, JSONValidator(), max_retries=0, hedging=hedging)
+
+        result = await engine.enforce("a", name_schema)
+
+        assert result.success
+        assert result.data == {"name": "a"}
+        assert hedging.get_stats()["wasted_tokens"] == 10
+
+    async def test_validation_time_not_learned(self, fake_adapter, name_schema):
+        hedging = HedgingPolicy(min_samples=1)
+        engine = EnforcementEngine(fake_adapter(), SlowValidator(), hedging=hedging)
+
+        await engine.enforce("a", name_schema)
+
+        assert hedging.delay() < 0.04
@@ -0,0 +1,202 @@
+"""Tests for FallbackAdapter routing, failover and ejection."""
+
+import asyncio
+import pytest
+
+from parsec.enforcement.engine import EnforcementEngine
+from parsec.models.adapters.fallback_adapter import FallbackAdapter
+from parsec.validators import JSONValidator
+
+
+class Down(Exception):
+    status_code = 503
+
+
+def failing(prompt):
+    return Down()
+
+
+class TestRouting:
+
+    async def test_priority_uses_first_backend(self, fake_adapter):
+        first, second = fake_adapter(model="a"), fake_adapter(model="b")
+        adapter = FallbackAdapter([first, second])
+
+        response = await adapter.generate("x")
+
+        assert response.model == "a"
+        assert len(second.calls) == 0
+        assert adapter.model == "a|b"
+
+    async def test_least_outstanding_spreads_load(self, fake_adapter):
+        first, second = fake_adapter(delay=0.01, model="a"), fake_adapter(delay=0.01, model="b")
+        adapter = FallbackAdapter([first, second], strategy="least_outstanding")
+
+        await asyncio.gather(*(adapter.generate(str(i)) for i in range(6)))
+
+        assert len(first.calls) == 3
+        assert len(second.calls) == 3
+
+    async def test_weights_bias_least_outstanding(self, fake_adapter):
+        first, second = fake_adapter(delay=0.01, model="a"), fake_adapter(delay=0.01, model="b")
+        adapter = FallbackAdapter([(first, 2), second], strategy="least_outstanding")
+
+        await asyncio.gather(*(adapter.generate(str(i)) for i in range(6)))
+
+        assert len(first.calls) == 4
+        assert len(second.calls) == 2
+
+    async def test_latency_prefers_faster_backend(self, fake_adapter):
+        slow, fast = fake_adapter(delay=0.02, model="slow"), fake_adapter(delay=0.0, model="fast")
+        adapter = FallbackAdapter([slow, fast], strategy="latency")
+
+        for i in range(5):
+            await adapter.generate(str(i))
+
+        assert len(slow.calls) == 1  # sampled once, then avoided
+        assert len(fast.calls) == 4
+
+    async def test_latency_reprobes_stale_backend(self, fake_adapter, clock):
+        cost = {"a": 5.0, "b": 1.0}
+
+        def timed(model):
+            def respond(prompt):
+                clock.now += cost[model]
+                return '{"name": "John"}'
+            return fake_adapter(respond, model=model)
+
+        a, b = timed("a"), timed("b")
+        adapter = FallbackAdapter([a, b], strategy="latency", latency_probe_interval=30, clock=clock)
+        for i in range(4):
+            await adapter.generate(str(i))
+        assert len(a.calls) == 1
+
+        cost["a"] = 0.5  # recovered, but only a probe can tell
+        clock.now += 30
+        await adapter.generate("probe")
+        assert a.calls[-1] == "probe"
+
+        # b's average was just as old, so it gets a probe of its own
+        await adapter.generate("probe b")
+        assert b.calls[-1] == "probe b"
+
+        for i in range(3):
+            await adapter.generate(f"after{i}")
+        assert a.calls[-3:] == ["after0", "after1", "after2"]
+
+    def test_invalid_configuration(self, fake_adapter):
+        with pytest.raises(ValueError):
+            FallbackAdapter([])
+        with pytest.raises(ValueError):
+            FallbackAdapter([fake_adapter()], strategy="random")
+
+
+class TestFailover:
+
+    async def test_error_fails_over(self, fake_adapter):
+        broken, healthy = fake_adapter(failing, model="a"), fake_adapter(model="b")
+        adapter = FallbackAdapter([broken, healthy])
+
+        response = await adapter.generate("x")
+
+        assert response.model == "b"
+        assert adapter.get_stats()["failovers"] == 1
+
+    async def test_all_backends_failing_raises(self, fake_adapter):
+        adapter = FallbackAdapter([fake_adapter(failing, model="a"), fake_adapter(failing, model="b")])
+
+        with pytest.raises(Down):
+            await adapter.generate("x")
+
+    async def test_repeated_errors_eject_backend(self, fake_adapter, clock):
+        broken, healthy = fake_adapter(failing, model="a"), fake_adapter(model="b")
+        adapter = FallbackAdapter([broken, healthy], failure_threshold=2, clock=clock)
+
+        for _ in range(5):
+            await adapter.generate("x")
+
+        assert len(broken.calls) == 2
+        assert adapter.get_stats()["backends"][0]["ejected"]
+
+    async def test_readmitted_after_health_check(self, fake_adapter, clock):
+        responses = iter([Down(), Down()])
+        flaky = fake_adapter(lambda p: next(responses, '{"name": "a"}'), model="a")
+        checks = []
+
+        async def health_check():
+            checks.append(clock.now)
+            return True
+
+        flaky.health_check = health_check
+        adapter = FallbackAdapter(
+            [flaky, fake_adapter(model="b")], failure_threshold=2, ejection_time=10, clock=clock
+        )
+        await adapter.generate("x")
+        await adapter.generate("x")
+        assert adapter.get_stats()["backends"][0]["ejected"]
+
+        clock.now = 11
+        response = await adapter.generate("x")
+
+        assert response.model == "a"
+        assert checks == [11]
+        assert not adapter.get_stats()["backends"][0]["ejected"]
+
+    async def test_failed_health_check_keeps_backend_out(self, fake_adapter, clock):
+        broken = fake_adapter(failing, model="a")
+
+        async def health_check():
+            return False
+
+        broken.health_check = health_check
+        adapter = FallbackAdapter(
+            [broken, fake_adapter(model="b")], failure_threshold=1, ejection_time=10, clock=clock
+        )
+        await adapter.generate("x")
+
+        clock.now = 11
+        await adapter.generate("x")
+
+        assert len(broken.calls) == 1
+        assert adapter.get_stats()["backends"][0]["ejected"]
+
+    async def test_stream_fails_over_before_first_chunk(self, fake_adapter):
+        broken, healthy = fake_adapter(model="a"), fake_adapter(model="b")
+
+        async def broken_stream(*args, **kwargs):
+            raise Down()
+            yield  # pragma: no cover
+
+        broken.generate_stream = broken_stream
+        adapter = FallbackAdapter([broken, healthy])
+
+        chunks = [chunk async for chunk in adapter.generate_stream("x")]
+
+        assert "".join(chunks) == '{"name": "John"}'
+        assert healthy.streams_closed == 1
+
+
+class TestEngineIntegration:
+
+    async def test_validation_failures_eject_backend(self, fake_adapter, name_schema, clock):
+        bad, good = fake_adapter(lambda p: '{"age": 1}', model="bad"), fake_adapter(model="good")
+        adapter = FallbackAdapter([bad, good], invalid_threshold=2, clock=clock)
+        engine = EnforcementEngine(adapter, JSONValidator(), max_retries=2)
+
+        result = await engine.enforce("x", name_schema)
+
+        assert result.success
+        assert result.generation.model == "good"
+        assert len(bad.calls) == 2
+        assert adapter.get_stats()["backends"][0]["invalid"] == 2
+
+    async def test_reused_id_is_not_credited(self, fake_adapter, clock):
+        adapter = FallbackAdapter([fake_adapter(model="a")], invalid_threshold=1, clock=clock)
+        response = await adapter.generate("x")
+        other = response.model_copy()
+        # Simulate CPython reusing the address of a collected response
+        adapter._origins[id(other)] = adapter._origins.pop(id(response))
+
+        adapter.record_validation(other, False)
+
+        assert adapter.get_stats()["backends"][0]["invalid"] == 0
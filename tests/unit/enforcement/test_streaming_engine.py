@@ -0,0 +1,276 @@
+"""Tests for StreamingEngine."""
+
+import json
+import pytest
+
+from parsec.core import LightStreamChunk, StreamChunk, ValidationStatus
+from parsec.enforcement.streaming_engine import StreamingEngine
+
+
+class ChunkIterator:
+    """Async iterator without `aclose`, as a hand-written adapter might return."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._chunks)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class TestStream:
+
+    async def test_stream_chunks(self, fake_adapter):
+        engine = StreamingEngine(fake_adapter(lambda p: '{"a": 12}', chunk_size=3))
+
+        chunks = [chunk async for chunk in engine.stream("prompt")]
+
+        assert [c.delta for c in chunks] == ['{"a', '": ', '12}', ""]
+        assert [c.accumulated for c in chunks] == ['{"a', '{"a": ', '{"a": 12}', '{"a": 12}']
+        assert chunks[-1].is_complete
+
+    async def test_stream_light(self, fake_adapter):
+        engine = StreamingEngine(fake_adapter(lambda p: '{"a": 12}', chunk_size=3))
+
+        chunks = [chunk async for chunk in engine.stream_light("prompt")]
+
+        assert chunks[1].accumulated == '{"a": '
+        assert chunks[-1].accumulated == '{"a": 12}'
+
+    async def test_stream_light_delta_only(self, fake_adapter):
+        engine = StreamingEngine(fake_adapter(lambda p: '{"a": 12}', chunk_size=3))
+
+        deltas = [chunk.delta async for chunk in engine.stream_light("prompt", delta_only=True)]
+
+        assert "".join(deltas) == '{"a": 12}'
+
+    async def test_plain_async_iterator(self, fake_adapter):
+        adapter = fake_adapter()
+        adapter.generate_stream = lambda *args, **kwargs: ChunkIterator(['{"a"', ': 1}'])
+        engine = StreamingEngine(adapter)
+
+        chunks = [chunk async for chunk in engine.stream("prompt")]
+
+        assert chunks[-1].accumulated == '{"a": 1}'
+        assert await engine.collect_stream("prompt") == '{"a": 1}'
+
+    async def test_collect_stream(self, fake_adapter):
+        engine = StreamingEngine(fake_adapter(lambda p: '{"a": 12}', chunk_size=3))
+
+        assert await engine.collect_stream("prompt") == '{"a": 12}'
+
+
+class TestStreamWithParsing:
+
+    async def test_parses_incrementally(self, fake_adapter):
+        adapter = fake_adapter(lambda p: json.dumps({"name": "John", "tags": ["a", "b"]}))
+        engine = StreamingEngine(adapter)
+
+        parsed_values = []
+        async for chunk, parsed in engine.stream_with_parsing("prompt"):
+            parsed_values.append(json.dumps(parsed))
+
+        assert json.loads(parsed_values[-1]) == {"name": "John", "tags": ["a", "b"]}
+        assert json.loads(parsed_values[2]) == {"name": "Jo"}
+
+    async def test_yields_stream_chunks(self, fake_adapter):
+        engine = StreamingEngine(fake_adapter(lambda p: '{"a": 12}', chunk_size=3))
+
+        chunks = [chunk async for chunk, _ in engine.stream_with_parsing("prompt")]
+        light = [chunk async for chunk, _ in engine.stream_with_parsing("prompt", light=True)]
+
+        assert all(isinstance(c, StreamChunk) for c in chunks)
+        assert chunks[1].accumulated == '{"a": '
+        assert all(isinstance(c, LightStreamChunk) for c in light)
+        assert [c.accumulated for c in light] == [c.accumulated for c in chunks]
+
+
+class TestStreamPath:
+
+    async def test_yields_each_closed_value(self, fake_adapter):
+        doc = {"items": [{"title": "a"}, {"title": "b"}, {"title": "c"}]}
+        engine = StreamingEngine(fake_adapter(lambda p: json.dumps(doc)))
+
+        results = [item async for item in engine.stream_path("prompt", "items[*].title")]
+
+        assert results == [
+            (("items", 0, "title"), "a"),
+            (("items", 1, "title"), "b"),
+            (("items", 2, "title"), "c"),
+        ]
+
+    async def test_stream_field(self, fake_adapter):
+        engine = StreamingEngine(fake_adapter(lambda p: '{"name": "John", "age": 3}'))
+
+        values = [value async for _, value in engine.stream_field("prompt", "name")]
+
+        assert values[0] is None
+        assert values[-1] == "John"
+
+    async def test_stream_events(self, fake_adapter):
+        engine = StreamingEngine(fake_adapter(lambda p: '{"a": 1}'))
+
+        events = [event.type async for event in engine.stream_events("prompt")]
+
+        assert events == ["start_object", "key", "value", "end_object"]
+
+
+class TestStreamItems:
+
+    @pytest.fixture
+    def items_schema(self):
+        return {
+            "type": "object",
+            "definitions": {
+                "item": {
+                    "type": "object",
+                    "properties": {"title": {"type": "string"}},
+                    "required": ["title"]
+                }
+            },
+            "properties": {
+                "items": {"type": "array", "items": {"$ref": "#/definitions/item"}}
+            }
+        }
+
+    async def test_yields_each_element_once_and_validates(self, fake_adapter, items_schema):
+        doc = {"items": [{"title": "a"}, {"name": "b"}, {"title": "c"}]}
+        engine = StreamingEngine(fake_adapter(lambda p: json.dumps(doc)))
+
+        items = [item async for item in engine.stream_items("prompt", items_schema, "items")]
+
+        assert [item.index for item in items] == [0, 1, 2]
+        assert [item.path for item in items] == ["items[0]", "items[1]", "items[2]"]
+        assert [item.validation.status for item in items] == [
+            ValidationStatus.VALID, ValidationStatus.INVALID, ValidationStatus.VALID
+        ]
+
+    async def test_items_arrive_before_stream_ends(self, fake_adapter):
+        doc = {"items": list(range(5))}
+        adapter = fake_adapter(lambda p: json.dumps(doc))
+        engine = StreamingEngine(adapter)
+
+        stream = engine.stream_items("prompt", array_path="items")
+        first = await stream.__anext__()
+        await stream.aclose()
+
+        assert first.data == 0
+        assert first.validation is None
+
+    async def test_root_array(self, fake_adapter):
+        engine = StreamingEngine(fake_adapter(lambda p: "[1, 2]"))
+        schema = {"type": "array", "items": {"type": "integer"}}
+
+        items = [item async for item in engine.stream_items("prompt", schema)]
+
+        assert [item.data for item in items] == [1, 2]
+        assert all(item.validation.status == ValidationStatus.VALID for item in items)
+
+    async def test_nullable_array(self, fake_adapter):
+        schema = {
+            "type": "object",
+            "properties": {"a": {"type": ["array", "null"], "items": {"type": "integer"}}}
+        }
+        engine = StreamingEngine(fake_adapter(lambda p: '{"a": [1, "x"]}'))
+
+        items = [item async for item in engine.stream_items("prompt", schema, "a")]
+
+        assert [item.data for item in items] == [1, "x"]
+        assert [item.validation.status for item in items] == [
+            ValidationStatus.VALID, ValidationStatus.INVALID
+        ]
+
+    async def test_rejects_non_array_path(self, fake_adapter, items_schema):
+        engine = StreamingEngine(fake_adapter())
+
+        with pytest.raises(ValueError):
+            async for _ in engine.stream_items("prompt", items_schema, "title"):
+                pass
+
+
+class TestStreamWithValidation:
+
+    async def test_valid_stream(self, fake_adapter, name_schema):
+        engine = StreamingEngine(fake_adapter(lambda p: '{"name": "John"}'))
+
+        results = [result async for _, result in engine.stream_with_validation("prompt", name_schema)]
+
+        assert all(r.status == ValidationStatus.VALID for r in results)
+        assert all(r.is_partial for r in results[:-1])
+        assert not results[-1].is_partial
+        assert results[-1].parsed_output == {"name": "John"}
+
+    async def test_stops_on_unrepairable(self, fake_adapter, name_schema):
+        output = '{"name": 12, "bio": "' + "x" * 400 + '"}'
+        adapter = fake_adapter(lambda p: output)
+        engine = StreamingEngine(adapter)
+
+        pairs = [pair async for pair in engine.stream_with_validation("prompt", name_schema)]
+
+        chunk, result = pairs[-1]
+        assert result.status == ValidationStatus.UNREPAIRABLE
+        assert result.errors[0].path == "name"
+        assert len(chunk.accumulated) < 20
+        assert adapter.streams_closed == 1
+
+    async def test_can_continue_after_unrepairable(self, fake_adapter, name_schema):
+        engine = StreamingEngine(fake_adapter(lambda p: '{"name": 12}'))
+
+        pairs = [
+            pair async for pair in
+            engine.stream_with_validation("prompt", name_schema, stop_on_unrepairable=False)
+        ]
+
+        chunk, result = pairs[-1]
+        assert chunk.is_complete
+        assert result.status != ValidationStatus.VALID
+        assert not result.is_partial
+
+
+class TestEnforceStream:
+
+    async def test_valid_first_attempt(self, fake_adapter, name_schema):
+        engine = StreamingEngine(fake_adapter(lambda p: '{"name": "John"}'))
+
+        result = await engine.enforce_stream("prompt", name_schema)
+
+        assert result.success
+        assert result.data == {"name": "John"}
+        assert result.retry_count == 0
+        assert result.generation.output == '{"name": "John"}'
+
+    async def test_aborts_and_retries_with_feedback(self, fake_adapter, name_schema):
+        bad = '{"name": 7, "notes": "' + "x" * 1000 + '"}'
+        adapter = fake_adapter(lambda p: bad if "Previous attempt" not in p else '{"name": "John"}')
+        engine = StreamingEngine(adapter)
+
+        result = await engine.enforce_stream("prompt", name_schema)
+
+        assert result.success
+        assert result.retry_count == 1
+        assert adapter.streams_closed == 2
+        assert "is not of type 'string'" in adapter.calls[1]
+
+    async def test_aborted_attempt_output_is_truncated(self, fake_adapter, name_schema):
+        bad = '{"name": 7, "notes": "' + "x" * 1000 + '"}'
+        engine = StreamingEngine(fake_adapter(lambda p: bad), max_retries=2)
+
+        result = await engine.enforce_stream("prompt", name_schema)
+
+        assert not result.success
+        assert result.retry_count == 2
+        assert result.validation.status == ValidationStatus.UNREPAIRABLE
+        assert len(result.generation.output) < 20
+
+    async def test_finished_attempt_is_repaired(self, fake_adapter, name_schema):
+        engine = StreamingEngine(fake_adapter(lambda p: '```json\n{"name": "John",}\n```'))
+
+        result = await engine.enforce_stream("prompt", name_schema)
+
+        assert result.success
+        assert result.data == {"name": "John"}
@@ -0,0 +1,58 @@
+"""Tests for transport-level retries in EnforcementEngine."""
+
+import pytest
+
+from parsec.enforcement.engine import EnforcementEngine
+from parsec.resilience import RetryPolicy
+from parsec.validators import JSONValidator
+
+
+class Overloaded(Exception):
+    status_code = 503
+
+
+def scripted(*outputs):
+    """Respond with each output in turn (exceptions are raised by the adapter)."""
+    outputs = iter(outputs)
+    return lambda prompt: next(outputs)
+
+
+class TestTransportRetry:
+
+    async def test_transient_error_retried(self, fake_adapter, name_schema):
+        adapter = fake_adapter(scripted(Overloaded(), '{"name": "a"}'))
+        engine = EnforcementEngine(adapter, JSONValidator(), retry_policy=RetryPolicy(base_delay=0.001))
+
+        result = await engine.enforce("a", name_schema)
+
+        assert result.success
+        assert result.transport_retry_count == 1
+        assert result.retry_count == 0
+        assert engine.get_stats()["transport_retries"] == 1
+
+    async def test_counted_separately_from_validation_retries(self, fake_adapter, name_schema):
+        adapter = fake_adapter(scripted('{"age": 1}', Overloaded(), Overloaded(), '{"name": "a"}'))
+        engine = EnforcementEngine(
+            adapter, JSONValidator(), max_retries=1, retry_policy=RetryPolicy(base_delay=0.001)
+        )
+
+        result = await engine.enforce("a", name_schema)
+
+        assert result.success
+        assert result.retry_count == 1
+        assert result.transport_retry_count == 2
+
+    async def test_without_policy_errors_propagate(self, fake_adapter, name_schema):
+        adapter = fake_adapter(scripted(Overloaded(), '{"name": "a"}'))
+        engine = EnforcementEngine(adapter, JSONValidator())
+
+        with pytest.raises(Overloaded):
+            await engine.enforce("a", name_schema)
+
+    async def test_permanent_error_not_retried(self, fake_adapter, name_schema):
+        adapter = fake_adapter(scripted(ValueError("bad request"), '{"name": "a"}'))
+        engine = EnforcementEngine(adapter, JSONValidator(), retry_policy=RetryPolicy(base_delay=0.001))
+
+        with pytest.raises(ValueError):
+            await engine.enforce("a", name_schema)
+        assert len(adapter.calls) == 1
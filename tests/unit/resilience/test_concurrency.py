@@ -0,0 +1,160 @@
+"""Tests for AdaptiveConcurrencyLimiter and the adapter guard."""
+
+import asyncio
+import pytest
+
+from parsec.core import BaseLLMAdapter, GenerationResponse
+from parsec.resilience import AdaptiveConcurrencyLimiter
+
+
+class RateLimited(Exception):
+    status_code = 429
+
+
+class BadRequest(Exception):
+    status_code = 400
+
+
+class GuardedAdapter(BaseLLMAdapter):
+    """Adapter whose calls go through `_guard` like the provider adapters."""
+
+    def __init__(self, respond, **kwargs):
+        super().__init__(api_key="test", model="guarded", **kwargs)
+        self.respond = respond
+        self.max_in_flight = 0
+
+    def supports_native_structure_output(self) -> bool:
+        return True
+
+    async def generate(self, prompt, schema=None, temperature=0.7, max_tokens=None, **kwargs):
+        async with self._guard(prompt, max_tokens) as call:
+            limiter = self.concurrency_limiter
+            self.max_in_flight = max(self.max_in_flight, limiter.in_flight)
+            output = await self.respond(prompt)
+            call.tokens_used = 10
+        return GenerationResponse(output=output, provider="openai", model=self.model, tokens_used=10, latency_ms=0)
+
+
+async def complete(limiter, **outcome):
+    """Run one call through the limiter and report `outcome` for it."""
+    await limiter.acquire()
+    limiter.release(**outcome)
+
+
+class TestAdaptiveConcurrencyLimiter:
+
+    async def test_additive_increase_up_to_max(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=4)
+
+        for _ in range(3):
+            await complete(limiter, latency=0.1)
+        assert limiter.limit == 3
+
+        for _ in range(50):
+            await complete(limiter, latency=0.1)
+        assert limiter.limit == 4
+        assert limiter.get_stats()["increases"] == 2
+
+    async def test_overload_error_halves_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=16)
+        await complete(limiter, error=RateLimited())
+        assert limiter.limit == 8
+
+    async def test_other_errors_leave_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=16)
+        await complete(limiter, error=BadRequest())
+        assert limiter.limit == 16
+
+    async def test_at_most_one_decrease_per_round_trip(self, clock):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=16, clock=clock)
+        await complete(limiter, latency=1.0)
+
+        for _ in range(3):
+            await complete(limiter, error=RateLimited())
+        assert limiter.get_stats()["decreases"] == 1
+
+        clock.now = 2.0
+        await complete(limiter, error=RateLimited())
+        assert limiter.get_stats()["decreases"] == 2
+        assert limiter.limit >= limiter.min_limit
+
+    async def test_latency_spike_decreases_after_warmup(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=8, warmup=5)
+        for _ in range(5):
+            await complete(limiter, latency=0.1)
+
+        await complete(limiter, latency=1.0)
+
+        assert limiter.limit == 4
+
+    async def test_never_below_min_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, min_limit=2)
+        await complete(limiter, error=RateLimited())
+        assert limiter.limit == 2
+
+    def test_invalid_bounds(self):
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(initial_limit=10, max_limit=5)
+
+    async def test_waiters_admitted_in_order(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+        await limiter.acquire()
+        order = []
+
+        async def call(i):
+            await limiter.acquire()
+            order.append(i)
+            limiter.release()
+
+        tasks = [asyncio.ensure_future(call(i)) for i in range(3)]
+        await asyncio.sleep(0)
+        assert limiter.get_stats()["queued"] == 3
+
+        limiter.release()
+        await asyncio.gather(*tasks)
+        assert order == [0, 1, 2]
+        assert limiter.get_stats()["in_flight"] == 0
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+        await limiter.acquire()
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert limiter.get_stats()["queued"] == 0
+        limiter.release()
+        assert limiter.in_flight == 0
+
+
+class TestAdapterGuard:
+
+    async def test_guard_caps_in_flight_calls(self):
+        async def slow(prompt):
+            await asyncio.sleep(0.01)
+            return "{}"
+
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=3, max_limit=3)
+        adapter = GuardedAdapter(slow, concurrency_limiter=limiter)
+
+        await asyncio.gather(*(adapter.generate(str(i)) for i in range(10)))
+
+        assert adapter.max_in_flight == 3
+        assert limiter.get_stats()["admitted"] == 10
+        assert limiter.in_flight == 0
+
+    async def test_guard_reports_overload(self):
+        async def overloaded(prompt):
+            raise RateLimited()
+
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+        adapter = GuardedAdapter(overloaded, concurrency_limiter=limiter)
+
+        with pytest.raises(RateLimited):
+            await adapter.generate("a")
+
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
@@ -0,0 +1,136 @@
+"""Tests for HedgingPolicy."""
+
+import asyncio
+import pytest
+
+from parsec.resilience import HedgingPolicy
+
+
+def warmed_up(latency=0.01, **kwargs):
+    """A policy whose latency window is full of `latency` samples."""
+    policy = HedgingPolicy(min_samples=10, **kwargs)
+    for _ in range(10):
+        policy.record(latency)
+    return policy
+
+
+def scripted(*steps):
+    """Each call sleeps and returns (or raises) the next (delay, result) step."""
+    steps = iter(steps)
+    started = []
+
+    async def call():
+        delay, result = next(steps)
+        started.append(delay)
+        await asyncio.sleep(delay)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return call, started
+
+
+class TestHedgingPolicy:
+
+    def test_delay_is_percentile(self):
+        policy = HedgingPolicy(percentile=0.9, min_samples=10)
+        assert policy.delay() is None
+        for i in range(1, 11):
+            policy.record(i / 10)
+        assert policy.delay() == pytest.approx(1.0)
+
+    def test_min_delay_floor(self):
+        assert warmed_up(0.001, min_delay=0.05).delay() == 0.05
+
+    async def test_no_hedge_while_warming_up(self):
+        policy = HedgingPolicy(min_samples=10)
+        call, started = scripted((0.02, "a"), (0.0, "b"))
+
+        assert await policy.run(call) == "a"
+        assert len(started) == 1
+        assert policy.get_stats()["hedges"] == 0
+
+    async def test_slow_call_is_hedged_and_loser_cancelled(self):
+        policy = warmed_up(0.01, max_hedge_rate=1.0)
+        call, started = scripted((1.0, "slow"), (0.0, "fast"))
+
+        assert await policy.run(call) == "fast"
+        assert len(started) == 2
+        stats = policy.get_stats()
+        assert stats["hedges"] == 1
+        assert stats["hedge_wins"] == 1
+        assert stats["cancelled"] == 1
+
+    async def test_cancelled_loser_records_its_own_latency(self):
+        policy = HedgingPolicy(min_samples=1, max_hedge_rate=1.0)
+        policy.record(0.02)
+        call, _ = scripted((1.0, "slow"), (0.0, "fast"))
+
+        await policy.run(call)
+
+        winner, loser = list(policy._latencies)[-2:]
+        assert winner < 0.02 <= loser
+
+    async def test_losers_cleaned_up_before_return(self):
+        policy = warmed_up(0.01, max_hedge_rate=1.0)
+        delays = iter([1.0, 0.0])
+        cleaned = []
+
+        async def call():
+            try:
+                await asyncio.sleep(next(delays))
+                return "ok"
+            finally:
+                cleaned.append(True)
+
+        await policy.run(call)
+
+        assert len(cleaned) == 2
+
+    async def test_fast_call_not_hedged(self):
+        policy = warmed_up(0.05, max_hedge_rate=1.0)
+        call, started = scripted((0.0, "a"), (0.0, "b"))
+
+        assert await policy.run(call) == "a"
+        assert len(started) == 1
+
+    async def test_latency_callback_replaces_wall_time(self):
+        policy = HedgingPolicy(min_samples=1)
+        call, _ = scripted((0.02, "a"))
+
+        await policy.run(call, latency=lambda result: 0.005)
+
+        assert policy.delay() == 0.005
+
+    async def test_hedge_rate_cap(self):
+        policy = warmed_up(0.001, max_hedge_rate=0.5)
+        for _ in range(100):
+            policy.record(0.001)  # keep the delay low while slow calls are recorded
+        call, started = scripted(*[(0.01, "x")] * 20)
+
+        for _ in range(6):
+            await policy.run(call)
+
+        assert policy.get_stats()["hedges"] == 3
+
+    async def test_unaccepted_result_waits_for_other_copy(self):
+        policy = warmed_up(0.01, max_hedge_rate=1.0)
+        call, _ = scripted((0.03, "bad"), (0.05, "good"))
+
+        result = await policy.run(call, accept=lambda r: r == "good", cost=lambda r: 7)
+
+        assert result == "good"
+        assert policy.get_stats()["wasted_tokens"] == 7
+
+    async def test_error_in_one_copy_uses_the_other(self):
+        policy = warmed_up(0.01, max_hedge_rate=1.0)
+        call, _ = scripted((0.03, RuntimeError("boom")), (0.05, "ok"))
+
+        assert await policy.run(call) == "ok"
+
+    async def test_all_copies_fail(self):
+        policy = warmed_up(0.01, max_hedge_rate=1.0)
+        call, _ = scripted((0.02, RuntimeError("first")), (0.0, RuntimeError("second")))
+
+        with pytest.raises(RuntimeError, match="second"):
+            await policy.run(call)
@@ -0,0 +1,120 @@
+"""Tests for RateLimiter and TokenBucket."""
+
+import asyncio
+import pytest
+
+from parsec.resilience import RateLimiter, TokenBucket
+
+
+class TestTokenBucket:
+
+    def test_starts_full_and_refills(self, clock):
+        bucket = TokenBucket(60, clock)  # one token per second
+
+        bucket.take(60)
+        assert bucket.level == 0
+        assert bucket.delay(3) == pytest.approx(3.0)
+
+        clock.now = 2.0
+        assert bucket.level == pytest.approx(2.0)
+
+    def test_refill_capped_at_capacity(self, clock):
+        bucket = TokenBucket(60, clock)
+        clock.now = 1000.0
+        assert bucket.level == 60
+
+    def test_debt(self, clock):
+        bucket = TokenBucket(60, clock)
+        bucket.take(90)
+        assert bucket.level == -30
+        assert bucket.delay(0) == pytest.approx(30.0)
+
+    def test_rejects_non_positive_budget(self):
+        with pytest.raises(ValueError):
+            TokenBucket(0)
+
+
+class TestRateLimiter:
+
+    async def test_within_budget_does_not_wait(self):
+        limiter = RateLimiter(requests_per_minute=100, tokens_per_minute=10000)
+
+        for _ in range(10):
+            await limiter.acquire(100)
+
+        stats = limiter.get_stats()
+        assert stats["acquired"] == 10
+        assert stats["waited"] == 0
+        assert stats["requests_available"] == pytest.approx(90, abs=0.1)
+
+    async def test_waits_for_request_budget(self):
+        limiter = RateLimiter(requests_per_minute=600)  # 10 per second
+        limiter.requests.take(600)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await limiter.acquire()
+
+        assert loop.time() - start >= 0.08
+        assert limiter.get_stats()["waited"] == 1
+
+    async def test_waits_for_token_budget(self):
+        limiter = RateLimiter(tokens_per_minute=6000)  # 100 per second
+        await limiter.acquire(6000)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await limiter.acquire(10)
+
+        assert loop.time() - start >= 0.08
+
+    async def test_estimate_capped_at_budget(self):
+        limiter = RateLimiter(tokens_per_minute=100)
+        assert await limiter.acquire(1000) == 100
+
+    async def test_settle_refunds_and_charges(self, clock):
+        limiter = RateLimiter(tokens_per_minute=60000, clock=clock)
+
+        reserved = await limiter.acquire(1000)
+        limiter.settle(reserved, 200)
+        assert limiter.tokens.level == 59800
+
+        reserved = await limiter.acquire(100)
+        limiter.settle(reserved, 300)
+        assert limiter.tokens.level == 59500
+
+    async def test_fifo_order(self):
+        limiter = RateLimiter(tokens_per_minute=6000)  # 100 per second
+        await limiter.acquire(6000)
+        order = []
+
+        async def call(name, tokens):
+            await limiter.acquire(tokens)
+            order.append(name)
+
+        # The large request arrives first and must not be overtaken by small ones
+        tasks = [asyncio.ensure_future(call("large", 10))]
+        await asyncio.sleep(0)
+        tasks += [asyncio.ensure_future(call(f"small{i}", 1)) for i in range(3)]
+        await asyncio.gather(*tasks)
+
+        assert order == ["large", "small0", "small1", "small2"]
+
+    async def test_cancelled_waiter_releases_queue(self):
+        limiter = RateLimiter(requests_per_minute=600)
+        limiter.requests.take(600)
+
+        head = asyncio.ensure_future(limiter.acquire())
+        behind = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        head.cancel()
+        await asyncio.wait_for(behind, timeout=1)
+
+        assert limiter.get_stats()["queued"] == 0
+        assert limiter.get_stats()["acquired"] == 1
+
+    def test_estimate_tokens(self):
+        limiter = RateLimiter(chars_per_token=4, default_completion_tokens=50)
+        assert limiter.estimate_tokens("x" * 40) == 60
+        assert limiter.estimate_tokens("x" * 40, max_tokens=5) == 15
+
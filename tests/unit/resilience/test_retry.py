@@ -0,0 +1,121 @@
+"""Tests for RetryPolicy and error classification."""
+
+import asyncio
+import pytest
+
+from parsec.resilience import RetryPolicy, is_transient
+from parsec.resilience.retry import retry_after
+
+
+class StatusError(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = type("Response", (), {"headers": headers or {}})()
+
+
+class APIConnectionError(Exception):
+    pass
+
+
+class TestClassification:
+
+    @pytest.mark.parametrize("status", [408, 429, 500, 502, 503, 504, 529])
+    def test_transient_statuses(self, status):
+        assert is_transient(StatusError(status))
+
+    @pytest.mark.parametrize("status", [400, 401, 403, 404, 422])
+    def test_permanent_statuses(self, status):
+        assert not is_transient(StatusError(status))
+
+    def test_timeouts_and_connection_errors(self):
+        assert is_transient(asyncio.TimeoutError())
+        assert is_transient(ConnectionResetError())
+        assert is_transient(APIConnectionError())
+        assert not is_transient(ValueError("bad prompt"))
+
+    def test_retry_after_headers(self):
+        assert retry_after(StatusError(429, {"retry-after": "2"})) == 2.0
+        assert retry_after(StatusError(429, {"retry-after-ms": "150"})) == 0.15
+        assert retry_after(StatusError(429, {"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0.0
+        assert retry_after(StatusError(429)) is None
+        assert retry_after(ValueError()) is None
+
+
+class TestRetryPolicy:
+
+    @staticmethod
+    def flaky(errors, result="ok"):
+        """Async callable raising each of `errors` in turn, then returning `result`."""
+        errors = list(errors)
+        calls = []
+
+        async def call():
+            calls.append(1)
+            if errors:
+                raise errors.pop(0)
+            return result
+
+        return call, calls
+
+    async def test_retries_transient_errors(self):
+        call, calls = self.flaky([StatusError(503), StatusError(429)])
+        policy = RetryPolicy(base_delay=0.001)
+
+        result, retries = await policy.run(call)
+
+        assert result == "ok"
+        assert retries == 2
+        assert len(calls) == 3
+        assert policy.get_stats() == {"calls": 1, "retries": 2, "gave_up": 0}
+
+    async def test_permanent_error_raised_immediately(self):
+        call, calls = self.flaky([StatusError(401)])
+        policy = RetryPolicy(base_delay=0.001)
+
+        with pytest.raises(StatusError):
+            await policy.run(call)
+        assert len(calls) == 1
+
+    async def test_gives_up_after_budget(self):
+        call, calls = self.flaky([StatusError(503)] * 5)
+        policy = RetryPolicy(max_retries=2, base_delay=0.001)
+
+        with pytest.raises(StatusError):
+            await policy.run(call)
+        assert len(calls) == 3
+        assert policy.get_stats()["gave_up"] == 1
+
+    async def test_honours_retry_after(self):
+        call, _ = self.flaky([StatusError(429, {"retry-after-ms": "50"})])
+        policy = RetryPolicy(base_delay=0.0)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await policy.run(call)
+        assert loop.time() - start >= 0.045
+
+    async def test_long_retry_after_is_final(self):
+        call, calls = self.flaky([StatusError(429, {"retry-after": "3600"})])
+        policy = RetryPolicy(max_retry_after=60)
+
+        with pytest.raises(StatusError):
+            await policy.run(call)
+        assert len(calls) == 1
+
+    async def test_custom_classifier(self):
+        call, calls = self.flaky([ValueError("flaky parser")])
+        policy = RetryPolicy(base_delay=0.001, classify=lambda e: True if isinstance(e, ValueError) else None)
+
+        result, retries = await policy.run(call)
+        assert result == "ok" and retries == 1
+
+    def test_backoff_ceiling(self):
+        policy = RetryPolicy(base_delay=0.5, max_delay=3.0, jitter=False)
+        assert [policy.delay(n) for n in range(5)] == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+    def test_full_jitter_within_ceiling(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=8.0)
+        delays = [policy.delay(3) for _ in range(200)]
+        assert all(0 <= d <= 8.0 for d in delays)
+        assert max(delays) - min(delays) > 1.0
@@ -0,0 +1,117 @@
+"""Tests for the event-based JSON stream reader."""
+
+import json
+import pytest
+
+from parsec.utils.json_stream import (
+    ANY,
+    JSONStreamReader,
+    format_path,
+    parse_selector,
+    path_matches,
+)
+
+
+DOCUMENT = {
+    "title": "Report",
+    "items": [
+        {"title": "first", "tags": ["a"]},
+        {"title": "second", "tags": []},
+    ],
+    "meta": {"odd key": 1}
+}
+
+
+def feed_in_chunks(reader, text, size=3):
+    events = []
+    for i in range(0, len(text), size):
+        events.extend(reader.feed(text[i:i + size]))
+    return events
+
+
+class TestSelectors:
+
+    def test_parse_selector(self):
+        assert parse_selector("items[*].title") == ("items", ANY, "title")
+        assert parse_selector("$.items[0]") == ("items", 0)
+        assert parse_selector('meta["odd key"]') == ("meta", "odd key")
+        assert parse_selector("$") == ()
+
+    def test_invalid_selector(self):
+        with pytest.raises(ValueError):
+            parse_selector("items[")
+
+    def test_path_matches_distinguishes_index_from_key(self):
+        assert path_matches(("items", ANY), ("items", 3))
+        assert not path_matches(("items", 0), ("items", "0"))
+
+    def test_format_path(self):
+        assert format_path(("items", 0, "title")) == "items[0].title"
+        assert format_path(("meta", "odd key")) == 'meta["odd key"]'
+        assert format_path(()) == "$"
+
+
+class TestJSONStreamReader:
+
+    def test_events(self):
+        reader = JSONStreamReader()
+        events = feed_in_chunks(reader, '{"a": [1, {"b": null}]}')
+
+        assert [(e.type, e.path, e.value) for e in events] == [
+            ("start_object", (), None),
+            ("key", (), "a"),
+            ("start_array", ("a",), None),
+            ("value", ("a", 0), 1),
+            ("start_object", ("a", 1), None),
+            ("key", ("a", 1), "b"),
+            ("value", ("a", 1, "b"), None),
+            ("end_object", ("a", 1), None),
+            ("end_array", ("a",), None),
+            ("end_object", (), None),
+        ]
+        assert reader.is_complete
+
+    def test_subscription_delivers_values_as_they_close(self):
+        reader = JSONStreamReader(emit_events=False)
+        titles = []
+        reader.subscribe("items[*].title", lambda path, value: titles.append((path, value)))
+
+        text = json.dumps(DOCUMENT)
+        cut = text.index('"second"') + 3
+        reader.feed(text[:cut])
+        assert titles == [(("items", 0, "title"), "first")]
+
+        reader.feed(text[cut:])
+        assert titles[-1] == (("items", 1, "title"), "second")
+
+    def test_container_subscription(self):
+        reader = JSONStreamReader(emit_events=False)
+        items = []
+        reader.subscribe("items[*]", lambda path, value: items.append(value))
+
+        feed_in_chunks(reader, json.dumps(DOCUMENT))
+
+        assert items == DOCUMENT["items"]
+
+    def test_nested_subscriptions(self):
+        reader = JSONStreamReader(emit_events=False)
+        seen = []
+        reader.subscribe("items", lambda path, value: seen.append(("items", value)))
+        reader.subscribe("items[*].tags", lambda path, value: seen.append((path, value)))
+
+        feed_in_chunks(reader, json.dumps(DOCUMENT))
+
+        assert seen == [
+            (("items", 0, "tags"), ["a"]),
+            (("items", 1, "tags"), []),
+            ("items", DOCUMENT["items"]),
+        ]
+
+    def test_root_subscription(self):
+        reader = JSONStreamReader(emit_events=False)
+        roots = []
+        reader.subscribe("$", lambda path, value: roots.append(value))
+
+        feed_in_chunks(reader, json.dumps(DOCUMENT))
+
+        assert roots == [DOCUMENT]
@@ -0,0 +1,119 @@
+"""Tests for partial JSON parsing utilities."""
+
+import json
+import random
+import pytest
+
+from parsec.utils.partial_json import PartialJSONParser, IncrementalJSONParser
+
+
+DOCUMENT = {
+    "name": "J\"o\\hn é \U0001F600",
+    "age": -12.5e3,
+    "tags": ["a", "b", {"x": [1, 2, True, None, False]}],
+    "empty": {},
+    "list": [],
+    "zero": 0
+}
+
+
+def feed_all(parser, text, sizes):
+    i = 0
+    while i < len(text):
+        step = next(sizes)
+        parser.feed(text[i:i + step])
+        i += step
+
+
+class TestPartialJSONParser:
+
+    def test_parse_complete(self):
+        assert PartialJSONParser.parse('{"a": 1}') == {"a": 1}
+
+    def test_parse_unclosed(self):
+        assert PartialJSONParser.parse('{"a": [1, 2') == {"a": [1, 2]}
+
+    def test_parse_empty(self):
+        assert PartialJSONParser.parse("  ") is None
+
+
+class TestIncrementalJSONParser:
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_random_chunking_matches_json_loads(self, seed):
+        rng = random.Random(seed)
+        text = json.dumps(DOCUMENT, indent=2)
+        parser = IncrementalJSONParser()
+
+        sizes = iter(lambda: rng.randint(1, 6), None)
+        i = 0
+        while i < len(text):
+            step = next(sizes)
+            parser.feed(text[i:i + step])
+            parser.value  # materialise partial state between chunks
+            i += step
+
+        assert parser.is_complete
+        assert parser.value == DOCUMENT
+
+    def test_partial_values(self):
+        parser = IncrementalJSONParser()
+        parser.feed('{"name": "Jo')
+        assert parser.value == {"name": "Jo"}
+
+        parser.feed('hn", "age": 3')
+        assert parser.value == {"name": "John", "age": 3}
+
+        parser.feed('1, "tags": ["a", tr')
+        assert parser.value == {"name": "John", "age": 31, "tags": ["a"]}
+
+        parser.feed('ue], "key')
+        assert parser.value == {"name": "John", "age": 31, "tags": ["a", True]}
+        assert not parser.is_complete
+
+    def test_partial_escape_not_exposed(self):
+        parser = IncrementalJSONParser()
+        parser.feed('{"u": "caf\\u00')
+        assert parser.value == {"u": "caf"}
+
+        parser.feed('e9"}')
+        assert parser.value == {"u": "café"}
+
+    def test_reading_long_string_does_not_rejoin_fragments(self):
+        parser = IncrementalJSONParser()
+        parser.feed('{"text": "')
+        for i in range(1000):
+            parser.feed("ab")
+            assert len(parser.value["text"]) == 2 * (i + 1)
+            assert len(parser._tokenizer._buf) == 1
+
+        parser.feed('"}')
+        assert parser.value == {"text": "ab" * 1000}
+
+    def test_value_updates_in_place(self):
+        parser = IncrementalJSONParser()
+        parser.feed('{"items": [1')
+        snapshot = parser.value
+
+        parser.feed(', 2]}')
+        assert snapshot == {"items": [1, 2]}
+
+    def test_skips_preamble_and_trailer(self):
+        parser = IncrementalJSONParser()
+        feed_all(parser, '```json\n{"a": null}\n```', iter(lambda: 3, None))
+
+        assert parser.is_complete
+        assert parser.value == {"a": None}
+
+    def test_no_value_before_root(self):
+        parser = IncrementalJSONParser()
+        parser.feed("Here you go: ")
+        assert parser.value is None
+
+    def test_syntax_error_keeps_last_good_value(self):
+        parser = IncrementalJSONParser()
+        parser.feed('{"a": 1,, "b": 2}')
+
+        assert parser.value == {"a": 1}
+        assert parser.error is not None
+        assert not parser.is_complete
@@ -133,4 +133,58 @@ class TestJSONRepairHeuristics:
         repaired_json = validator.repair(malformed_json, [])
         
         parsed = json.loads(repaired_json)
-        assert parsed == {"name": "Eve"}
\ No newline at end of file
+        assert parsed == {"name": "Eve"}
+
+class TestCompiledSchemaCache:
+
+    def test_same_schema_compiled_once(self, simple_person_schema):
+        validator = JSONValidator()
+
+        for _ in range(5):
+            validator.validate('{"name": "Alice"}', simple_person_schema)
+
+        stats = validator.get_cache_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 4
+        assert stats["size"] == 1
+
+    def test_equal_schema_shares_compiled_validator(self, simple_person_schema):
+        validator = JSONValidator()
+        copy = json.loads(json.dumps(simple_person_schema))
+
+        assert validator.compile(simple_person_schema) is validator.compile(copy)
+
+    def test_eviction(self):
+        validator = JSONValidator(cache_size=2)
+        schemas = [{"type": "object", "title": str(i)} for i in range(3)]
+
+        for schema in schemas:
+            validator.compile(schema)
+
+        assert validator.get_cache_stats()["size"] == 2
+        validator.compile(schemas[0])
+        assert validator.get_cache_stats()["misses"] == 4
+
+    def test_caching_disabled(self, simple_person_schema):
+        validator = JSONValidator(cache_size=0)
+
+        validator.validate('{"name": "Alice"}', simple_person_schema)
+        validator.validate('{"name": "Alice"}', simple_person_schema)
+
+        assert validator.get_cache_stats()["misses"] == 2
+        assert validator.get_cache_stats()["size"] == 0
+
+    def test_check_schema_rejects_invalid_schema(self):
+        import jsonschema
+        validator = JSONValidator(check_schema=True)
+
+        with pytest.raises(jsonschema.exceptions.SchemaError):
+            validator.validate('{}', {"type": "not-a-type"})
+
+    def test_clear_cache(self, simple_person_schema):
+        validator = JSONValidator()
+        validator.compile(simple_person_schema)
+
+        validator.clear_cache()
+
+        assert validator.get_cache_stats()["size"] == 0
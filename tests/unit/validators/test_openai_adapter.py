@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from parsec.models.adapters.openai_adapter import OpenAIAdapter
 from parsec.core import GenerationResponse, ModelProviders
+from parsec.resilience import RateLimiter
 import json
 
 class TestOpenAIAdapter:
@@ -79,4 +80,24 @@ class TestOpenAIAdapter:
         assert call_args.kwargs['model'] == "gpt-4"
         assert 'response_format' in call_args.kwargs
         assert call_args.kwargs['messages'][0]['content'] == expected_content
-        assert call_args.kwargs['response_format']['type'] == 'json_object'
\ No newline at end of file
+        assert call_args.kwargs['response_format']['type'] == 'json_object'
+
+
+    @pytest.mark.asyncio
+    @patch('parsec.models.adapters.openai_adapter.AsyncOpenAI')
+    async def test_generate_settles_rate_limiter(self, mock_class):
+        mock_client = AsyncMock()
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content='{"name": "John"}'))]
+        mock_response.usage = MagicMock(total_tokens=25)
+        mock_client.chat.completions.create.return_value = mock_response
+        mock_class.return_value = mock_client
+
+        now = [0.0]
+        limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=60000, clock=lambda: now[0])
+        adapter = OpenAIAdapter(api_key="test", model="gpt-4", rate_limiter=limiter)
+        await adapter.generate("x" * 40, max_tokens=100)
+
+        # 110 tokens reserved up front, settled against the 25 actually used
+        assert limiter.tokens.level == 60000 - 25
+        assert limiter.requests.level == 59
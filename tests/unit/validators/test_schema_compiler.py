@@ -0,0 +1,109 @@
+import json
+import random
+import pytest
+import jsonschema
+
+from parsec.validators.schema_compiler import compile_schema
+from parsec.validators.json_validator import JSONValidator
+
+
+SCHEMAS = [
+    {"type": "string", "minLength": 2, "maxLength": 4, "pattern": "^a"},
+    {"type": ["integer", "null"], "minimum": 0, "exclusiveMaximum": 10},
+    {"type": "number", "exclusiveMinimum": -1.5, "maximum": 2},
+    {"enum": ["red", "green", 1, True, None]},
+    {"const": False},
+    {"minimum": 3, "minLength": 1, "required": ["a"]},
+    {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string"},
+            "tags": {"type": "array", "items": {"type": "string"}, "minItems": 1, "maxItems": 2},
+            "meta": {"type": "object", "additionalProperties": {"type": "integer"}}
+        },
+        "required": ["name"],
+        "additionalProperties": False
+    },
+    {"type": "array", "items": {"type": "object", "properties": {"x": {"enum": [1, 2]}}, "required": ["x"]}},
+    {"properties": {"a": {"description": "annotation only"}}, "maxProperties": 1},
+]
+
+SCALARS = [None, True, False, 0, 1, 2, -1, 3.0, 2.5, 9, 10, "", "a", "ab", "abc", "abcde", "b", "red", "blue"]
+
+
+def random_instance(rng, depth=0):
+    roll = rng.random()
+    if depth > 2 or roll < 0.5:
+        return rng.choice(SCALARS)
+    if roll < 0.75:
+        return [random_instance(rng, depth + 1) for _ in range(rng.randint(0, 3))]
+    keys = ["a", "name", "tags", "meta", "x", "other"]
+    return {k: random_instance(rng, depth + 1) for k in rng.sample(keys, rng.randint(0, 4))}
+
+
+class TestCompileSchema:
+
+    @pytest.mark.parametrize("schema", SCHEMAS)
+    def test_matches_jsonschema(self, schema):
+        check = compile_schema(schema)
+        reference = jsonschema.Draft7Validator(schema)
+        rng = random.Random(42)
+
+        assert check is not None
+        for _ in range(2000):
+            instance = random_instance(rng)
+            assert check(instance) == reference.is_valid(instance), instance
+
+    @pytest.mark.parametrize("schema", [
+        {"$ref": "#/definitions/x"},
+        {"oneOf": [{"type": "string"}]},
+        {"items": [{"type": "string"}]},
+        {"enum": [{"a": 1}]},
+        {"type": "date"},
+    ])
+    def test_unsupported_schemas(self, schema):
+        assert compile_schema(schema) is None
+
+    @pytest.mark.parametrize("keyword", ["items", "properties"])
+    def test_deeply_nested_schema_not_compiled(self, keyword):
+        schema = {"type": "string"}
+        for _ in range(30 if keyword == "items" else 150):
+            schema = {"type": "array", "items": schema} if keyword == "items" else {
+                "type": "object", "properties": {"a": schema}
+            }
+        assert compile_schema(schema) is None
+
+    def test_deeply_nested_schema_validates(self):
+        schema, instance = {"type": "string"}, "x"
+        for _ in range(30):
+            schema, instance = {"type": "array", "items": schema}, [instance]
+
+        assert JSONValidator().validate(json.dumps(instance), schema).status.value == "valid"
+        assert JSONValidator().validate(json.dumps([[1]]), schema).status.value != "valid"
+
+    def test_never_accepts_invalid(self):
+        # 1.0 == 1 for jsonschema; the compiled check may reject it but never the reverse
+        check = compile_schema({"enum": [1]})
+        assert check(1) is True
+        assert check(True) is False
+
+
+class TestJSONValidatorFastPath:
+
+    @pytest.mark.parametrize("output", [
+        '{"name": "Al", "tags": ["x"]}',
+        '{"name": 3, "tags": [], "extra": 1}',
+        '{"tags": ["x", "y", "z"], "meta": {"k": "v"}}',
+    ])
+    def test_same_results_as_jsonschema(self, output):
+        schema = SCHEMAS[6]
+        fast = JSONValidator().validate(output, schema)
+        slow = JSONValidator(fast_path=False).validate(output, schema)
+
+        assert fast.status == slow.status
+        assert fast.errors == slow.errors
+        assert fast.parsed_output == slow.parsed_output
+
+    def test_fast_check_rejection_falls_back(self):
+        result = JSONValidator().validate("1.0", {"enum": [1]})
+        assert result.status.value == "valid"
@@ -0,0 +1,166 @@
+"""Tests for StreamingSchemaValidator."""
+
+import json
+import pytest
+
+from parsec.core import ValidationStatus
+from parsec.validators.streaming_validator import StreamingSchemaValidator
+
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "age": {"type": "integer"},
+        "role": {"enum": ["admin", "user"]},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "address": {
+            "type": "object",
+            "properties": {"city": {"type": "string"}},
+            "required": ["city"],
+            "additionalProperties": False
+        }
+    },
+    "required": ["name"],
+    "additionalProperties": False
+}
+
+
+def feed_chars(checker, text):
+    """Feed one character at a time, returning the offset of the first error."""
+    for i, ch in enumerate(text):
+        checker.feed(ch)
+        if checker.is_unrepairable:
+            return i
+    return None
+
+
+class TestStreamingSchemaValidator:
+
+    def test_valid_document_stays_valid(self):
+        checker = StreamingSchemaValidator(SCHEMA)
+        doc = {"name": "Ann", "age": 3, "role": "user", "tags": ["a"], "address": {"city": "Oslo"}}
+
+        assert feed_chars(checker, json.dumps(doc)) is None
+        assert checker.status == ValidationStatus.VALID
+        assert checker.is_complete
+        assert checker.value == doc
+
+    def test_wrong_container_type_detected_at_open(self):
+        checker = StreamingSchemaValidator(SCHEMA)
+        text = '{"name": "Ann", "tags": {"a": 1, "b": 2}}'
+
+        offset = feed_chars(checker, text)
+
+        assert text[offset] == "{" and offset == text.index('{"a"')
+        assert checker.status == ValidationStatus.UNREPAIRABLE
+        assert checker.errors[0].path == "tags"
+        assert checker.errors[0].actual == "object"
+
+    def test_wrong_scalar_type(self):
+        checker = StreamingSchemaValidator(SCHEMA)
+        checker.feed('{"name": 42, "age": 1')
+
+        assert checker.is_unrepairable
+        assert checker.errors[0].path == "name"
+        assert checker.errors[0].expected == "string"
+
+    def test_integer_accepts_integral_float(self):
+        checker = StreamingSchemaValidator(SCHEMA)
+        checker.feed('{"name": "a", "age": 3.0}')
+
+        assert not checker.is_unrepairable
+
+    def test_unknown_property_detected_at_key(self):
+        checker = StreamingSchemaValidator(SCHEMA)
+        text = '{"name": "Ann", "nickname": "a very long value that is never needed"}'
+
+        offset = feed_chars(checker, text)
+
+        assert offset == text.index("nickname") + len("nickname")
+        assert "nickname" in checker.errors[0].message
+
+    def test_enum_violation(self):
+        checker = StreamingSchemaValidator(SCHEMA)
+        checker.feed('{"name": "a", "role": "root"')
+
+        assert checker.is_unrepairable
+        assert checker.errors[0].path == "role"
+
+    def test_enum_distinguishes_booleans_from_numbers(self):
+        schema = {"type": "array", "items": {"enum": [1]}}
+        checker = StreamingSchemaValidator(schema)
+        checker.feed("[1.0, 1,")
+        assert not checker.is_unrepairable
+
+        checker.feed("true,")
+        assert checker.is_unrepairable
+
+    def test_missing_required_on_close(self):
+        checker = StreamingSchemaValidator(SCHEMA)
+        checker.feed('{"address": {"city": "Oslo"}')
+        assert not checker.is_unrepairable
+
+        checker.feed("}")
+        assert checker.is_unrepairable
+        assert checker.errors[0].message == "'name' is a required property"
+
+    def test_nested_array_items(self):
+        checker = StreamingSchemaValidator(SCHEMA)
+        checker.feed('{"name": "a", "tags": ["x", 2,')
+
+        assert checker.errors[0].path == "tags[1]"
+
+    def test_ref_resolution(self):
+        schema = {
+            "definitions": {"point": {"type": "object", "properties": {"x": {"type": "number"}}}},
+            "type": "array",
+            "items": {"$ref": "#/definitions/point"}
+        }
+        checker = StreamingSchemaValidator(schema)
+        checker.feed('[{"x": 1}, {"x": "no"}')
+
+        assert checker.errors[0].path == "[1].x"
+
+    def test_unknown_keywords_are_not_guessed(self):
+        schema = {
+            "type": "object",
+            "patternProperties": {"^x-": {"type": "integer"}},
+            "additionalProperties": False,
+            "properties": {"v": {"anyOf": [{"type": "string"}, {"type": "integer"}]}}
+        }
+        checker = StreamingSchemaValidator(schema)
+        checker.feed('{"x-a": "s", "v": [1]}')
+
+        assert not checker.is_unrepairable
+
+    def test_syntax_error_is_invalid_not_unrepairable(self):
+        checker = StreamingSchemaValidator(SCHEMA)
+        checker.feed('{"name": "a",}')
+
+        assert checker.status == ValidationStatus.INVALID
+        result = checker.result('{"name": "a",}')
+        assert result.is_partial
+        assert result.errors
+
+    def test_result(self):
+        checker = StreamingSchemaValidator(SCHEMA)
+        checker.feed('{"name": "An')
+
+        result = checker.result('{"name": "An')
+
+        assert result.status == ValidationStatus.VALID
+        assert result.is_partial
+        assert result.parsed_output == {}
+        assert result.accumulated_text == '{"name": "An'
+
+    def test_accepts_pydantic_model(self):
+        from pydantic import BaseModel
+
+        class Person(BaseModel):
+            name: str
+
+        checker = StreamingSchemaValidator(Person)
+        checker.feed('{"name": 1,')
+
+        assert checker.is_unrepairable